@@ -0,0 +1,14 @@
+"""Benchmarks of the conversion of qmllint reports.
+
+The benchmarks are not part of the test suite, they are run manually:
+
+```shell
+python3 -m benchmarks --sizes 1000 100000 1000000 --output benchmarks.json
+python3 -m benchmarks.diagnostic_memory
+python3 -m benchmarks.generator --warnings 1000000 --files 20000 qmllint.json
+```
+
+- ``benchmarks``: measures the duration, throughput and peak of memory of each step of the conversion.
+- ``benchmarks.diagnostic_memory``: measures the memory held by many ``Diagnostic`` objects.
+- ``benchmarks.generator``: generates a synthetic qmllint report.
+"""
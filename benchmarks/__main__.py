@@ -0,0 +1,193 @@
+"""Run the benchmark suite of the conversion.
+
+For each size, a synthetic report is generated, then the following steps are measured:
+
+- ``from_message``: classification of the messages, with ``Rules.from_message``,
+- ``diagnostic``: construction of the ``Diagnostic`` objects,
+- ``convert_json``: conversion of a loaded report, with ``_convert_json``,
+- ``convert_file``: conversion of a report file into a Code Quality file, with ``convert_file``,
+- ``convert_file[mmap]``: the same conversion, with the report memory-mapped,
+- ``loads[codec]``, ``dumps[codec]`` and ``convert_file[codec]``: decoding of the whole report, encoding of the
+  converted issues, and conversion of the report file, with each JSON codec installed.
+
+The results are written in JSON: the duration, the throughput in warnings per second, and the peak of memory
+allocated by Python (measured in a second run, as tracing the allocations slows down the code).
+
+:Example:
+
+    ```shell
+    python3 -m benchmarks --sizes 1000 100000 1000000 --output benchmarks.json
+    ```
+"""
+
+import argparse
+import functools
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable
+
+import qmllint_codequality
+from benchmarks import generator
+from qmllint_codequality import Diagnostic, jsoncodec, qmllint
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+"""Default numbers of warnings of the generated reports."""
+
+WARNINGS_PER_FILE = 50
+"""Average number of warnings in each file of the generated reports."""
+
+
+def _installed_codecs() -> list[jsoncodec.Codec]:
+    """Get the JSON codecs whose package is installed.
+
+    :return: The codecs.
+    :rtype: list[jsoncodec.Codec]
+    """
+    codecs = []
+
+    for name in jsoncodec.CODECS:
+        try:
+            codecs.append(jsoncodec.create_codec(name))
+        except ImportError:
+            sys.stderr.write(f"Skipping the JSON codec '{name}', not installed\n")
+
+    return codecs
+
+
+def _measure(function: Callable[[], object], memory: bool) -> dict[str, float]:
+    """Measure the duration of a function, and optionally its peak of memory.
+
+    :param function: The function to measure.
+    :type function: Callable[[], object]
+    :param memory: If True, the function is run a second time, to measure its peak of memory.
+    :type memory: bool
+    :return: The measures.
+    :rtype: dict[str, float]
+    """
+    gc.collect()
+    start_time, start_cpu = time.perf_counter(), time.process_time()
+    function()
+    measures = {"seconds": time.perf_counter() - start_time, "cpu_seconds": time.process_time() - start_cpu}
+
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        function()
+        measures["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return measures
+
+
+def run(sizes: list[int], memory: bool = True) -> list[dict[str, object]]:
+    """Run the benchmarks on reports of the given sizes.
+
+    :param sizes: The numbers of warnings of the reports.
+    :type sizes: list[int]
+    :param memory: If True, measure the peak of memory of each benchmark, defaults to True
+    :type memory: bool, optional
+    :return: The results, one per benchmark and per size.
+    :rtype: list[dict[str, object]]
+    """
+    results: list[dict[str, object]] = []
+
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            report_path = os.path.join(directory, f"qmllint-{size}.json")
+            output_path = os.path.join(directory, f"codequality-{size}.json")
+
+            with open(report_path, "w", encoding="utf8") as report_file:
+                generator.write_report(report_file, size, max(1, size // WARNINGS_PER_FILE))
+
+            with open(report_path, "rb") as report_file:
+                report: qmllint.Report = json.load(report_file)
+
+            with open(report_path, "rb") as report_file:
+                report_bytes = report_file.read()
+
+            warnings = [(file["filename"], warning) for file in report["files"] for warning in file["warnings"]]
+            issues = qmllint_codequality._convert_json(report)[0]  # pylint: disable=protected-access
+
+            def from_message() -> None:
+                for _, warning in warnings:
+                    qmllint.Rules.from_message(warning["message"])
+
+            def diagnostic() -> None:
+                for filename, warning in warnings:
+                    Diagnostic(filename, warning["type"], warning["message"], warning["line"], warning["column"])
+
+            benchmarks: dict[str, Callable[[], object]] = {
+                "from_message": from_message,
+                "diagnostic": diagnostic,
+                "convert_json": lambda: qmllint_codequality._convert_json(report),  # pylint: disable=protected-access
+                "convert_file": lambda: qmllint_codequality.convert_file(report_path, output_path),
+                "convert_file[mmap]": lambda: qmllint_codequality.convert_file(
+                    report_path, output_path, memory_map=True
+                ),
+            }
+
+            for codec in _installed_codecs():
+                benchmarks[f"loads[{codec.name}]"] = functools.partial(codec.loads, report_bytes)
+                benchmarks[f"dumps[{codec.name}]"] = functools.partial(codec.dumps, issues)
+                benchmarks[f"convert_file[{codec.name}]"] = functools.partial(
+                    qmllint_codequality.convert_file, report_path, output_path, codec=codec
+                )
+
+            for name, function in benchmarks.items():
+                qmllint_codequality.CLASSIFICATION_CACHE.clear()
+                measures = _measure(function, memory)
+                results.append(
+                    {
+                        "benchmark": name,
+                        "warnings": size,
+                        "report_bytes": os.path.getsize(report_path),
+                        "warnings_per_second": size / measures["seconds"] if measures["seconds"] else None,
+                        **measures,
+                    }
+                )
+                sys.stderr.write(f"{name:>20} {size:>9} warnings: {measures['seconds']:.3f} s\n")
+
+            del report, report_bytes, warnings, issues
+
+    return results
+
+
+def main() -> int:
+    """Run the benchmark suite with the options given on the command line.
+
+    :return: 0
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="numbers of warnings (default: %(default)s)"
+    )
+    parser.add_argument("--no-memory", action="store_true", help="do not measure the peak of memory")
+    parser.add_argument("--output", help="JSON file receiving the results (default: standard output)")
+    args = parser.parse_args()
+
+    results = {
+        "version": qmllint_codequality.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": run(args.sizes, not args.no_memory),
+    }
+
+    if args.output:
+        with open(args.output, "w", encoding="utf8") as output:
+            json.dump(results, output, indent=4)
+    else:
+        json.dump(results, sys.stdout, indent=4)
+        sys.stdout.write("\n")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""Measure the memory used to hold many ``Diagnostic`` objects.
+
+The warnings are decoded from JSON before being converted, so each file name and message is a fresh string, as when
+reading a real report. The result is printed in JSON on the standard output.
+"""
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+
+from qmllint_codequality import Diagnostic
+
+MESSAGES = [
+    "Unqualified access",
+    'Property "width" not found on type "Item"',
+    "Unused import at Main.qml:3:1",
+    "Cannot assign to read-only property height",
+]
+"""Messages repeated in the benchmark."""
+
+
+def measure(count: int, nb_files: int) -> dict[str, float]:
+    """Build ``count`` diagnostics, spread over ``nb_files`` files, and measure the memory they use.
+
+    :param count: Number of diagnostics to build.
+    :type count: int
+    :param nb_files: Number of distinct files.
+    :type nb_files: int
+    :return: The measures.
+    :rtype: dict[str, float]
+    """
+    encoded = [
+        json.dumps([f"/src/qml/module{index % 20}/File{index % nb_files}.qml", MESSAGES[index % len(MESSAGES)]])
+        for index in range(count)
+    ]
+
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    diagnostics = []
+
+    for index, warning in enumerate(encoded):
+        filename, message = json.loads(warning)
+        diagnostics.append(Diagnostic(filename, "warning", message, index % 400 + 1, index % 80 + 1, 5))
+
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "diagnostics": count,
+        "files": nb_files,
+        "bytes_per_diagnostic": current / count,
+        "peak_bytes": peak,
+        "seconds": elapsed,
+    }
+
+
+def main() -> int:
+    """Run the benchmark with the options given on the command line.
+
+    :return: 0
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=100_000, help="number of diagnostics (default: %(default)s)")
+    parser.add_argument("--files", type=int, default=500, help="number of distinct files (default: %(default)s)")
+    args = parser.parse_args()
+
+    json.dump(measure(args.count, args.files), sys.stdout, indent=4)
+    sys.stdout.write("\n")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+"""Generate synthetic qmllint reports.
+
+The messages are built from the patterns of the ``Rules``, so the reports exercise the classification as a real report
+would. The reports are written incrementally, so reports with millions of warnings can be generated without holding
+them in memory.
+
+:Example:
+
+    ```shell
+    python3 -m benchmarks.generator --warnings 1000000 --files 20000 qmllint.json
+    ```
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+from typing import TextIO
+
+from qmllint_codequality import qmllint
+
+_REGEX_ESCAPED = re.compile(r"\\(.)")
+"""Regex matching an escaped character in a pattern."""
+
+WORDS = ["root", "width", "QtQuick.Controls", "Button", "model", "onClicked", "Item", "parent"]
+"""Words substituted to the wildcards of the patterns."""
+
+UNKNOWN_MESSAGES = ["Something qmllint reports, but this tool does not know", "Unexpected token `}`"]
+"""Messages that do not match any rule."""
+
+
+def message_templates() -> list[str]:
+    """Build a message from each pattern of the rules, with ``{}`` in place of the wildcards.
+
+    :return: The message templates.
+    :rtype: list[str]
+    """
+    templates = []
+
+    for rule in qmllint.Rules:
+        for pattern in rule.patterns or ():
+            template = pattern.pattern.replace("{", "{{").replace("}", "}}").replace(".*", "{}")
+            templates.append(_REGEX_ESCAPED.sub(r"\1", template))
+
+    return templates
+
+
+def generate_messages(count: int, seed: int = 0, unknown_ratio: float = 0.05) -> list[str]:
+    """Generate messages, matching the rules or not.
+
+    :param count: The number of messages.
+    :type count: int
+    :param seed: The seed of the random generator, defaults to 0
+    :type seed: int, optional
+    :param unknown_ratio: Proportion of messages that do not match any rule, defaults to 0.05
+    :type unknown_ratio: float, optional
+    :return: The messages.
+    :rtype: list[str]
+    """
+    generator = random.Random(seed)
+    templates = message_templates()
+    messages = []
+
+    for _ in range(count):
+        if generator.random() < unknown_ratio:
+            messages.append(generator.choice(UNKNOWN_MESSAGES))
+        else:
+            template = generator.choice(templates)
+            messages.append(template.format(*(generator.choice(WORDS) for _ in range(template.count("{}")))))
+
+    return messages
+
+
+def write_report(stream: TextIO, nb_warnings: int, nb_files: int, seed: int = 0, distinct_messages: int = 500) -> None:
+    """Write a synthetic qmllint report.
+
+    The warnings are spread evenly over the files. As in real reports, a limited set of messages is repeated.
+
+    :param stream: The text stream receiving the report.
+    :type stream: TextIO
+    :param nb_warnings: The number of warnings.
+    :type nb_warnings: int
+    :param nb_files: The number of files.
+    :type nb_files: int
+    :param seed: The seed of the random generator, defaults to 0
+    :type seed: int, optional
+    :param distinct_messages: The number of distinct messages, defaults to 500
+    :type distinct_messages: int, optional
+    """
+    generator = random.Random(seed)
+    messages = generate_messages(distinct_messages, seed)
+    levels = [level.value for level in qmllint.WarningType]
+
+    stream.write('{"files": [')
+
+    for file_index in range(nb_files):
+        nb_file_warnings = nb_warnings // nb_files + (1 if file_index < nb_warnings % nb_files else 0)
+        filename = f"/builds/project/qml/module{file_index % 50}/Component{file_index}.qml"
+
+        stream.write(", " if file_index else "")
+        stream.write(f'{{"filename": {json.dumps(filename)}, "success": {json.dumps(nb_file_warnings == 0)}, ')
+        stream.write('"warnings": [')
+
+        for warning_index in range(nb_file_warnings):
+            line = warning_index + 1
+            warning = {
+                "charOffset": line * 40,
+                "column": generator.randint(1, 80),
+                "length": generator.randint(1, 20),
+                "line": line,
+                "message": generator.choice(messages),
+                "suggestions": [],
+                "type": generator.choices(levels, weights=[80, 15, 1, 4])[0],
+            }
+            stream.write(", " if warning_index else "")
+            stream.write(json.dumps(warning))
+
+        stream.write("]}")
+
+    stream.write("]}")
+
+
+def main() -> int:
+    """Generate a report with the options given on the command line.
+
+    :return: 0
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("output", help="path of the report to generate, '-' for the standard output")
+    parser.add_argument("--warnings", type=int, default=10_000, help="number of warnings (default: %(default)s)")
+    parser.add_argument("--files", type=int, default=100, help="number of files (default: %(default)s)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the random generator (default: %(default)s)")
+    args = parser.parse_args()
+
+    if args.output == "-":
+        write_report(sys.stdout, args.warnings, args.files, args.seed)
+    else:
+        with open(args.output, "w", encoding="utf8") as output:
+            write_report(output, args.warnings, args.files, args.seed)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
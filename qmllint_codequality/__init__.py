@@ -24,12 +24,33 @@ This tool converts the JSON report generated by qmllint into a JSON file, as def
 __version__ = "0.1.0"
 __project__ = "qmllint-codequality"
 
-import hashlib
-import json
+import collections
+import contextlib
+import functools
+import io
+import itertools
 import logging
+import operator
 import os
-
-from qmllint_codequality import codequality, qmllint
+import sys
+from typing import IO, TYPE_CHECKING, Callable, Iterable, Iterator, Sequence, TypeVar
+
+from qmllint_codequality import (
+    codequality,
+    compression,
+    fingerprint,
+    jsoncodec,
+    lru,
+    qmllint,
+    runner,
+    stream,
+)
+
+if TYPE_CHECKING:
+    import argparse
+    from concurrent.futures import Executor, Future
+
+    from qmllint_codequality import baseline, dedup, formats, history, lintcache, stats
 
 VERSION_MESSAGE = f"""
 (☞ ͡° ͜ʖ ͡°)☞ {__project__} {__version__} 🦊
@@ -38,9 +59,46 @@ VERSION_MESSAGE = f"""
 
 logger = logging.getLogger(__name__)
 
+InputT = TypeVar("InputT")
+OutputT = TypeVar("OutputT")
+
+STANDARD_STREAM = "-"
+"""The file name standing for the standard input, as input file, or for the standard output, as output file."""
+
+DEFAULT_CHUNK_SIZE = 2048
+"""Minimal number of warnings converted at once by a process, when the conversion is parallelized."""
+
+DEFAULT_CLASSIFICATION_CACHE_SIZE = 4096
+"""Default number of messages whose classification is kept in ``CLASSIFICATION_CACHE``."""
+
+CLASSIFICATION_CACHE: lru.LRUCache[str, tuple[qmllint.Rules, codequality.Category]] = lru.LRUCache(
+    DEFAULT_CLASSIFICATION_CACHE_SIZE
+)
+"""Cache of the rule and the category of the last classified messages.
+
+The reports repeat the same messages many times, so most of the classifications are found in this cache.
+Use ``CLASSIFICATION_CACHE.resize`` to change its size, and ``CLASSIFICATION_CACHE.info`` to get its hits and misses.
+"""
+
 
 class Diagnostic:
-    """Diagnostic class converting qmllint diagnostic to CodeQuality report."""
+    """Diagnostic class converting qmllint diagnostic to CodeQuality report.
+
+    The diagnostics are stored without instance dictionary, and their file name and message are interned, so the many
+    diagnostics sharing the same file or the same message share the same string.
+    """
+
+    __slots__ = (
+        "__filename",
+        "__level",
+        "__line",
+        "__message",
+        "__column",
+        "__length",
+        "__name",
+        "__category",
+        "__fingerprint",
+    )
 
     QMLLINT_LEVEL_TO_CODE_QUALITY_SEVERITY = {
         qmllint.WarningType.INFO: codequality.Severity.INFO,
@@ -71,6 +129,32 @@ class Diagnostic:
 
         return category
 
+    @staticmethod
+    def classify(message: str) -> tuple[qmllint.Rules, codequality.Category]:
+        """Determine the rule and the Code Quality category of a diagnostic from its message.
+
+        The result is kept in ``CLASSIFICATION_CACHE``.
+
+        :param message: The diagnostic's message.
+        :type message: str
+        :return: The rule, and the category of the diagnostic.
+        :rtype: tuple[qmllint.Rules, codequality.Category]
+        """
+        return CLASSIFICATION_CACHE.get(message, Diagnostic._classify)
+
+    @staticmethod
+    def _classify(message: str) -> tuple[qmllint.Rules, codequality.Category]:
+        """Determine the rule and the Code Quality category of a diagnostic from its message, without cache.
+
+        :param message: The diagnostic's message.
+        :type message: str
+        :return: The rule, and the category of the diagnostic.
+        :rtype: tuple[qmllint.Rules, codequality.Category]
+        """
+        name = qmllint.Rules.from_message(message)
+
+        return name, Diagnostic.rule_to_category(name)
+
     def __init__(
         self,
         filename: str,
@@ -79,6 +163,7 @@ class Diagnostic:
         line: int | None = None,
         column: int | None = None,
         length: int | None = None,
+        fingerprint_engine: fingerprint.FingerprintEngine | None = None,
     ) -> None:
         """Initialize a new Diagnostic object.
 
@@ -94,9 +179,12 @@ class Diagnostic:
         :type column: int | None, optional
         :param length: The length of the offending code sequence, defaults to None
         :type length: int | None, optional
+        :param fingerprint_engine: The engine computing the fingerprint, None for ``fingerprint.DEFAULT_ENGINE``,
+            defaults to None
+        :type fingerprint_engine: fingerprint.FingerprintEngine | None, optional
         """
 
-        self.__filename = filename
+        self.__filename = sys.intern(filename)
         """File name of the file containing the warning."""
 
         self.__level: codequality.Severity
@@ -111,7 +199,7 @@ class Diagnostic:
         self.__line = line
         """Line in the file where is located the warning."""
 
-        self.__message = message
+        self.__message = sys.intern(message)
         """Description of the warning."""
 
         self.__column = column
@@ -120,18 +208,100 @@ class Diagnostic:
         self.__length = length
         """Number of column where the warning."""
 
-        # Compose the name from the current information
-        self.__name = qmllint.Rules.from_message(self.__message)
+        self.__name: qmllint.Rules
         """Diagnostic name used for the check name field of the Code Quality JSON."""
 
-        # Compute the category from the name
-        self.__category = Diagnostic.rule_to_category(self.__name)
+        self.__category: codequality.Category
         """Code Quality category of the diagnostic."""
 
+        # Compose the name from the current information, and compute the category from the name
+        self.__name, self.__category = Diagnostic.classify(self.__message)
+
         # Compute the fingerprint of the diagnostic
-        self.__fingerprint = hashlib.md5(str(self).encode("utf8"), usedforsecurity=False).hexdigest()
+        self.__fingerprint = (fingerprint_engine or fingerprint.DEFAULT_ENGINE).fingerprint(self)
         """Unique fingerprint of the diagnostic."""
 
+    @property
+    def filename(self) -> str:
+        """File name of the file containing the warning.
+
+        :return: The file name.
+        :rtype: str
+        """
+        return self.__filename
+
+    @property
+    def level(self) -> codequality.Severity:
+        """Severity level of the warning.
+
+        :return: The severity level.
+        :rtype: codequality.Severity
+        """
+        return self.__level
+
+    @property
+    def message(self) -> str:
+        """Description of the warning.
+
+        :return: The message.
+        :rtype: str
+        """
+        return self.__message
+
+    @property
+    def line(self) -> int | None:
+        """Line in the file where is located the warning.
+
+        :return: The line number, None if unknown.
+        :rtype: int | None
+        """
+        return self.__line
+
+    @property
+    def column(self) -> int | None:
+        """Column in the file where is located the warning.
+
+        :return: The column number, None if unknown.
+        :rtype: int | None
+        """
+        return self.__column
+
+    @property
+    def length(self) -> int | None:
+        """Number of column where the warning.
+
+        :return: The length, None if unknown.
+        :rtype: int | None
+        """
+        return self.__length
+
+    @property
+    def name(self) -> qmllint.Rules:
+        """Diagnostic name used for the check name field of the Code Quality JSON.
+
+        :return: The rule of the diagnostic.
+        :rtype: qmllint.Rules
+        """
+        return self.__name
+
+    @property
+    def category(self) -> codequality.Category:
+        """Code Quality category of the diagnostic.
+
+        :return: The category.
+        :rtype: codequality.Category
+        """
+        return self.__category
+
+    @property
+    def fingerprint(self) -> str:
+        """Unique fingerprint of the diagnostic.
+
+        :return: The fingerprint, as an hexadecimal string.
+        :rtype: str
+        """
+        return self.__fingerprint
+
     def __repr__(self) -> str:
         """Return a string representation of the diagnostic.
 
@@ -195,78 +365,950 @@ class Diagnostic:
         return code_quality
 
 
-def _convert_json(json_input: qmllint.Report) -> tuple[list[codequality.Report], int]:
-    """Convert the JSON input into a Code Quality JSON report.
+def add_verbosity_argument(parser: "argparse.ArgumentParser") -> None:
+    """Add the ``-v/--verbosity`` option, shared by the command line applications, to a parser.
+
+    :param parser: The parser of the command line options.
+    :type parser: argparse.ArgumentParser
+    """
+    parser.add_argument(
+        "-v",
+        "--verbosity",
+        choices=[
+            logging.getLevelName(logging.WARNING),
+            logging.getLevelName(logging.INFO),
+            logging.getLevelName(logging.DEBUG),
+        ],
+        help="indicates the level of verbosity",
+        type=str,
+        default=logging.getLevelName(logging.INFO),
+    )
+
+
+def _iter_json_warnings(json_input: qmllint.Report) -> Iterator[tuple[str, qmllint.WarningDetails]]:
+    """Iterate over the warnings of an already loaded qmllint JSON report.
 
     :param json_input: qmllint JSON report.
     :type json_input: dict
-    :return: A list of dictionary, and the number of violation.
-    :rtype: tuple[list[dict], int]
+    :yield: The name of the file containing the warning, and the warning itself.
+    :rtype: Iterator[tuple[str, qmllint.WarningDetails]]
     """
-    conversion: list[codequality.Report] = []
-
     # Ensure this JSON report has errors to convert
     if len(json_input) < 1:
         logger.info("Empty JSON imported. Skipping ...")
-        return conversion, 0
+        return
+
+    yield from _iter_file_warnings(json_input["files"])
 
-    for json_file_diagnostic in json_input["files"]:
-        filename: str = json_file_diagnostic["filename"]
 
-        if len(json_file_diagnostic["warnings"]) < 1:
+def _iter_file_warnings(
+    diagnostics: Iterable[tuple[str, qmllint.WarningDetails] | qmllint.FileDiagnostic],
+) -> Iterator[tuple[str, qmllint.WarningDetails]]:
+    """Iterate over the warnings of file diagnostics, and of warnings already given with the name of their file.
+
+    :param diagnostics: The file diagnostics, and the warnings with the name of the file containing them, mixed.
+    :type diagnostics: Iterable[tuple[str, qmllint.WarningDetails] | qmllint.FileDiagnostic]
+    :yield: The name of the file containing the warning, and the warning itself.
+    :rtype: Iterator[tuple[str, qmllint.WarningDetails]]
+    """
+    for diagnostic in diagnostics:
+        if isinstance(diagnostic, tuple):
+            yield diagnostic
+            continue
+
+        filename: str = diagnostic["filename"]
+
+        if len(diagnostic["warnings"]) < 1:
             logger.debug("No warning detected in file %s", filename)
             continue
 
-        logger.debug("Processing the warnings of the file %s", filename)
+        for json_warning_diagnostic in diagnostic["warnings"]:
+            yield filename, json_warning_diagnostic
+
+
+def _iter_code_quality(
+    qmllint_warnings: Iterable[tuple[str, qmllint.WarningDetails]],
+    fingerprint_engine: fingerprint.FingerprintEngine | None = None,
+    statistics: "stats.Statistics | None" = None,
+) -> Iterator[codequality.Report]:
+    """Convert the qmllint warnings into Code Quality issues, one at a time.
+
+    :param qmllint_warnings: The warnings to convert, with the name of the file containing them.
+    :type qmllint_warnings: Iterable[tuple[str, qmllint.WarningDetails]]
+    :param fingerprint_engine: The engine computing the fingerprints, None for the default one, defaults to None
+    :type fingerprint_engine: fingerprint.FingerprintEngine | None, optional
+    :param statistics: The statistics receiving the time spent in each stage, None to not measure it,
+        defaults to None
+    :type statistics: stats.Statistics | None, optional
+    :yield: The Code Quality issue of each warning.
+    :rtype: Iterator[codequality.Report]
+    """
+    previous_filename: str | None = None
 
-        for json_warning_diagnostic in json_file_diagnostic["warnings"]:
-            diagnostic: Diagnostic = Diagnostic(
-                filename,
-                json_warning_diagnostic["type"],
-                json_warning_diagnostic["message"],
-                json_warning_diagnostic.get("line"),
-                json_warning_diagnostic.get("column"),
-                json_warning_diagnostic.get("length"),
-            )
+    if statistics is not None:
+        qmllint_warnings = statistics.timed("parsing", qmllint_warnings)
+        fingerprint_engine = statistics.timed_engine(fingerprint_engine)
+
+    for filename, json_warning_diagnostic in qmllint_warnings:
+        if filename != previous_filename:
+            logger.debug("Processing the warnings of the file %s", filename)
+            previous_filename = filename
 
-            logger.debug("Processed %s", diagnostic)
-            conversion.append(diagnostic.to_code_quality())
+        arguments = (
+            filename,
+            json_warning_diagnostic["type"],
+            json_warning_diagnostic["message"],
+            json_warning_diagnostic.get("line"),
+            json_warning_diagnostic.get("column"),
+            json_warning_diagnostic.get("length"),
+            fingerprint_engine,
+        )
+
+        if statistics is None:
+            diagnostic = Diagnostic(*arguments)
+        else:
+            diagnostic = statistics.call("diagnostic", Diagnostic, *arguments)
+
+        logger.debug("Processed %s", diagnostic)
+        yield diagnostic.to_code_quality()
+
+
+def _convert_json(json_input: qmllint.Report) -> tuple[list[codequality.Report], int]:
+    """Convert the JSON input into a Code Quality JSON report.
+
+    :param json_input: qmllint JSON report.
+    :type json_input: dict
+    :return: A list of dictionary, and the number of violation.
+    :rtype: tuple[list[dict], int]
+    """
+    conversion = list(_iter_code_quality(_iter_json_warnings(json_input)))
 
     return conversion, len(conversion)
 
 
-def convert_file(input_file_path: os.PathLike, output_file_path: os.PathLike) -> int:
+def iter_issues(
+    diagnostics: Iterable[tuple[str, qmllint.WarningDetails] | qmllint.FileDiagnostic],
+    fingerprint_engine: fingerprint.FingerprintEngine | None = None,
+    duplicate_filter: "dedup.DuplicateFilter | None" = None,
+) -> Iterator[codequality.Report]:
+    """Convert qmllint warnings already in memory into Code Quality issues, lazily, one at a time.
+
+    Nothing is read nor written: each warning is converted when the next issue is requested, so the issues can be
+    chained into other streaming pipelines. The fingerprint engine is reset when the first issue is requested.
+
+    :param diagnostics: The file diagnostics of a qmllint report, or the warnings with the name of the file containing
+        them, possibly mixed.
+    :type diagnostics: Iterable[tuple[str, qmllint.WarningDetails] | qmllint.FileDiagnostic]
+    :param fingerprint_engine: The engine computing the fingerprints, None for the default one, defaults to None
+    :type fingerprint_engine: fingerprint.FingerprintEngine | None, optional
+    :param duplicate_filter: The filter removing the issues whose fingerprint has already been seen, None to keep
+        all the issues, defaults to None
+    :type duplicate_filter: dedup.DuplicateFilter | None, optional
+    :return: An iterator over the Code Quality issue of each warning, in the order of the warnings.
+    :rtype: Iterator[codequality.Report]
+    """
+    if fingerprint_engine is not None:
+        fingerprint_engine.reset()
+
+    issues = _iter_code_quality(_iter_file_warnings(diagnostics), fingerprint_engine)
+
+    if duplicate_filter is not None:
+        issues = duplicate_filter(issues)
+
+    yield from issues
+
+
+@contextlib.contextmanager
+def _open_input(input_file_path: str | os.PathLike) -> Iterator[IO[bytes]]:
+    """Open an input file in binary mode, or get the standard input, decompressing it if it is compressed.
+
+    The file is closed when the context exits, the standard input is kept open.
+
+    :param input_file_path: The path of the input file, ``STANDARD_STREAM`` for the standard input.
+    :type input_file_path: str | os.PathLike
+    :return: An iterator producing the opened file, once.
+    :rtype: Iterator[IO[bytes]]
+    """
+    with contextlib.ExitStack() as stack:
+        if os.fspath(input_file_path) == STANDARD_STREAM:
+            in_f = sys.stdin.buffer
+        else:
+            in_f = stack.enter_context(open(input_file_path, "rb"))
+
+        if (decompressed := compression.open_input(in_f)) is not in_f:
+            stack.enter_context(decompressed)
+
+        yield decompressed
+
+
+@contextlib.contextmanager
+def _open_output(output_file_path: str | os.PathLike, compression_level: int | None = None) -> Iterator[IO[bytes]]:
+    """Open an output file in binary mode, creating its folder, or get the binary standard output.
+
+    The files whose extension is one of ``compression.EXTENSIONS`` are compressed as they are written. The file is
+    closed when the context exits, the standard output is only flushed.
+
+    :param output_file_path: The path of the output file, ``STANDARD_STREAM`` for the standard output.
+    :type output_file_path: str | os.PathLike
+    :param compression_level: The compression level of the compressed files, None for the default one,
+        defaults to None
+    :type compression_level: int | None, optional
+    :return: An iterator producing the opened file, once.
+    :rtype: Iterator[IO[bytes]]
+    """
+    logger.debug("Writing output file: '%s'", output_file_path)
+
+    with contextlib.ExitStack() as stack:
+        if os.fspath(output_file_path) == STANDARD_STREAM:
+            sys.stdout.flush()  # The text already written must come first
+            stack.callback(sys.stdout.buffer.flush)
+            yield sys.stdout.buffer
+            return
+
+        if directory := os.path.dirname(output_file_path):
+            os.makedirs(directory, exist_ok=True)  # Ensure that the destination folder exist
+
+        ou_f = stack.enter_context(open(output_file_path, "wb"))
+        compressed = compression.open_output(ou_f, compression.from_path(output_file_path), compression_level)
+
+        # The compressed stream is closed first, writing the end of the compressed data into the file
+        yield ou_f if compressed is ou_f else stack.enter_context(compressed)
+
+
+def _open_serializers(
+    stack: contextlib.ExitStack,
+    output_file_path: str | os.PathLike,
+    output_format: str | None,
+    extra_outputs: Iterable[tuple[str, str | os.PathLike]],
+    indent: int | None,
+    codec: jsoncodec.Codec,
+    compression_level: int | None = None,
+) -> "list[formats.Serializer]":
+    """Open the output files, and create the serializers writing the issues into them.
+
+    :param stack: The stack closing the files.
+    :type stack: contextlib.ExitStack
+    :param output_file_path: The path of the output file, ``STANDARD_STREAM`` for the standard output.
+    :type output_file_path: str | os.PathLike
+    :param output_format: The format of the output file, one of ``formats.SERIALIZERS``, None for
+        ``formats.DEFAULT_FORMAT``.
+    :type output_format: str | None
+    :param extra_outputs: The format, and the path, of the other output files.
+    :type extra_outputs: Iterable[tuple[str, str | os.PathLike]]
+    :param indent: The indentation level, None for the most compact representation.
+    :type indent: int | None
+    :param codec: The codec encoding the JSON values.
+    :type codec: jsoncodec.Codec
+    :param compression_level: The compression level of the compressed files, None for the default one,
+        defaults to None
+    :type compression_level: int | None, optional
+    :raises KeyError: A format does not exist.
+    :return: The serializers, the one of the output file first.
+    :rtype: list[formats.Serializer]
+    """
+    # pylint: disable-next=import-outside-toplevel  # Imports the JSON writer
+    from qmllint_codequality import formats
+
+    outputs = [(output_format or formats.DEFAULT_FORMAT, output_file_path), *extra_outputs]
+    serializer_types = [formats.SERIALIZERS[name] for name, _ in outputs]
+
+    return [
+        serializer_type(stack.enter_context(_open_output(path, compression_level)), indent, codec)
+        for serializer_type, (_, path) in zip(serializer_types, outputs)
+    ]
+
+
+def _serialize(issues: Iterable[codequality.Report], serializers: "Sequence[formats.Serializer]") -> int:
+    """Write each issue with all the serializers, as soon as it is produced.
+
+    :param issues: The issues to write.
+    :type issues: Iterable[codequality.Report]
+    :param serializers: The serializers.
+    :type serializers: Sequence[formats.Serializer]
+    :return: The number of issues written.
+    :rtype: int
+    """
+    if len(serializers) == 1:
+        write = serializers[0].write
+
+        for issue in issues:
+            write(issue)
+    else:
+        for issue in issues:
+            for serializer in serializers:
+                serializer.write(issue)
+
+    return [serializer.close() for serializer in serializers][0]
+
+
+def _write_issues(
+    issues: Iterable[codequality.Report],
+    serializers: "Sequence[formats.Serializer]",
+    statistics: "stats.Statistics | None",
+    duplicate_filter: "dedup.DuplicateFilter | None" = None,
+    baseline_index: "baseline.BaselineIndex | None" = None,
+    history_run: "history.HistoryRun | None" = None,
+) -> int:
+    """Write the Code Quality issues into the output files, as soon as they are produced, without duplicates.
+
+    :param issues: The issues to write.
+    :type issues: Iterable[codequality.Report]
+    :param serializers: The serializers writing the issues into the output files.
+    :type serializers: Sequence[formats.Serializer]
+    :param statistics: The statistics counting the issues, and measuring the time spent, None to not measure it.
+    :type statistics: stats.Statistics | None
+    :param duplicate_filter: The filter removing the issues whose fingerprint has already been seen, None for a new
+        filter keeping the fingerprints in memory, defaults to None
+    :type duplicate_filter: dedup.DuplicateFilter | None, optional
+    :param baseline_index: The index of the baseline, whose issues are not written, None to write all the issues,
+        defaults to None
+    :type baseline_index: baseline.BaselineIndex | None, optional
+    :param history_run: The run recording the issues in the history, before they are compared to the baseline,
+        None to not record them, defaults to None
+    :type history_run: history.HistoryRun | None, optional
+    :return: The number of issues written.
+    :rtype: int
+    """
+    with contextlib.ExitStack() as stack:
+        if duplicate_filter is None:
+            # pylint: disable-next=import-outside-toplevel
+            from qmllint_codequality import dedup
+
+            duplicate_filter = stack.enter_context(dedup.DuplicateFilter())
+
+        previous_duplicates = duplicate_filter.duplicates
+        issues = duplicate_filter(issues)
+
+        if history_run is not None:
+            issues = history_run(issues)
+
+        if baseline_index is not None:
+            issues = baseline_index(issues)
+
+        if statistics is None:
+            nb_issues = _serialize(issues, serializers)
+        else:
+            with statistics.measure("total"):
+                nb_issues = _serialize(statistics.observe(issues), serializers)
+
+    if duplicates := duplicate_filter.duplicates - previous_duplicates:
+        logger.info("Removed %d duplicated qmllint issues", duplicates)
+
+    if statistics is not None:
+        statistics.duplicates += duplicates
+
+    return nb_issues
+
+
+def convert_file(
+    input_file_path: str | os.PathLike[str],
+    output_file_path: str | os.PathLike[str],
+    streaming: bool = True,
+    fingerprint_engine: fingerprint.FingerprintEngine | None = None,
+    jobs: int = 1,
+    statistics: "stats.Statistics | None" = None,
+    duplicate_filter: "dedup.DuplicateFilter | None" = None,
+    baseline_index: "baseline.BaselineIndex | None" = None,
+    history_run: "history.HistoryRun | None" = None,
+    output_format: str | None = None,
+    extra_outputs: Iterable[tuple[str, str | os.PathLike]] = (),
+    indent: int | None = None,
+    codec: jsoncodec.Codec | None = None,
+    memory_map: bool = False,
+    compression_level: int | None = None,
+) -> int:
     """Convert qmllint JSON file to GitLab-compatible "Code Quality" JSON report.
 
-    :param input_file_path: Input file path (qmllint JSON).
-    :type input_file_path: os.PathLike
-    :param output_file_path: Output file path (Code Quality JSON).
-    :type output_file_path: os.PathLike
+    With ``STANDARD_STREAM`` as paths, the report is read incrementally from the standard input, and the issues are
+    written to the standard output as soon as they are converted, so qmllint can be piped into the conversion.
+
+    An issue whose fingerprint has already been written, such as a warning reported twice by qmllint, is removed.
+
+    :param input_file_path: Input file path (qmllint JSON), ``STANDARD_STREAM`` for the standard input.
+    :type input_file_path: str | os.PathLike[str]
+    :param output_file_path: Output file path (Code Quality JSON), ``STANDARD_STREAM`` for the standard output.
+    :type output_file_path: str | os.PathLike[str]
+    :param streaming: If True, the input file is read incrementally instead of being fully loaded, defaults to True.
+        In both cases, the issues are written in the output file as soon as they are converted.
+    :type streaming: bool, optional
+    :param fingerprint_engine: The engine computing the fingerprints, None for the default one, defaults to None
+    :type fingerprint_engine: fingerprint.FingerprintEngine | None, optional
+    :param jobs: Number of processes converting the warnings. If greater than 1, the files of the report are split
+        into chunks converted in parallel, and merged back in order, defaults to 1
+    :type jobs: int, optional
+    :param statistics: The statistics receiving the time spent in each stage, and the number of issues,
+        None to not collect them, defaults to None
+    :type statistics: stats.Statistics | None, optional
+    :param duplicate_filter: The filter removing the issues whose fingerprint has already been seen, None for a new
+        filter keeping the fingerprints in memory, defaults to None
+    :type duplicate_filter: dedup.DuplicateFilter | None, optional
+    :param baseline_index: The index of a baseline report. If given, only the issues not present in the baseline are
+        written, defaults to None
+    :type baseline_index: baseline.BaselineIndex | None, optional
+    :param history_run: The run recording all the issues in the history database, even those present in the
+        baseline, None to not record them, defaults to None
+    :type history_run: history.HistoryRun | None, optional
+    :param output_format: The format of the output file, one of ``formats.SERIALIZERS``, None for
+        ``formats.DEFAULT_FORMAT``, defaults to None
+    :type output_format: str | None, optional
+    :param extra_outputs: The format, and the path, of other output files written during the same conversion,
+        defaults to ()
+    :type extra_outputs: Iterable[tuple[str, str | os.PathLike]], optional
+    :param indent: The indentation level of the output files, None for the most compact representation,
+        defaults to None
+    :type indent: int | None, optional
+    :param codec: The codec decoding the report and encoding the issues, None for the fastest one installed,
+        defaults to None
+    :type codec: jsoncodec.Codec | None, optional
+    :param memory_map: If True, the input file is memory-mapped and scanned in place, only the warnings being copied
+        out of it. Ignored for the standard input, defaults to False
+    :type memory_map: bool, optional
+    :param compression_level: The compression level of the output files ending with one of
+        ``compression.EXTENSIONS``, from 1 (fastest) to 9 (smallest), None for the default one, defaults to None
+    :type compression_level: int | None, optional
+    :raises KeyError: A format does not exist.
     :return: If processing failed, a negative value. If successful, number of qmllint issues processed.
     :rtype: int
     """
     # Test if the input file exist
-    if not os.path.exists(input_file_path) or not os.path.isfile(input_file_path):
+    if os.fspath(input_file_path) != STANDARD_STREAM and not os.path.isfile(input_file_path):
         logger.error("Input file '%s' not found or cannot be opened", input_file_path)
         return -1
 
-    # Parse the input file
     logger.debug("Reading input file: '%s'", input_file_path)
 
-    with open(input_file_path, "rt", encoding="utf8", errors="replace") as in_f:
-        conversions, nb_issus = _convert_json(json.load(in_f))
+    codec = codec or jsoncodec.create_codec()
 
-    # Write the output file
-    logger.debug("Writing output file: '%s'", output_file_path)
+    if fingerprint_engine is not None:
+        fingerprint_engine.reset()
+
+    # Each issue is written as soon as its warning has been read and converted
+    with contextlib.ExitStack() as stack:
+        in_f = stack.enter_context(_open_input(input_file_path))
+        serializers = _open_serializers(
+            stack, output_file_path, output_format, extra_outputs, indent, codec, compression_level
+        )
+
+        qmllint_warnings: Iterable[tuple[str, qmllint.WarningDetails]]
 
-    os.makedirs(os.path.dirname(output_file_path), exist_ok=True)  # Ensure that the destination folder exist
+        # The standard input, and the compressed files, cannot be mapped
+        if memory_map and in_f is not sys.stdin.buffer and isinstance(in_f, io.BufferedReader):
+            qmllint_warnings = stream.iter_mapped_warnings(in_f, codec)
+        elif streaming:
+            qmllint_warnings = stream.iter_warnings(in_f, codec=codec)
+        else:
+            qmllint_warnings = _iter_json_warnings(codec.loads(in_f.read()))
 
-    with open(output_file_path, "w", encoding="utf8") as ou_f:
-        json.dump(conversions, ou_f, ensure_ascii=False, indent=None if logger.root.level > logging.DEBUG else 4)
+        if jobs > 1:
+            if statistics is not None:
+                qmllint_warnings = statistics.timed("parsing", qmllint_warnings)
+
+            issues = _iter_code_quality_parallel(qmllint_warnings, fingerprint_engine, jobs)
+        else:
+            issues = _iter_code_quality(qmllint_warnings, fingerprint_engine, statistics)
+
+        nb_issus = _write_issues(issues, serializers, statistics, duplicate_filter, baseline_index, history_run)
 
     return nb_issus
 
 
+def _iter_chunks(
+    qmllint_warnings: Iterable[tuple[str, qmllint.WarningDetails]], chunk_size: int
+) -> Iterator[list[tuple[str, list[qmllint.WarningDetails]]]]:
+    """Group the warnings into chunks of whole files.
+
+    A file is never split between two chunks, so the fingerprint engines see all its warnings at once.
+
+    :param qmllint_warnings: The warnings to group, with the name of the file containing them.
+    :type qmllint_warnings: Iterable[tuple[str, qmllint.WarningDetails]]
+    :param chunk_size: Minimal number of warnings in a chunk, except in the last one.
+    :type chunk_size: int
+    :yield: The chunks, as a list of file names with their warnings.
+    :rtype: Iterator[list[tuple[str, list[qmllint.WarningDetails]]]]
+    """
+    chunk: list[tuple[str, list[qmllint.WarningDetails]]] = []
+    nb_warnings = 0
+
+    for filename, group in itertools.groupby(qmllint_warnings, key=operator.itemgetter(0)):
+        file_warnings = [warning for _, warning in group]
+        chunk.append((filename, file_warnings))
+        nb_warnings += len(file_warnings)
+
+        if nb_warnings >= chunk_size:
+            yield chunk
+            chunk, nb_warnings = [], 0
+
+    if chunk:
+        yield chunk
+
+
+def _convert_chunk(
+    chunk: list[tuple[str, list[qmllint.WarningDetails]]], fingerprint_engine: fingerprint.FingerprintEngine | None
+) -> list[codequality.Report]:
+    """Convert a chunk of files into Code Quality issues.
+
+    Used by ``_iter_code_quality_parallel`` to convert the chunks in different processes.
+
+    :param chunk: The file names, with their warnings.
+    :type chunk: list[tuple[str, list[qmllint.WarningDetails]]]
+    :param fingerprint_engine: The engine computing the fingerprints, None for the default one.
+    :type fingerprint_engine: fingerprint.FingerprintEngine | None
+    :return: The Code Quality issues.
+    :rtype: list[codequality.Report]
+    """
+    if fingerprint_engine is not None:
+        fingerprint_engine.reset()
+
+    qmllint_warnings = ((filename, warning) for filename, file_warnings in chunk for warning in file_warnings)
+
+    return list(_iter_code_quality(qmllint_warnings, fingerprint_engine))
+
+
+def _imap_ordered(
+    executor: "Executor", function: Callable[[InputT], OutputT], items: Iterable[InputT], window: int
+) -> Iterator[OutputT]:
+    """Apply a function to the items in the executor, and iterate over the results in the order of the items.
+
+    Contrary to ``Executor.map``, the items are consumed lazily, at most ``window`` items being processed or waiting
+    to be consumed at the same time.
+
+    :param executor: The executor running the function.
+    :type executor: Executor
+    :param function: The function to apply.
+    :type function: Callable[[InputT], OutputT]
+    :param items: The items to give to the function.
+    :type items: Iterable[InputT]
+    :param window: Maximal number of items processed at the same time.
+    :type window: int
+    :yield: The results of the function.
+    :rtype: Iterator[OutputT]
+    """
+    pending: "collections.deque[Future[OutputT]]" = collections.deque()
+
+    for item in items:
+        pending.append(executor.submit(function, item))
+
+        if len(pending) >= window:
+            yield pending.popleft().result()
+
+    while pending:
+        yield pending.popleft().result()
+
+
+def _iter_code_quality_parallel(
+    qmllint_warnings: Iterable[tuple[str, qmllint.WarningDetails]],
+    fingerprint_engine: fingerprint.FingerprintEngine | None,
+    jobs: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[codequality.Report]:
+    """Convert the qmllint warnings into Code Quality issues, in a pool of processes.
+
+    The warnings are split into chunks of files, whose issues are produced in the same order as
+    ``_iter_code_quality``.
+
+    :param qmllint_warnings: The warnings to convert, with the name of the file containing them.
+    :type qmllint_warnings: Iterable[tuple[str, qmllint.WarningDetails]]
+    :param fingerprint_engine: The engine computing the fingerprints, None for the default one.
+    :type fingerprint_engine: fingerprint.FingerprintEngine | None
+    :param jobs: Number of processes.
+    :type jobs: int
+    :param chunk_size: Minimal number of warnings converted at once by a process, defaults to DEFAULT_CHUNK_SIZE
+    :type chunk_size: int, optional
+    :yield: The Code Quality issue of each warning.
+    :rtype: Iterator[codequality.Report]
+    """
+    import concurrent.futures  # pylint: disable=import-outside-toplevel  # Only needed with several jobs
+
+    qmllint.precompile()  # Inherited by the forked workers
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        conversions = _imap_ordered(
+            executor,
+            functools.partial(_convert_chunk, fingerprint_engine=fingerprint_engine),
+            _iter_chunks(qmllint_warnings, chunk_size),
+            2 * jobs,
+        )
+
+        yield from itertools.chain.from_iterable(conversions)
+
+
+def _expand_input_paths(
+    input_paths: Iterable[str | os.PathLike[str]], excluded: Iterable[str | os.PathLike[str]] = ()
+) -> list[str]:
+    """Expand the directories and the glob patterns into the list of the qmllint reports.
+
+    A directory is expanded into all the JSON files it contains, recursively.
+
+    :param input_paths: The files, directories and glob patterns.
+    :type input_paths: Iterable[str | os.PathLike[str]]
+    :param excluded: The files to remove from the list, such as the output file, defaults to ()
+    :type excluded: Iterable[str | os.PathLike[str]], optional
+    :return: The paths of the reports, without duplicates, in the order of the arguments.
+    :rtype: list[str]
+    """
+    import glob  # pylint: disable=import-outside-toplevel  # Only needed to expand the reports to merge
+
+    excluded_paths = {os.path.abspath(path) for path in excluded}
+    expanded: dict[str, str] = {}
+
+    for input_path in [os.fspath(path) for path in input_paths]:
+        if os.path.isdir(input_path):
+            patterns = ["*.json", *(f"*.json{extension}" for extension in compression.EXTENSIONS)]
+            paths = sorted(
+                path
+                for pattern in patterns
+                for path in glob.glob(os.path.join(glob.escape(input_path), "**", pattern), recursive=True)
+            )
+        elif glob.has_magic(input_path):
+            if not (paths := sorted(glob.glob(input_path, recursive=True))):
+                logger.warning("No file matching '%s'", input_path)
+        else:
+            paths = [input_path]
+
+        for path in paths:
+            if (absolute_path := os.path.abspath(path)) not in excluded_paths:
+                expanded.setdefault(absolute_path, path)
+
+    return list(expanded.values())
+
+
+def _convert_report_file(
+    input_file_path: str,
+    fingerprint_engine: fingerprint.FingerprintEngine | None = None,
+    codec: jsoncodec.Codec | None = None,
+    memory_map: bool = False,
+) -> list[codequality.Report]:
+    """Convert a qmllint JSON file into a list of Code Quality issues.
+
+    Used by ``convert_files`` to convert the reports in different processes.
+
+    :param input_file_path: Input file path (qmllint JSON).
+    :type input_file_path: str
+    :param fingerprint_engine: The engine computing the fingerprints, None for the default one, defaults to None
+    :type fingerprint_engine: fingerprint.FingerprintEngine | None, optional
+    :param codec: The codec decoding the report, None for the fastest one installed, defaults to None
+    :type codec: jsoncodec.Codec | None, optional
+    :param memory_map: If True, the input file is memory-mapped and scanned in place, defaults to False
+    :type memory_map: bool, optional
+    :return: The Code Quality issues.
+    :rtype: list[codequality.Report]
+    """
+    logger.debug("Reading input file: '%s'", input_file_path)
+
+    if fingerprint_engine is not None:
+        fingerprint_engine.reset()
+
+    with contextlib.ExitStack() as stack:
+        in_f = stack.enter_context(_open_input(input_file_path))
+
+        if memory_map and isinstance(in_f, io.BufferedReader):  # A compressed file cannot be mapped
+            qmllint_warnings = stream.iter_mapped_warnings(in_f, codec)
+        else:
+            qmllint_warnings = stream.iter_warnings(in_f, codec=codec)
+
+        return list(_iter_code_quality(qmllint_warnings, fingerprint_engine))
+
+
+def convert_files(
+    input_file_paths: Iterable[str | os.PathLike[str]],
+    output_file_path: str | os.PathLike,
+    fingerprint_engine: fingerprint.FingerprintEngine | None = None,
+    jobs: int | None = None,
+    statistics: "stats.Statistics | None" = None,
+    duplicate_filter: "dedup.DuplicateFilter | None" = None,
+    baseline_index: "baseline.BaselineIndex | None" = None,
+    history_run: "history.HistoryRun | None" = None,
+    output_format: str | None = None,
+    extra_outputs: Iterable[tuple[str, str | os.PathLike]] = (),
+    indent: int | None = None,
+    codec: jsoncodec.Codec | None = None,
+    memory_map: bool = False,
+    compression_level: int | None = None,
+) -> int:
+    """Convert many qmllint JSON files into a single GitLab-compatible "Code Quality" JSON report.
+
+    The reports are converted concurrently, in different processes, and merged in the order of the inputs. A single
+    report, or a single job, is converted in this process, without starting any worker. An issue present in several
+    reports, identified by its fingerprint, is written only once.
+
+    :param input_file_paths: Input file paths (qmllint JSON), directories containing them, or glob patterns.
+    :type input_file_paths: Iterable[str | os.PathLike[str]]
+    :param output_file_path: Output file path (Code Quality JSON), ``STANDARD_STREAM`` for the standard output.
+    :type output_file_path: str | os.PathLike
+    :param fingerprint_engine: The engine computing the fingerprints, None for the default one, defaults to None
+    :type fingerprint_engine: fingerprint.FingerprintEngine | None, optional
+    :param jobs: Maximal number of reports converted at the same time, None for the number of processors,
+        defaults to None
+    :type jobs: int | None, optional
+    :param statistics: The statistics receiving the number of issues, and the time spent, None to not collect them.
+        As the reports are converted in other processes, only the serialization is measured separately,
+        defaults to None
+    :type statistics: stats.Statistics | None, optional
+    :param duplicate_filter: The filter removing the issues whose fingerprint has already been seen, None for a new
+        filter keeping the fingerprints in memory, defaults to None
+    :type duplicate_filter: dedup.DuplicateFilter | None, optional
+    :param baseline_index: The index of a baseline report. If given, only the issues not present in the baseline are
+        written, defaults to None
+    :type baseline_index: baseline.BaselineIndex | None, optional
+    :param history_run: The run recording all the issues in the history database, even those present in the
+        baseline, None to not record them, defaults to None
+    :type history_run: history.HistoryRun | None, optional
+    :param output_format: The format of the output file, one of ``formats.SERIALIZERS``, None for
+        ``formats.DEFAULT_FORMAT``, defaults to None
+    :type output_format: str | None, optional
+    :param extra_outputs: The format, and the path, of other output files written during the same conversion,
+        defaults to ()
+    :type extra_outputs: Iterable[tuple[str, str | os.PathLike]], optional
+    :param indent: The indentation level of the output files, None for the most compact representation,
+        defaults to None
+    :type indent: int | None, optional
+    :param codec: The codec decoding the reports and encoding the issues, None for the fastest one installed,
+        defaults to None
+    :type codec: jsoncodec.Codec | None, optional
+    :param memory_map: If True, the input files are memory-mapped and scanned in place, defaults to False
+    :type memory_map: bool, optional
+    :param compression_level: The compression level of the output files ending with one of
+        ``compression.EXTENSIONS``, from 1 (fastest) to 9 (smallest), None for the default one, defaults to None
+    :type compression_level: int | None, optional
+    :raises KeyError: A format does not exist.
+    :raises ValueError: The number of jobs is not strictly positive.
+    :return: If processing failed, a negative value. If successful, number of qmllint issues written.
+    :rtype: int
+    """
+    if jobs is not None and jobs < 1:
+        raise ValueError(f"The number of jobs must be strictly positive, not {jobs}")
+
+    extra_outputs = list(extra_outputs)
+    output_paths = [output_file_path, *(path for _, path in extra_outputs)]
+
+    if not (input_paths := _expand_input_paths(input_file_paths, excluded=output_paths)):
+        logger.error("No input file found")
+        return -1
+
+    for input_path in input_paths:
+        if not os.path.isfile(input_path):
+            logger.error("Input file '%s' not found or cannot be opened", input_path)
+            return -1
+
+    logger.info("Merging %d qmllint reports", len(input_paths))
+
+    codec = codec or jsoncodec.create_codec()
+
+    with contextlib.ExitStack() as stack:
+        serializers = _open_serializers(
+            stack, output_file_path, output_format, extra_outputs, indent, codec, compression_level
+        )
+        conversion = functools.partial(
+            _convert_report_file, fingerprint_engine=fingerprint_engine, codec=codec, memory_map=memory_map
+        )
+
+        # A single report, or a single job, is converted in this process, without starting a pool
+        if len(input_paths) > 1 and jobs != 1:
+            import concurrent.futures  # pylint: disable=import-outside-toplevel  # Only needed to merge reports
+
+            qmllint.precompile()  # Inherited by the forked workers
+            executor = stack.enter_context(concurrent.futures.ProcessPoolExecutor(max_workers=jobs))
+            # The results are produced in the order of the inputs, so the output is deterministic
+            conversions = executor.map(conversion, input_paths)
+        else:
+            conversions = map(conversion, input_paths)
+
+        issues = itertools.chain.from_iterable(conversions)
+        nb_issus = _write_issues(issues, serializers, statistics, duplicate_filter, baseline_index, history_run)
+
+    return nb_issus
+
+
+def group_issues(issues: Iterable[codequality.Report], qml_files: list[str]) -> dict[str, list[codequality.Report]]:
+    """Group the issues of linted QML files by file.
+
+    :param issues: The issues of the QML files.
+    :type issues: Iterable[codequality.Report]
+    :param qml_files: The QML files given to qmllint.
+    :type qml_files: list[str]
+    :return: The issues of each QML file, in the order of the files, possibly without issue. The issues reported for
+        other files come last, grouped by the path they are reported with.
+    :rtype: dict[str, list[codequality.Report]]
+    """
+    # The issues are reported with the file name given to qmllint, possibly normalized
+    grouped: dict[str, list[codequality.Report]] = {qml_file: [] for qml_file in qml_files}
+    names = {os.path.abspath(qml_file): qml_file for qml_file in qml_files}
+
+    for issue in issues:
+        path = issue["location"]["path"]
+        grouped.setdefault(names.get(os.path.abspath(path), path), []).append(issue)
+
+    return grouped
+
+
+def _iter_cached_lint(
+    qml_files: list[str],
+    cache: "lintcache.LintCache",
+    salt: str,
+    lint: Callable[[list[str]], Iterator[codequality.Report]],
+) -> Iterator[codequality.Report]:
+    """Get the Code Quality issues of the QML files from the cache, linting only the files not found in it.
+
+    :param qml_files: The QML files.
+    :type qml_files: list[str]
+    :param cache: The cache holding the issues of the files already linted.
+    :type cache: lintcache.LintCache
+    :param salt: A value identifying the linter and the converter, part of the keys of the cache.
+    :type salt: str
+    :param lint: Function linting QML files, and converting their warnings.
+    :type lint: Callable[[list[str]], Iterator[codequality.Report]]
+    :yield: The issues of the files, in the order of the files.
+    :rtype: Iterator[codequality.Report]
+    """
+    keys = cache.keys(qml_files, salt)
+    missing = [qml_file for qml_file, key in keys.items() if key is None or key not in cache]
+
+    logger.info("Find %d QML files in the lint cache, lint the %d others", len(qml_files) - len(missing), len(missing))
+
+    fresh = group_issues(lint(missing) if missing else (), missing)
+
+    for qml_file in missing:
+        if (key := keys[qml_file]) is not None:
+            cache.store(key, fresh[qml_file])
+
+    for qml_file, key in keys.items():
+        if qml_file in fresh:
+            yield from fresh.pop(qml_file)
+        elif key is not None and (issues := cache.load(key)) is not None:
+            yield from issues
+        else:
+            logger.warning("Cache entry of '%s' lost, lint it again", qml_file)
+            yield from lint([qml_file])
+
+    # Issues reported for files that were not given to qmllint
+    for issues in fresh.values():
+        yield from issues
+
+    cache.evict()
+
+
+def lint_and_convert(
+    qml_paths: Iterable[str | os.PathLike],
+    output_file_path: str | os.PathLike,
+    fingerprint_engine: fingerprint.FingerprintEngine | None = None,
+    jobs: int | None = None,
+    executable: str = runner.DEFAULT_QMLLINT,
+    arguments: Sequence[str] = (),
+    batch_size: int = runner.DEFAULT_BATCH_SIZE,
+    cache: "lintcache.LintCache | None" = None,
+    statistics: "stats.Statistics | None" = None,
+    duplicate_filter: "dedup.DuplicateFilter | None" = None,
+    baseline_index: "baseline.BaselineIndex | None" = None,
+    history_run: "history.HistoryRun | None" = None,
+    output_format: str | None = None,
+    extra_outputs: Iterable[tuple[str, str | os.PathLike]] = (),
+    indent: int | None = None,
+    codec: jsoncodec.Codec | None = None,
+    compression_level: int | None = None,
+) -> int:
+    """Lint QML files with qmllint, and convert its warnings into a GitLab-compatible "Code Quality" JSON report.
+
+    The QML files are linted in batches, by qmllint processes running in parallel, and their warnings are converted
+    as soon as they are read, without writing the qmllint reports.
+
+    :param qml_paths: The QML files, and the directories containing them.
+    :type qml_paths: Iterable[str | os.PathLike]
+    :param output_file_path: Output file path (Code Quality JSON), ``STANDARD_STREAM`` for the standard output.
+    :type output_file_path: str | os.PathLike
+    :param fingerprint_engine: The engine computing the fingerprints, None for the default one, defaults to None
+    :type fingerprint_engine: fingerprint.FingerprintEngine | None, optional
+    :param jobs: Maximal number of qmllint processes running at the same time, None for the number of processors,
+        defaults to None
+    :type jobs: int | None, optional
+    :param executable: The qmllint executable, defaults to runner.DEFAULT_QMLLINT
+    :type executable: str, optional
+    :param arguments: Additional arguments given to qmllint, such as import paths, defaults to ()
+    :type arguments: Sequence[str], optional
+    :param batch_size: Maximal number of QML files linted by a single qmllint process,
+        defaults to runner.DEFAULT_BATCH_SIZE
+    :type batch_size: int, optional
+    :param cache: The cache holding the issues of the files already linted, only the files not found in it are
+        linted. None to lint all the files, defaults to None
+    :type cache: lintcache.LintCache | None, optional
+    :param statistics: The statistics receiving the time spent in each stage, and the number of issues,
+        None to not collect them, defaults to None
+    :type statistics: stats.Statistics | None, optional
+    :param duplicate_filter: The filter removing the issues whose fingerprint has already been seen, None for a new
+        filter keeping the fingerprints in memory, defaults to None
+    :type duplicate_filter: dedup.DuplicateFilter | None, optional
+    :param baseline_index: The index of a baseline report. If given, only the issues not present in the baseline are
+        written, defaults to None
+    :type baseline_index: baseline.BaselineIndex | None, optional
+    :param history_run: The run recording all the issues in the history database, even those present in the
+        baseline, None to not record them, defaults to None
+    :type history_run: history.HistoryRun | None, optional
+    :param output_format: The format of the output file, one of ``formats.SERIALIZERS``, None for
+        ``formats.DEFAULT_FORMAT``, defaults to None
+    :type output_format: str | None, optional
+    :param extra_outputs: The format, and the path, of other output files written during the same conversion,
+        defaults to ()
+    :type extra_outputs: Iterable[tuple[str, str | os.PathLike]], optional
+    :param indent: The indentation level of the output files, None for the most compact representation,
+        defaults to None
+    :type indent: int | None, optional
+    :param codec: The codec encoding the issues, None for the fastest one installed, defaults to None
+    :type codec: jsoncodec.Codec | None, optional
+    :param compression_level: The compression level of the output files ending with one of
+        ``compression.EXTENSIONS``, from 1 (fastest) to 9 (smallest), None for the default one, defaults to None
+    :type compression_level: int | None, optional
+    :raises KeyError: A format does not exist.
+    :return: If processing failed, a negative value. If successful, number of qmllint issues processed.
+    :rtype: int
+    """
+    if not (qml_files := runner.discover_qml_files(qml_paths)):
+        logger.error("No QML file found")
+        return -1
+
+    codec = codec or jsoncodec.create_codec()
+
+    if fingerprint_engine is not None:
+        fingerprint_engine.reset()
+
+    def lint(files: list[str]) -> Iterator[codequality.Report]:
+        """Lint QML files, and convert their warnings.
+
+        :param files: The QML files.
+        :type files: list[str]
+        :return: The Code Quality issues.
+        :rtype: Iterator[codequality.Report]
+        """
+        qmllint_warnings = runner.iter_lint_warnings(files, executable, arguments, batch_size, jobs)
+        return _iter_code_quality(qmllint_warnings, fingerprint_engine, statistics)
+
+    if cache is None:
+        issues = lint(qml_files)
+    else:
+        engine = fingerprint_engine or fingerprint.DEFAULT_ENGINE
+        # The content fingerprints depend on the source files read
+        content_root = engine.source_root or os.curdir if isinstance(engine, fingerprint.ContentFingerprint) else None
+        salt = "\0".join(
+            [
+                __version__,
+                runner.qmllint_version(executable) or "",
+                *arguments,
+                type(engine).__qualname__,
+                str(getattr(engine, "digest_size", "")),
+                "" if content_root is None else os.path.abspath(content_root),
+            ]
+        )
+        issues = _iter_cached_lint(qml_files, cache, salt, lint)
+
+    try:
+        with contextlib.ExitStack() as stack:
+            serializers = _open_serializers(
+                stack, output_file_path, output_format, extra_outputs, indent, codec, compression_level
+            )
+            return _write_issues(issues, serializers, statistics, duplicate_filter, baseline_index, history_run)
+    except runner.QmllintError as error:
+        logger.error("%s", error)
+        return -1
+
+
 if __name__ == "__main__":
     import warnings
 
@@ -1,10 +1,111 @@
 """CLI app for converting qmllint JSON report to Code Quality JSON report."""
 
 import argparse
+import contextlib
 import logging
+import os
 import sys
+import time
+from typing import TYPE_CHECKING, TextIO
 
-from qmllint_codequality import VERSION_MESSAGE, __project__, convert_file
+from qmllint_codequality import (
+    CLASSIFICATION_CACHE,
+    DEFAULT_CLASSIFICATION_CACHE_SIZE,
+    STANDARD_STREAM,
+    VERSION_MESSAGE,
+    __project__,
+    add_verbosity_argument,
+    baseline,
+    compression,
+    convert_file,
+    convert_files,
+    fingerprint,
+    formats,
+    jsoncodec,
+    lint_and_convert,
+    lintcache,
+    runner,
+)
+
+if TYPE_CHECKING:
+    from qmllint_codequality import dedup, history, stats
+
+
+def _non_negative_int(value: str) -> int:
+    """Convert a command line argument to a positive, or null, integer.
+
+    :param value: The command line argument.
+    :type value: str
+    :raises argparse.ArgumentTypeError: The value is not a positive, or null, integer.
+    :return: The integer.
+    :rtype: int
+    """
+    try:
+        integer = int(value)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(f"invalid integer value: '{value}'") from error
+
+    if integer < 0:
+        raise argparse.ArgumentTypeError(f"must be positive or null: '{value}'")
+
+    return integer
+
+
+def _positive_int(value: str) -> int:
+    """Convert a command line argument to a strictly positive integer.
+
+    :param value: The command line argument.
+    :type value: str
+    :raises argparse.ArgumentTypeError: The value is not a strictly positive integer.
+    :return: The integer.
+    :rtype: int
+    """
+    try:
+        integer = int(value)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(f"invalid integer value: '{value}'") from error
+
+    if integer < 1:
+        raise argparse.ArgumentTypeError(f"must be strictly positive: '{value}'")
+
+    return integer
+
+
+def _compression_level(value: str) -> int:
+    """Convert a command line argument to a compression level, from 1 to 9.
+
+    :param value: The command line argument.
+    :type value: str
+    :raises argparse.ArgumentTypeError: The value is not an integer from 1 to 9.
+    :return: The compression level.
+    :rtype: int
+    """
+    if (level := _positive_int(value)) > 9:
+        raise argparse.ArgumentTypeError(f"must be from 1 to 9: '{value}'")
+
+    return level
+
+
+def _extra_output(value: str) -> tuple[str, str]:
+    """Convert a command line argument to the format and the path of an output file.
+
+    :param value: The command line argument, of the form ``FORMAT=FILE``.
+    :type value: str
+    :raises argparse.ArgumentTypeError: The argument is malformed, or the format does not exist.
+    :return: The format, and the path of the output file.
+    :rtype: tuple[str, str]
+    """
+    output_format, separator, path = value.partition("=")
+
+    if not separator or not path:
+        raise argparse.ArgumentTypeError(f"expecting FORMAT=FILE: '{value}'")
+
+    if output_format not in formats.SERIALIZERS:
+        raise argparse.ArgumentTypeError(
+            f"unknown format '{output_format}', expecting one of {', '.join(formats.SERIALIZERS)}"
+        )
+
+    return output_format, path
 
 
 def _get_args() -> argparse.Namespace:
@@ -18,15 +119,20 @@ def _get_args() -> argparse.Namespace:
     )
 
     parser.add_argument(
-        "input_file",
-        help="The path to the qmllint JSON output to be converted",
+        "input_files",
+        help="The path to the qmllint JSON output to be converted.\n"
+        "Several files, directories and glob patterns can be given, their issues are merged into the output file.\n"
+        "'-' reads a single report from the standard input.\n"
+        "With --lint, the QML files and directories to lint",
+        metavar="input_file",
+        nargs="+",
         type=str,
         action="store",
     )
 
     parser.add_argument(
         "output_file",
-        help="output filename to write JSON to (default: %(default)s)",
+        help="output filename to write JSON to, '-' for the standard output (default: %(default)s)",
         type=str,
         default="clang-tidy.json",
         action="store",
@@ -40,34 +146,265 @@ def _get_args() -> argparse.Namespace:
         version=VERSION_MESSAGE,
     )
 
+    add_verbosity_argument(parser)
+
     parser.add_argument(
-        "-v",
-        "--verbosity",
-        choices=[
-            logging.getLevelName(logging.WARNING),
-            logging.getLevelName(logging.INFO),
-            logging.getLevelName(logging.DEBUG),
-        ],
-        help="indicates the level of verbosity",
+        "--format",
+        choices=list(formats.SERIALIZERS),
+        help="format of the output file (default: %(default)s):\n"
+        "- codequality: GitLab Code Quality JSON report\n"
+        "- sarif: SARIF 2.1.0 log\n"
+        "- junit: JUnit XML report, each issue being a failed test case\n"
+        "- ndjson: Code Quality issues, one JSON object per line",
+        dest="output_format",
+        type=str,
+        default=formats.DEFAULT_FORMAT,
+    )
+
+    parser.add_argument(
+        "--extra-output",
+        help="also write the issues into another file, in another format, during the same conversion, such as\n"
+        "'--extra-output sarif=qmllint.sarif'. Can be repeated",
+        dest="extra_outputs",
+        metavar="FORMAT=FILE",
+        type=_extra_output,
+        action="append",
+        default=[],
+    )
+
+    parser.add_argument(
+        "--indent",
+        help="indent the JSON output files with this number of spaces (default: compact output)",
+        metavar="SPACES",
+        type=_positive_int,
+        default=None,
+    )
+
+    parser.add_argument(
+        "--compression-level",
+        help="compression level of the output files ending with .gz, .xz or .bz2, from 1 (fastest) to 9 (smallest)\n"
+        f"(default: {compression.DEFAULT_LEVEL}). The compressed input files are detected from their content",
+        metavar="LEVEL",
+        type=_compression_level,
+        default=None,
+    )
+
+    parser.add_argument(
+        "--json-backend",
+        choices=[jsoncodec.AUTO, *jsoncodec.CODECS],
+        help="library decoding the reports and encoding the issues (default: %(default)s):\n"
+        "- auto: orjson if it is installed, the standard library otherwise\n"
+        "- stdlib: the json module of the standard library\n"
+        "- orjson: the orjson package, several times faster",
+        type=str,
+        default=jsoncodec.AUTO,
+    )
+
+    parser.add_argument(
+        "--mmap",
+        help="memory-map the reports, and scan them in place: only the warnings are copied out of them, keeping the\n"
+        "memory low on very large reports",
+        action="store_true",
+    )
+
+    parser.add_argument(
+        "--lint",
+        help="run qmllint on the QML files given as input, and convert its output directly",
+        action="store_true",
+    )
+
+    parser.add_argument(
+        "--qmllint",
+        help="the qmllint executable used with --lint (default: %(default)s)",
+        type=str,
+        default=runner.DEFAULT_QMLLINT,
+    )
+
+    parser.add_argument(
+        "--qmllint-arg",
+        help="an additional argument given to qmllint, such as '--qmllint-arg=-I' '--qmllint-arg=imports/'.\n"
+        "Can be repeated",
+        dest="qmllint_args",
+        metavar="ARG",
+        type=str,
+        action="append",
+        default=[],
+    )
+
+    parser.add_argument(
+        "--batch-size",
+        help="number of QML files linted by a single qmllint process, with --lint (default: %(default)s)",
+        type=_positive_int,
+        default=runner.DEFAULT_BATCH_SIZE,
+    )
+
+    parser.add_argument(
+        "--cache-dir",
+        help="directory of the cache holding the issues of the QML files already linted, with --lint.\n"
+        "Only the QML files that changed, or whose components changed, are linted again (default: no cache)",
+        type=str,
+        default=None,
+    )
+
+    parser.add_argument(
+        "--cache-size",
+        help="maximal size of the cache in MiB, the least recently used entries are removed beyond it\n"
+        "(default: %(default)s)",
+        metavar="MIB",
+        type=_positive_int,
+        default=lintcache.DEFAULT_MAX_SIZE // (1024 * 1024),
+    )
+
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        help="number of processes converting the reports, or running qmllint with --lint (default: 1 for a single\n"
+        "report, number of processors otherwise)",
+        type=_positive_int,
+        default=None,
+    )
+
+    parser.add_argument(
+        "--classification-cache-size",
+        help="number of distinct messages whose classification is cached, 0 to disable the cache "
+        "(default: %(default)s)",
+        metavar="SIZE",
+        type=_non_negative_int,
+        default=DEFAULT_CLASSIFICATION_CACHE_SIZE,
+    )
+
+    parser.add_argument(
+        "--fingerprint",
+        choices=list(fingerprint.ENGINES),
+        help="how the fingerprints are computed (default: %(default)s):\n"
+        "- md5: from the position and the message of the issue, as the previous versions\n"
+        "- coordinates: as md5, but with the faster BLAKE2b hash, changing the existing fingerprints\n"
+        "- content: from the offending source line, stable when lines are added or removed above the issue",
+        type=str,
+        default="md5",
+    )
+
+    parser.add_argument(
+        "--source-root",
+        help="directory against which the relative QML file names are resolved, when reading the source lines of\n"
+        "the issues (default: current directory)",
+        type=str,
+        default=None,
+    )
+
+    parser.add_argument(
+        "--baseline",
+        help="a previous Code Quality report: only the issues not present in it are written. Its fingerprints are\n"
+        "indexed on disk once, and the index is reused while the report does not change",
+        metavar="REPORT",
+        type=str,
+        default=None,
+    )
+
+    parser.add_argument(
+        "--baseline-index",
+        help="path of the index of the baseline (default: the path of the baseline followed by "
+        f"'{baseline.INDEX_SUFFIX}')",
+        metavar="FILE",
+        type=str,
+        default=None,
+    )
+
+    parser.add_argument(
+        "--fixed",
+        help="with --baseline, write the issues of the baseline that were not found anymore into this Code Quality\n"
+        "report",
+        metavar="FILE",
         type=str,
-        default=logging.getLevelName(logging.INFO),
+        default=None,
+    )
+
+    parser.add_argument(
+        "--history",
+        help="SQLite database archiving the issues of each run, with their rule, category, severity, path, position\n"
+        "and fingerprint, indexed to follow their trend over time. Created if it does not exist",
+        metavar="DATABASE",
+        type=str,
+        default=None,
+    )
+
+    parser.add_argument(
+        "--run-id",
+        help="identifier of the run recorded with --history, a run recorded again is replaced\n"
+        "(default: $CI_PIPELINE_ID, or the current date and time)",
+        metavar="ID",
+        type=str,
+        default=None,
+    )
+
+    parser.add_argument(
+        "--dedup-memory",
+        help="number of distinct fingerprints kept in memory to remove the duplicated issues, beyond which they are\n"
+        "moved to a temporary database on disk, for very large merged reports (default: no limit)",
+        metavar="FINGERPRINTS",
+        type=_positive_int,
+        default=None,
+    )
+
+    parser.add_argument(
+        "--watch",
+        help="keep running, and update the output file when the report changes, or with --lint, when the QML files\n"
+        "change. Only the QML files affected by a change are converted, or linted, again",
+        action="store_true",
+    )
+
+    parser.add_argument(
+        "--watch-interval",
+        help="time between two checks of the watched files, in seconds (default: 1.0)",
+        metavar="SECONDS",
+        type=float,
+    )
+
+    parser.add_argument(
+        "--stats",
+        help="write statistics about the conversion in JSON: time spent in each stage, throughput, peak memory,\n"
+        "and number of issues per rule, severity and file, into the standard error, or into --stats-file",
+        action="store_true",
+    )
+
+    parser.add_argument(
+        "--stats-file",
+        help="write the statistics of --stats into this file instead, implies --stats",
+        metavar="FILE",
+        type=str,
+        default=None,
+    )
+
+    parser.add_argument(
+        "--profile",
+        help="profile the conversion with cProfile, and write the profile in a file readable by pstats",
+        metavar="FILE",
+        type=str,
+        default=None,
     )
 
     # Parse the arguments
-    return parser.parse_args()
+    args = parser.parse_args()
+
+    if args.fixed is not None and args.baseline is None:
+        parser.error("--fixed requires --baseline")
 
+    return args
 
-def _configure_log(login_level: str) -> None:
+
+def _configure_log(login_level: str, stream: TextIO = sys.stdout) -> None:
     """Configure the logging library the to given level.
 
     :param login_level: The login level.
     :type login_level: str
+    :param stream: The stream receiving the log, defaults to sys.stdout
+    :type stream: TextIO, optional
     """
     logging.basicConfig(
         level=logging.getLevelName(login_level),
         format="%(asctime)s %(levelname)s : %(message)s",
         handlers=[
-            logging.StreamHandler(sys.stdout),
+            logging.StreamHandler(stream),
         ],
     )
 
@@ -75,7 +412,7 @@ def _configure_log(login_level: str) -> None:
 def main() -> int:
     """Convert a qmllint JSON output to Code Climate JSON file, at the command line.
 
-    :return:  0 if successful, 0 otherwise.
+    :return:  0 if successful, 1 otherwise.
     :rtype: int
     """
     if sys.version_info < (3, 10, 0):
@@ -84,18 +421,270 @@ def main() -> int:
 
     args = _get_args()
 
-    _configure_log(args.verbosity)
+    # The standard output is kept for the report, when it is written there
+    _configure_log(args.verbosity, sys.stderr if args.output_file == STANDARD_STREAM else sys.stdout)
 
-    # Convert the clang-tidy output to JSON here.
-    if (ret := convert_file(args.input_file, args.output_file)) < 0:
+    CLASSIFICATION_CACHE.resize(args.classification_cache_size)
+
+    engine = fingerprint.create_engine(args.fingerprint, args.source_root)
+
+    try:
+        codec = jsoncodec.create_codec(args.json_backend)
+    except ImportError as error:
+        logging.error("Cannot use the JSON backend '%s': %s", args.json_backend, error)
+        return 1
+
+    if args.watch:
+        return _watch(args, engine, codec)
+
+    return _run_conversion(args, engine, codec)
+
+
+def _run_conversion(args: argparse.Namespace, engine: fingerprint.FingerprintEngine, codec: jsoncodec.Codec) -> int:
+    """Run the conversion requested on the command line, with its baseline, history and statistics.
+
+    :param args: The parsed options.
+    :type args: argparse.Namespace
+    :param engine: The engine computing the fingerprints.
+    :type engine: fingerprint.FingerprintEngine
+    :param codec: The codec decoding the reports and encoding the issues.
+    :type codec: jsoncodec.Codec
+    :return: 0 if successful, 1 otherwise.
+    :rtype: int
+    """
+    # pylint: disable-next=import-outside-toplevel  # Only needed to convert, not to parse the options
+    from qmllint_codequality import dedup, history, stats
+
+    statistics = stats.Statistics() if args.stats or args.stats_file is not None else None
+
+    try:
+        baseline_index = (
+            None if args.baseline is None else baseline.BaselineIndex.open(args.baseline, args.baseline_index)
+        )
+    except (OSError, ValueError) as error:
+        logging.error("Cannot use the baseline '%s': %s", args.baseline, error)
+        return 1
+
+    try:
+        history_store = None if args.history is None else history.HistoryStore(args.history)
+    except OSError as error:
+        logging.error("%s", error)
+        return 1
+
+    try:
+        with (
+            baseline_index or contextlib.nullcontext(),
+            history_store or contextlib.nullcontext(),
+            dedup.DuplicateFilter(args.dedup_memory) as duplicate_filter,
+        ):
+            history_run = None if history_store is None else history_store.run(_run_id(args))
+
+            with stats.profile(args.profile):
+                ret = _convert(args, engine, codec, statistics, duplicate_filter, baseline_index, history_run)
+
+            if baseline_index is not None and ret >= 0:
+                _report_baseline(args, baseline_index, codec)
+    except BrokenPipeError:
+        # The reader of the standard output exited early, such as `head`: silence the flush at exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+
+    if ret < 0:
         logging.error("Conversion failed")
         return 1
 
     # # Logging the total count.
     logging.info("Converted %d qmllint issues", ret)
 
+    cache_info = CLASSIFICATION_CACHE.info()
+    logging.debug("Classification cache: %d hits, %d misses", cache_info.hits, cache_info.misses)
+
+    if statistics is not None:
+        statistics.write(args.stats_file)
+
+    return 0
+
+
+def _run_id(args: argparse.Namespace) -> str:
+    """Get the identifier of the run recorded in the history.
+
+    :param args: The parsed options.
+    :type args: argparse.Namespace
+    :return: The identifier given on the command line, the identifier of the GitLab pipeline, or the current date
+        and time.
+    :rtype: str
+    """
+    if args.run_id is not None:
+        return args.run_id
+
+    if pipeline_id := os.environ.get("CI_PIPELINE_ID"):
+        return pipeline_id
+
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
+def _report_baseline(args: argparse.Namespace, baseline_index: baseline.BaselineIndex, codec: jsoncodec.Codec) -> None:
+    """Log the number of new and fixed issues, and write the fixed issues if requested.
+
+    :param args: The parsed options.
+    :type args: argparse.Namespace
+    :param baseline_index: The index of the baseline, used by the conversion.
+    :type baseline_index: baseline.BaselineIndex
+    :param codec: The codec encoding the fixed issues.
+    :type codec: jsoncodec.Codec
+    """
+    if args.fixed is None:
+        nb_fixed = len(baseline_index) - baseline_index.known
+    else:
+        nb_fixed = baseline_index.write_fixed(args.fixed, args.indent, codec, args.compression_level)
+
+    logging.info("Found %d new qmllint issues, %d fixed since the baseline", baseline_index.new, nb_fixed)
+
+
+def _watch(args: argparse.Namespace, engine: fingerprint.FingerprintEngine, codec: jsoncodec.Codec) -> int:
+    """Watch the files given on the command line, and update the output file when they change, until interrupted.
+
+    :param args: The parsed options.
+    :type args: argparse.Namespace
+    :param engine: The engine computing the fingerprints.
+    :type engine: fingerprint.FingerprintEngine
+    :param codec: The codec decoding the report and encoding the issues.
+    :type codec: jsoncodec.Codec
+    :return: 0 when interrupted, 1 if the files cannot be watched.
+    :rtype: int
+    """
+    # pylint: disable-next=import-outside-toplevel  # Only needed with --watch
+    from qmllint_codequality import watch
+
+    watcher: watch.Watcher
+
+    if args.output_file == STANDARD_STREAM:
+        logging.error("--watch cannot write to the standard output")
+        return 1
+
+    if args.baseline is not None or args.history is not None:
+        logging.error("--watch cannot be used with --baseline or --history")
+        return 1
+
+    if args.output_format != formats.DEFAULT_FORMAT or args.extra_outputs:
+        logging.error("--watch only writes a Code Quality report")
+        return 1
+
+    if args.lint:
+        watcher = watch.LintWatcher(
+            args.input_files,
+            args.output_file,
+            fingerprint_engine=engine,
+            executable=args.qmllint,
+            arguments=args.qmllint_args,
+            batch_size=args.batch_size,
+            jobs=args.jobs,
+        )
+    elif len(args.input_files) == 1 and args.input_files[0] != STANDARD_STREAM:
+        watcher = watch.ReportWatcher(args.input_files[0], args.output_file, fingerprint_engine=engine)
+    else:
+        logging.error("--watch needs a single report file, or --lint")
+        return 1
+
+    watcher.indent = args.indent
+    watcher.codec = codec
+    watcher.compression_level = args.compression_level
+
+    logging.info("Watching %s, press Ctrl+C to stop", ", ".join(args.input_files))
+
+    try:
+        watcher.run(watch.DEFAULT_INTERVAL if args.watch_interval is None else args.watch_interval)
+    except KeyboardInterrupt:
+        pass
+
     return 0
 
 
+def _convert(
+    args: argparse.Namespace,
+    engine: fingerprint.FingerprintEngine,
+    codec: jsoncodec.Codec,
+    statistics: "stats.Statistics | None",
+    duplicate_filter: "dedup.DuplicateFilter",
+    baseline_index: baseline.BaselineIndex | None,
+    history_run: "history.HistoryRun | None",
+) -> int:
+    """Run the conversion requested on the command line.
+
+    :param args: The parsed options.
+    :type args: argparse.Namespace
+    :param engine: The engine computing the fingerprints.
+    :type engine: fingerprint.FingerprintEngine
+    :param codec: The codec decoding the reports and encoding the issues.
+    :type codec: jsoncodec.Codec
+    :param statistics: The statistics about the conversion, None to not collect them.
+    :type statistics: stats.Statistics | None
+    :param duplicate_filter: The filter removing the duplicated issues.
+    :type duplicate_filter: dedup.DuplicateFilter
+    :param baseline_index: The index of the baseline, whose issues are not written, None to write all the issues.
+    :type baseline_index: baseline.BaselineIndex | None
+    :param history_run: The run recording the issues in the history, None to not record them.
+    :type history_run: history.HistoryRun | None
+    :return: If processing failed, a negative value. If successful, number of qmllint issues written.
+    :rtype: int
+    """
+    # Convert the clang-tidy output to JSON here.
+    if args.lint:
+        return lint_and_convert(
+            args.input_files,
+            args.output_file,
+            fingerprint_engine=engine,
+            jobs=args.jobs,
+            executable=args.qmllint,
+            arguments=args.qmllint_args,
+            batch_size=args.batch_size,
+            cache=lintcache.LintCache(args.cache_dir, args.cache_size * 1024 * 1024) if args.cache_dir else None,
+            statistics=statistics,
+            duplicate_filter=duplicate_filter,
+            baseline_index=baseline_index,
+            history_run=history_run,
+            output_format=args.output_format,
+            extra_outputs=args.extra_outputs,
+            indent=args.indent,
+            codec=codec,
+            compression_level=args.compression_level,
+        )
+
+    if len(args.input_files) == 1 and (args.input_files[0] == STANDARD_STREAM or os.path.isfile(args.input_files[0])):
+        return convert_file(
+            args.input_files[0],
+            args.output_file,
+            fingerprint_engine=engine,
+            jobs=args.jobs or 1,
+            statistics=statistics,
+            duplicate_filter=duplicate_filter,
+            baseline_index=baseline_index,
+            history_run=history_run,
+            output_format=args.output_format,
+            extra_outputs=args.extra_outputs,
+            indent=args.indent,
+            codec=codec,
+            compression_level=args.compression_level,
+            memory_map=args.mmap,
+        )
+
+    return convert_files(
+        args.input_files,
+        args.output_file,
+        fingerprint_engine=engine,
+        jobs=args.jobs,
+        statistics=statistics,
+        duplicate_filter=duplicate_filter,
+        baseline_index=baseline_index,
+        history_run=history_run,
+        output_format=args.output_format,
+        extra_outputs=args.extra_outputs,
+        indent=args.indent,
+        codec=codec,
+        compression_level=args.compression_level,
+        memory_map=args.mmap,
+    )
+
+
 if __name__ == "__main__":
     sys.exit(main())
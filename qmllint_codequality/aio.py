@@ -0,0 +1,189 @@
+"""Module converting the reports from asyncio, without blocking the event loop.
+
+The conversions are run in executors: the files are read, and written, in the threads of the default executor of the
+event loop, and the warnings are converted in the given executor, such as a ``ProcessPoolExecutor`` keeping the
+classification of the messages off the threads of the event loop. Many conversions can run at once, a semaphore
+bounding the number of them running in the executors at the same time.
+
+Each conversion uses its own copy of the fingerprint engine, so the conversions running at once do not share the
+source files read, nor the occurrences counted in them.
+
+:Example:
+
+    ```python
+    limiter = asyncio.Semaphore(4)
+
+    await asyncio.gather(
+        *(convert_file_async(report, f"{report}.codequality.json", limiter=limiter) for report in reports)
+    )
+
+    async for issue in iter_issues_async("qmllint.json", limiter=limiter):
+        print(issue["description"])
+    ```
+"""
+
+import asyncio
+import contextlib
+import copy
+import functools
+import logging
+import os
+from concurrent.futures import Executor
+from typing import AsyncIterator, Callable, Iterable, TypeVar
+
+from qmllint_codequality import (
+    DEFAULT_CHUNK_SIZE,
+    _convert_chunk,
+    _iter_chunks,
+    _open_input,
+    codequality,
+    convert_file,
+    dedup,
+    fingerprint,
+    jsoncodec,
+    stream,
+)
+
+logger = logging.getLogger(__name__)
+
+ResultT = TypeVar("ResultT")
+
+
+async def _run(
+    limiter: asyncio.Semaphore | None, executor: Executor | None, function: Callable[..., ResultT], *args: object
+) -> ResultT:
+    """Run a function in an executor, once the limiter allows it.
+
+    :param limiter: The semaphore bounding the number of functions running at the same time, None for no limit.
+    :type limiter: asyncio.Semaphore | None
+    :param executor: The executor running the function, None for the default executor of the event loop.
+    :type executor: Executor | None
+    :param function: The function to run.
+    :type function: Callable[..., ResultT]
+    :param args: The arguments given to the function.
+    :type args: object
+    :return: The result of the function.
+    :rtype: ResultT
+    """
+    async with limiter or contextlib.nullcontext():
+        return await asyncio.get_running_loop().run_in_executor(executor, function, *args)
+
+
+async def convert_file_async(
+    input_file_path: str | os.PathLike,
+    output_file_path: str | os.PathLike,
+    fingerprint_engine: fingerprint.FingerprintEngine | None = None,
+    output_format: str | None = None,
+    extra_outputs: Iterable[tuple[str, str | os.PathLike]] = (),
+    indent: int | None = None,
+    codec: jsoncodec.Codec | None = None,
+    memory_map: bool = False,
+    compression_level: int | None = None,
+    executor: Executor | None = None,
+    limiter: asyncio.Semaphore | None = None,
+) -> int:
+    """Convert a qmllint JSON file into a Code Quality JSON report, like ``convert_file``, in an executor.
+
+    The whole conversion, reading and writing the files included, runs in the executor.
+
+    :param input_file_path: Input file path (qmllint JSON).
+    :type input_file_path: str | os.PathLike
+    :param output_file_path: Output file path (Code Quality JSON).
+    :type output_file_path: str | os.PathLike
+    :param fingerprint_engine: The engine computing the fingerprints, copied for this conversion, None for the default
+        one, defaults to None
+    :type fingerprint_engine: fingerprint.FingerprintEngine | None, optional
+    :param output_format: The format of the output file, one of ``formats.SERIALIZERS``, None for
+        ``formats.DEFAULT_FORMAT``, defaults to None
+    :type output_format: str | None, optional
+    :param extra_outputs: The format, and the path, of other output files written during the same conversion,
+        defaults to ()
+    :type extra_outputs: Iterable[tuple[str, str | os.PathLike]], optional
+    :param indent: The indentation level of the output files, None for the most compact representation,
+        defaults to None
+    :type indent: int | None, optional
+    :param codec: The codec decoding the report and encoding the issues, None for the fastest one installed,
+        defaults to None
+    :type codec: jsoncodec.Codec | None, optional
+    :param memory_map: If True, the input file is memory-mapped and scanned in place, defaults to False
+    :type memory_map: bool, optional
+    :param compression_level: The compression level of the compressed output files, None for the default one,
+        defaults to None
+    :type compression_level: int | None, optional
+    :param executor: The executor running the conversion, None for the default executor of the event loop,
+        defaults to None
+    :type executor: Executor | None, optional
+    :param limiter: The semaphore bounding the number of conversions running at the same time, None for no limit,
+        defaults to None
+    :type limiter: asyncio.Semaphore | None, optional
+    :raises KeyError: A format does not exist.
+    :return: If processing failed, a negative value. If successful, number of qmllint issues processed.
+    :rtype: int
+    """
+    conversion = functools.partial(
+        convert_file,
+        input_file_path,
+        output_file_path,
+        fingerprint_engine=copy.deepcopy(fingerprint_engine),
+        output_format=output_format,
+        extra_outputs=list(extra_outputs),
+        indent=indent,
+        codec=codec,
+        memory_map=memory_map,
+        compression_level=compression_level,
+    )
+
+    return await _run(limiter, executor, conversion)
+
+
+async def iter_issues_async(
+    input_file_path: str | os.PathLike,
+    fingerprint_engine: fingerprint.FingerprintEngine | None = None,
+    codec: jsoncodec.Codec | None = None,
+    executor: Executor | None = None,
+    limiter: asyncio.Semaphore | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> AsyncIterator[codequality.Report]:
+    """Convert a qmllint JSON file into Code Quality issues, produced as soon as each chunk of files is converted.
+
+    The report is read incrementally in the default executor of the event loop, and split into chunks of whole files,
+    converted in the given executor. As with ``convert_file``, an issue whose fingerprint has already been produced is
+    removed.
+
+    :param input_file_path: Input file path (qmllint JSON), possibly compressed.
+    :type input_file_path: str | os.PathLike
+    :param fingerprint_engine: The engine computing the fingerprints, copied for this conversion, None for the default
+        one, defaults to None
+    :type fingerprint_engine: fingerprint.FingerprintEngine | None, optional
+    :param codec: The codec decoding the report, None for the fastest one installed, defaults to None
+    :type codec: jsoncodec.Codec | None, optional
+    :param executor: The executor converting the chunks, None for the default executor of the event loop,
+        defaults to None
+    :type executor: Executor | None, optional
+    :param limiter: The semaphore bounding the number of reads and conversions running at the same time, None for no
+        limit, defaults to None
+    :type limiter: asyncio.Semaphore | None, optional
+    :param chunk_size: Minimal number of warnings converted at once, defaults to DEFAULT_CHUNK_SIZE
+    :type chunk_size: int, optional
+    :raises OSError: The report cannot be read.
+    :raises ValueError: The report is not valid JSON.
+    :return: An asynchronous iterator over the Code Quality issue of each warning.
+    :rtype: AsyncIterator[codequality.Report]
+    """
+    codec = codec or jsoncodec.create_codec()
+    fingerprint_engine = copy.deepcopy(fingerprint_engine)
+    stack = contextlib.ExitStack()
+
+    try:
+        with dedup.DuplicateFilter() as duplicate_filter:
+            in_f = await _run(limiter, None, stack.enter_context, _open_input(input_file_path))
+            chunks = _iter_chunks(stream.iter_warnings(in_f, codec=codec), chunk_size)
+
+            while (chunk := await _run(limiter, None, next, chunks, None)) is not None:
+                for issue in duplicate_filter(await _run(limiter, executor, _convert_chunk, chunk, fingerprint_engine)):
+                    yield issue
+
+            if duplicate_filter.duplicates:
+                logger.info("Removed %d duplicated qmllint issues", duplicate_filter.duplicates)
+    finally:
+        await asyncio.get_running_loop().run_in_executor(None, stack.close)
@@ -0,0 +1,320 @@
+"""Module comparing a conversion against a baseline Code Quality report, to keep only the new issues.
+
+The fingerprints of the baseline report are stored in an SQLite index on disk, built once and reused while the report
+does not change. Each converted issue is then looked up in the index as it is streamed: only the issues whose
+fingerprint is not in the baseline are written. The issues of the baseline that were not found anymore are the fixed
+ones, and can be written in a separate report.
+
+The lookups go through the unique index of the fingerprints, so they stay fast when the baseline holds millions of
+issues, and neither report is loaded in memory.
+
+:Example:
+
+    ```python
+    with BaselineIndex.open("baseline/codequality.json") as baseline_index:
+        convert_file("qmllint.json", "new-issues.json", baseline_index=baseline_index)
+        baseline_index.write_fixed("fixed-issues.json")
+    ```
+"""
+
+import contextlib
+import json
+import logging
+import os
+from types import TracebackType
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+from qmllint_codequality import codequality, compression, dedup, jsoncodec, stream
+
+if TYPE_CHECKING:
+    import sqlite3
+
+logger = logging.getLogger(__name__)
+
+INDEX_SUFFIX = ".index"
+"""Suffix added to the path of the baseline report, to get the path of its index when none is given."""
+
+INDEX_FORMAT = "1"
+"""Version of the layout of the index, an index of another version is built again."""
+
+BATCH_SIZE = 10000
+"""Number of rows inserted in the index in a single statement."""
+
+
+def _report_state(report_path: str) -> str:
+    """Get the state of a report, changing when the report is modified.
+
+    :param report_path: The path of the report.
+    :type report_path: str
+    :raises OSError: The report does not exist.
+    :return: The format of the index, the modification time in nanoseconds, and the size of the report.
+    :rtype: str
+    """
+    status = os.stat(report_path)
+    return f"{INDEX_FORMAT}:{status.st_mtime_ns}:{status.st_size}"
+
+
+def _batched(items: Iterable[tuple[bytes, str]], size: int) -> Iterator[list[tuple[bytes, str]]]:
+    """Group the rows to insert into batches.
+
+    :param items: The rows.
+    :type items: Iterable[tuple[bytes, str]]
+    :param size: Maximal number of rows in a batch.
+    :type size: int
+    :yield: The batches.
+    :rtype: Iterator[list[tuple[bytes, str]]]
+    """
+    batch = []
+
+    for item in items:
+        batch.append(item)
+
+        if len(batch) >= size:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
+
+
+class BaselineIndex:
+    """Index of the fingerprints of a baseline report, filtering out the issues already present in it."""
+
+    def __init__(self, index_path: str | os.PathLike) -> None:
+        """Open an index already built.
+
+        :param index_path: The path of the index.
+        :type index_path: str | os.PathLike
+        """
+        self.index_path = os.fspath(index_path)
+        """The path of the index."""
+
+        self.new = 0
+        """Number of issues not found in the baseline."""
+
+        self.known = 0
+        """Number of issues found in the baseline."""
+
+        import sqlite3  # pylint: disable=import-outside-toplevel  # Only needed with --baseline
+
+        self._connection: sqlite3.Connection = sqlite3.connect(self.index_path, isolation_level=None)
+        """Connection to the index, holding the issues found in the temporary table ``found``."""
+
+        self._connection.execute("CREATE TEMPORARY TABLE found (digest BLOB PRIMARY KEY) WITHOUT ROWID")
+
+        self._found: list[tuple[bytes]] = []
+        """Digests of the issues found in the baseline, not inserted in the table ``found`` yet."""
+
+    @classmethod
+    def build(cls, report_path: str | os.PathLike, index_path: str | os.PathLike) -> "BaselineIndex":
+        """Build the index of a baseline report, replacing the existing one atomically.
+
+        :param report_path: The path of the baseline report (Code Quality JSON), possibly compressed.
+        :type report_path: str | os.PathLike
+        :param index_path: The path of the index.
+        :type index_path: str | os.PathLike
+        :raises OSError: The report cannot be read.
+        :raises ValueError: The report is not a valid Code Quality JSON report.
+        :return: The index.
+        :rtype: BaselineIndex
+        """
+        # pylint: disable-next=import-outside-toplevel  # Only needed with --baseline, slow to import
+        import sqlite3
+        import tempfile  # pylint: disable=import-outside-toplevel
+
+        report_path = os.fspath(report_path)
+        state = _report_state(report_path)
+        index_path = os.path.abspath(index_path)
+        os.makedirs(os.path.dirname(index_path), exist_ok=True)  # Ensure that the destination folder exist
+
+        logger.info("Indexing the baseline '%s'", report_path)
+
+        file_descriptor, temporary_path = tempfile.mkstemp(suffix=INDEX_SUFFIX, dir=os.path.dirname(index_path))
+        os.close(file_descriptor)
+        replaced = False
+
+        try:
+            with (
+                open(report_path, "rb") as report_file,
+                compression.open_input(report_file) as report,
+                contextlib.closing(sqlite3.connect(temporary_path)) as connection,
+            ):
+                connection.execute("PRAGMA journal_mode = OFF")
+                connection.execute("PRAGMA synchronous = OFF")
+                connection.execute("CREATE TABLE metadata (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+
+                # The rowid keeps the order of the report, the unique index serves the lookups
+                connection.execute("CREATE TABLE issues (digest BLOB NOT NULL UNIQUE, issue TEXT NOT NULL)")
+
+                rows = (
+                    (dedup.fingerprint_digest(issue["fingerprint"]), json.dumps(issue, ensure_ascii=False))
+                    for issue in stream.iter_report_issues(report)
+                )
+
+                with connection:
+                    for batch in _batched(rows, BATCH_SIZE):
+                        connection.executemany("INSERT OR IGNORE INTO issues VALUES (?, ?)", batch)
+
+                    connection.execute("INSERT INTO metadata VALUES ('state', ?)", (state,))
+
+            os.replace(temporary_path, index_path)
+            replaced = True
+        except (KeyError, TypeError) as error:
+            raise ValueError(f"Invalid Code Quality issue in '{report_path}': {error!r}") from error
+        finally:
+            if not replaced:  # The index being built is removed, whatever interrupted it
+                os.remove(temporary_path)
+
+        return cls(index_path)
+
+    @classmethod
+    def open(cls, report_path: str | os.PathLike, index_path: str | os.PathLike | None = None) -> "BaselineIndex":
+        """Open the index of a baseline report, building it if it does not exist or if the report changed.
+
+        :param report_path: The path of the baseline report (Code Quality JSON).
+        :type report_path: str | os.PathLike
+        :param index_path: The path of the index, None for the path of the report followed by ``INDEX_SUFFIX``,
+            defaults to None
+        :type index_path: str | os.PathLike | None, optional
+        :raises OSError: The report cannot be read.
+        :raises ValueError: The report is not a valid Code Quality JSON report.
+        :return: The index.
+        :rtype: BaselineIndex
+        """
+        import sqlite3  # pylint: disable=import-outside-toplevel  # Only needed with --baseline
+
+        if index_path is None:
+            index_path = os.fspath(report_path) + INDEX_SUFFIX
+
+        if os.path.isfile(index_path):
+            uri = f"file:{os.path.abspath(index_path)}?mode=ro"
+
+            try:
+                with contextlib.closing(sqlite3.connect(uri, uri=True)) as connection:
+                    (state,) = connection.execute("SELECT value FROM metadata WHERE key = 'state'").fetchone()
+            except (sqlite3.Error, TypeError):
+                state = None  # Not an index, or an index being built
+
+            if state == _report_state(os.fspath(report_path)):
+                logger.info("Reusing the index '%s' of the baseline", index_path)
+                return cls(index_path)
+
+        return cls.build(report_path, index_path)
+
+    def __len__(self) -> int:
+        """Get the number of distinct issues in the baseline.
+
+        :return: The number of issues.
+        :rtype: int
+        """
+        return self._connection.execute("SELECT COUNT(*) FROM issues").fetchone()[0]
+
+    def __enter__(self) -> "BaselineIndex":
+        """Use the index in a ``with`` statement, closing it at the end.
+
+        :return: The index.
+        :rtype: BaselineIndex
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the index.
+
+        :param exc_type: The type of the exception raised in the ``with`` statement, if any.
+        :type exc_type: type[BaseException] | None
+        :param exc_value: The exception raised in the ``with`` statement, if any.
+        :type exc_value: BaseException | None
+        :param traceback: The traceback of the exception, if any.
+        :type traceback: TracebackType | None
+        """
+        self.close()
+
+    def close(self) -> None:
+        """Close the connection to the index."""
+        self._connection.close()
+
+    def _flush(self) -> None:
+        """Record the digests of the issues found in the baseline, in a single transaction."""
+        if not self._found:
+            return
+
+        with self._connection:
+            self._connection.execute("BEGIN")
+            self._connection.executemany("INSERT OR IGNORE INTO found VALUES (?)", self._found)
+
+        self._found.clear()
+
+    def __call__(self, issues: Iterable[codequality.Report]) -> Iterator[codequality.Report]:
+        """Filter out the issues present in the baseline.
+
+        :param issues: The issues to filter.
+        :type issues: Iterable[codequality.Report]
+        :yield: The issues not present in the baseline.
+        :rtype: Iterator[codequality.Report]
+        """
+        lookup = "SELECT 1 FROM issues WHERE digest = ?"
+
+        for issue in issues:
+            digest = dedup.fingerprint_digest(issue["fingerprint"])
+
+            if self._connection.execute(lookup, (digest,)).fetchone() is None:
+                self.new += 1
+                yield issue
+                continue
+
+            self.known += 1
+            self._found.append((digest,))
+
+            if len(self._found) >= BATCH_SIZE:
+                self._flush()
+
+        self._flush()
+
+    def iter_fixed(self) -> Iterator[codequality.Report]:
+        """Iterate over the issues of the baseline not found by the conversions, in the order of the baseline.
+
+        :return: An iterator over the fixed issues.
+        :rtype: Iterator[codequality.Report]
+        """
+        self._flush()
+
+        for (issue,) in self._connection.execute(
+            "SELECT issue FROM issues WHERE digest NOT IN (SELECT digest FROM temp.found) ORDER BY rowid"
+        ):
+            yield json.loads(issue)
+
+    def write_fixed(
+        self,
+        output_file_path: str | os.PathLike,
+        indent: int | None = None,
+        codec: jsoncodec.Codec | None = None,
+        compression_level: int | None = None,
+    ) -> int:
+        """Write the issues of the baseline not found by the conversions into a Code Quality JSON report.
+
+        :param output_file_path: The path of the report, compressed if its extension is one of
+            ``compression.EXTENSIONS``.
+        :type output_file_path: str | os.PathLike
+        :param indent: The indentation level, None for the most compact representation, defaults to None
+        :type indent: int | None, optional
+        :param codec: The codec encoding the issues, None for the fastest one installed, defaults to None
+        :type codec: jsoncodec.Codec | None, optional
+        :param compression_level: The compression level of a compressed report, None for the default one,
+            defaults to None
+        :type compression_level: int | None, optional
+        :return: The number of fixed issues.
+        :rtype: int
+        """
+        if directory := os.path.dirname(output_file_path):
+            os.makedirs(directory, exist_ok=True)  # Ensure that the destination folder exist
+
+        with (
+            open(output_file_path, "wb") as ou_f,
+            compression.open_output(ou_f, compression.from_path(output_file_path), compression_level) as output,
+        ):
+            return stream.write_array(self.iter_fixed(), output, indent, codec)
@@ -0,0 +1,151 @@
+"""Module reading and writing compressed reports, with the compression modules of the standard library.
+
+The compressed reports are decompressed, and compressed, as they are streamed, so they are never held in memory nor
+written uncompressed on disk. The supported compressions are:
+
+- ``gzip``: the ``.gz`` files,
+- ``xz``: the ``.xz`` files,
+- ``bz2``: the ``.bz2`` files.
+
+The compression of an input is detected from its first bytes, so a compressed report is read whatever its name, even
+from the standard input. The compression of an output is chosen from the extension of its path.
+
+:Example:
+
+    ```python
+    convert_file("qmllint.json.gz", "codequality.json.xz", compression_level=9)
+    ```
+"""
+
+import io
+import logging
+import os
+from typing import IO, TYPE_CHECKING, cast
+
+if TYPE_CHECKING:
+    import bz2
+    import gzip
+    import lzma
+
+logger = logging.getLogger(__name__)
+
+EXTENSIONS = {".gz": "gzip", ".xz": "xz", ".bz2": "bz2"}
+"""The compression of the files, by extension."""
+
+MAGIC_NUMBERS = {b"\x1f\x8b": "gzip", b"\xfd7zXZ\x00": "xz", b"BZh": "bz2"}
+"""The compression of the files, by the bytes they start with."""
+
+DEFAULT_LEVEL = 6
+"""The compression level used when none is given, from 1 (fastest) to 9 (smallest)."""
+
+WRITE_BUFFER_SIZE = 1 << 16
+"""Number of bytes gathered before being given to the compressor."""
+
+
+def from_path(path: str | os.PathLike) -> str | None:
+    """Get the compression of a file from the extension of its path.
+
+    :param path: The path of the file.
+    :type path: str | os.PathLike
+    :return: The compression, one of ``EXTENSIONS``, None if the file is not compressed.
+    :rtype: str | None
+    """
+    return EXTENSIONS.get(os.path.splitext(os.fspath(path))[1].lower())
+
+
+def detect(file: io.BufferedReader) -> str | None:
+    """Get the compression of a file from its first bytes, without consuming them.
+
+    :param file: The file, that must support ``peek``.
+    :type file: io.BufferedReader
+    :return: The compression, one of ``EXTENSIONS``, None if the file is not compressed.
+    :rtype: str | None
+    """
+    header = file.peek(max(map(len, MAGIC_NUMBERS)))
+    return next((name for magic, name in MAGIC_NUMBERS.items() if header.startswith(magic)), None)
+
+
+def open_input(file: IO[bytes]) -> IO[bytes]:
+    """Wrap a binary stream, to decompress it while it is read if it is compressed.
+
+    A stream without ``peek`` is buffered first: closing the returned stream then closes the given one.
+
+    :param file: The binary stream.
+    :type file: IO[bytes]
+    :return: The decompressed stream, or the given one, possibly buffered, if it is not compressed.
+    :rtype: IO[bytes]
+    """
+    if hasattr(file, "peek"):
+        reader = cast(io.BufferedReader, file)
+    else:
+        reader = io.BufferedReader(cast(io.RawIOBase, file))
+
+    compression = detect(reader)
+
+    # pylint: disable=import-outside-toplevel  # Only needed for compressed reports, slow to import
+    if compression == "gzip":
+        import gzip
+
+        logger.debug("Decompressing the gzip input")
+        # GzipFile implements the binary file interface, without declaring it
+        return cast(IO[bytes], gzip.GzipFile(fileobj=reader, mode="rb"))
+
+    if compression == "xz":
+        import lzma
+
+        logger.debug("Decompressing the xz input")
+        return lzma.LZMAFile(reader, "rb")
+
+    if compression == "bz2":
+        import bz2
+
+        logger.debug("Decompressing the bz2 input")
+        return bz2.BZ2File(reader, "rb")
+
+    return reader
+
+
+def open_output(file: IO[bytes], compression: str | None, level: int | None = None) -> IO[bytes]:
+    """Wrap a binary stream, to compress what is written into it.
+
+    The compressed stream must be closed to write the end of the compressed data. Closing it does not close the given
+    stream.
+
+    :param file: The binary stream receiving the compressed data.
+    :type file: IO[bytes]
+    :param compression: The compression, one of ``EXTENSIONS``, None to not compress.
+    :type compression: str | None
+    :param level: The compression level, from 1 (fastest) to 9 (smallest), None for ``DEFAULT_LEVEL``,
+        defaults to None
+    :type level: int | None, optional
+    :raises ValueError: The compression does not exist.
+    :return: The compressing stream, or the given one if no compression is requested.
+    :rtype: IO[bytes]
+    """
+    if compression is None:
+        return file
+
+    level = DEFAULT_LEVEL if level is None else level
+    compressor: "gzip.GzipFile | lzma.LZMAFile | bz2.BZ2File"
+
+    # pylint: disable=import-outside-toplevel  # Only needed for compressed reports, slow to import
+    if compression == "gzip":
+        import gzip
+
+        # No modification time nor file name, so the same issues give the same file
+        compressor = gzip.GzipFile(filename="", fileobj=file, mode="wb", compresslevel=level, mtime=0)
+    elif compression == "xz":
+        import lzma
+
+        compressor = lzma.LZMAFile(file, "wb", preset=level)
+    elif compression == "bz2":
+        import bz2
+
+        compressor = bz2.BZ2File(file, "wb", compresslevel=level)
+    else:
+        raise ValueError(f"Unknown compression '{compression}', expecting one of {', '.join(EXTENSIONS.values())}")
+
+    logger.debug("Compressing the output with %s, level %d", compression, level)
+
+    # The issues are written one at a time: gather them, as each call to the compressor is costly
+    return io.BufferedWriter(compressor, WRITE_BUFFER_SIZE)
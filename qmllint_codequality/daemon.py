@@ -0,0 +1,239 @@
+"""Module providing a conversion server listening on a Unix domain socket.
+
+Converting a small report costs less than starting the Python interpreter and importing this package. The server keeps
+them ready, with the compiled rules, the classification cache and the fingerprint engines, and converts the reports
+sent by the client ``qmllint_codequality_client``. When no server is running, the client converts the report itself.
+
+A request is a single JSON line giving the absolute paths of the report and of the output file, and the fingerprint
+engine. The response is a single JSON line giving the number of issues written, or an error and its reason, one of
+``qmllint_codequality_client.ERROR_REASONS``. The server and its clients run on the same machine, so the server reads
+and writes the files directly.
+
+:Example:
+
+    ```shell
+    qmllint-codequality-server &
+    qmllint-codequality-client qmllint.json codequality.json
+    ```
+"""
+
+import argparse
+import json
+import logging
+import os
+import signal
+import socket
+import socketserver
+import sys
+from typing import Any
+
+from qmllint_codequality import (
+    __project__,
+    __version__,
+    add_verbosity_argument,
+    convert_file,
+    fingerprint,
+    qmllint,
+)
+from qmllint_codequality_client import (
+    REASON_CONVERSION,
+    REASON_FINGERPRINT,
+    REASON_REQUEST,
+    REASON_VERSION,
+    default_socket_path,
+)
+
+logger = logging.getLogger(__name__)
+
+MAX_REQUEST_SIZE = 64 * 1024
+"""Maximal size of a request, in bytes."""
+
+_UnixStreamServer: type[socketserver.BaseServer] = getattr(socketserver, "UnixStreamServer", socketserver.BaseServer)
+"""Base class of the server, only available on the platforms supporting Unix domain sockets."""
+
+
+class _ConversionHandler(socketserver.StreamRequestHandler):
+    """Handler of a conversion request."""
+
+    server: "ConversionServer"
+
+    def handle(self) -> None:
+        """Read the request, convert the report, and write the response."""
+        if not (line := self.rfile.readline(MAX_REQUEST_SIZE)):
+            return  # Connection only checking that the server is running
+
+        try:
+            response = self.server.convert(json.loads(line))
+        except (KeyError, TypeError, ValueError) as error:
+            response = {"error": f"invalid request: {error!r}", "reason": REASON_REQUEST}
+
+        self.wfile.write(json.dumps(response).encode("utf8") + b"\n")
+
+
+class ConversionServer(_UnixStreamServer):  # type: ignore[misc,valid-type]
+    """Server converting the reports sent over a Unix domain socket, one at a time.
+
+    The requests are handled sequentially, so the caches shared by the conversions are never accessed concurrently.
+    """
+
+    def __init__(self, socket_path: str | os.PathLike) -> None:
+        """Initialize a new server, and bind its socket.
+
+        :param socket_path: The path of the socket. A socket left by a server that is not running anymore is replaced.
+        :type socket_path: str | os.PathLike
+        :raises OSError: Another server is already listening on the socket.
+        """
+        self._engines: dict[tuple[str, str | None], fingerprint.FingerprintEngine] = {}
+        """The fingerprint engines already created, by name and source root."""
+
+        if os.path.exists(socket_path):
+            if _is_listening(os.fspath(socket_path)):
+                raise OSError(f"A server is already listening on '{os.fspath(socket_path)}'")
+
+            os.remove(socket_path)
+
+        super().__init__(os.fspath(socket_path), _ConversionHandler)
+
+    def server_bind(self) -> None:
+        """Bind the socket, readable and writable by the current user only."""
+        umask = os.umask(0o077)
+
+        try:
+            super().server_bind()
+        finally:
+            os.umask(umask)
+
+    def server_close(self) -> None:
+        """Close the socket, and remove its file."""
+        super().server_close()
+
+        try:
+            os.remove(self.server_address)  # type: ignore[arg-type]
+        except OSError:
+            pass
+
+    def engine(self, name: str, source_root: str | None) -> fingerprint.FingerprintEngine:
+        """Get a fingerprint engine, created on first use and reused by the following conversions.
+
+        :param name: The name of the engine.
+        :type name: str
+        :param source_root: Directory against which the relative file names are resolved.
+        :type source_root: str | None
+        :raises KeyError: The engine does not exist.
+        :return: The engine.
+        :rtype: fingerprint.FingerprintEngine
+        """
+        if (engine := self._engines.get((name, source_root))) is None:
+            engine = self._engines[name, source_root] = fingerprint.create_engine(name, source_root)
+
+        return engine
+
+    def convert(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Convert a report.
+
+        The errors of the conversion are reported to the client, and do not stop the server.
+
+        :param request: The request, giving the paths of the report and of the output file, and the fingerprint engine.
+        :type request: dict[str, Any]
+        :raises KeyError: A mandatory field is missing.
+        :return: The response, giving the number of issues written, or an error and its reason.
+        :rtype: dict[str, Any]
+        """
+        if request.get("version") != __version__:
+            return {
+                "error": f"server version {__version__} differs from client version {request.get('version')}",
+                "reason": REASON_VERSION,
+            }
+
+        input_file_path, output_file_path = request["input"], request["output"]
+
+        try:
+            engine = self.engine(request["fingerprint"], request.get("source_root"))
+        except KeyError as error:
+            return {"error": f"unknown fingerprint engine {error}", "reason": REASON_FINGERPRINT}
+
+        logger.info("Converting '%s' to '%s'", input_file_path, output_file_path)
+
+        try:
+            return {"issues": convert_file(input_file_path, output_file_path, fingerprint_engine=engine)}
+        except Exception as error:  # pylint: disable=broad-exception-caught  # The server serves the next requests
+            logger.exception("Cannot convert '%s'", input_file_path)
+            return {"error": f"cannot convert '{input_file_path}': {error!r}", "reason": REASON_CONVERSION}
+
+
+def _is_listening(socket_path: str) -> bool:
+    """Check if a server is listening on a socket.
+
+    :param socket_path: The path of the socket.
+    :type socket_path: str
+    :return: True if a connection can be established.
+    :rtype: bool
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(socket_path)
+        except OSError:
+            return False
+
+    return True
+
+
+def serve(socket_path: str | os.PathLike | None = None) -> None:
+    """Run a conversion server, until it is interrupted or terminated.
+
+    :param socket_path: The path of the socket, None for the default one, defaults to None
+    :type socket_path: str | os.PathLike | None, optional
+    :raises OSError: The server cannot listen on the socket.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        raise OSError("Unix domain sockets are not supported on this platform")
+
+    qmllint.precompile()
+
+    with ConversionServer(socket_path or default_socket_path()) as server:
+        # Terminating the server closes its socket
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+        logger.info("Listening on '%s'", server.server_address)
+
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+def _get_args() -> argparse.Namespace:
+    """Parse the command line options of the server.
+
+    :return: The parsed options
+    :rtype: argparse.Namespace
+    """
+    parser = argparse.ArgumentParser(
+        formatter_class=argparse.RawTextHelpFormatter, prog=f"{__project__}-server", description=__doc__
+    )
+
+    parser.add_argument("--socket", help="path of the socket (default: %(default)s)", default=default_socket_path())
+    add_verbosity_argument(parser)
+
+    return parser.parse_args()
+
+
+def serve_main() -> int:
+    """Run a conversion server, at the command line.
+
+    :return: 0 if the server stopped normally, 1 if it could not start.
+    :rtype: int
+    """
+    args = _get_args()
+    logging.basicConfig(level=args.verbosity, format="%(asctime)s %(levelname)s : %(message)s")
+
+    try:
+        serve(args.socket)
+    except OSError as error:
+        logger.error("Cannot start the server: %s", error)
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(serve_main())
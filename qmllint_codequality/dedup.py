@@ -0,0 +1,180 @@
+"""Module removing the duplicated Code Quality issues, as they are streamed to the output file.
+
+qmllint may report the same warning twice, and the merged reports often share issues. GitLab drops, or miscounts, the
+issues sharing a fingerprint, so only the first one is written.
+
+The fingerprints seen are kept as binary digests, half the size of their hexadecimal string. For very large merged
+reports, they can be spilled to a temporary SQLite database on disk, once a given number of them is held in memory.
+The database is created in the temporary directory chosen by SQLite, such as ``$SQLITE_TMPDIR`` or ``$TMPDIR``, and
+removed when the filter is closed.
+
+:Example:
+
+    ```python
+    with DuplicateFilter(max_memory_digests=1_000_000) as duplicate_filter:
+        convert_files(["shards/"], "codequality.json", duplicate_filter=duplicate_filter)
+
+    print(duplicate_filter.duplicates)
+    ```
+"""
+
+import hashlib
+import logging
+from types import TracebackType
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+from qmllint_codequality import codequality
+
+if TYPE_CHECKING:
+    import sqlite3
+
+logger = logging.getLogger(__name__)
+
+DIGEST_SIZE = 16
+"""Size in bytes of the digest of a fingerprint that is not an hexadecimal string."""
+
+
+def fingerprint_digest(fingerprint: str) -> bytes:
+    """Convert a fingerprint into a compact binary digest.
+
+    :param fingerprint: The fingerprint, usually an hexadecimal string.
+    :type fingerprint: str
+    :return: The bytes of the hexadecimal string, or a BLAKE2b digest of the fingerprint if it is not hexadecimal.
+    :rtype: bytes
+    """
+    try:
+        return bytes.fromhex(fingerprint)
+    except ValueError:
+        return hashlib.blake2b(fingerprint.encode("utf8"), digest_size=DIGEST_SIZE).digest()
+
+
+class DuplicateFilter:
+    """Filter removing the issues whose fingerprint has already been seen.
+
+    The filter is not reset between two calls, so a filter used by several conversions removes the issues already
+    written by the previous ones.
+    """
+
+    def __init__(self, max_memory_digests: int | None = None) -> None:
+        """Initialize a new filter, without any fingerprint seen.
+
+        :param max_memory_digests: Number of digests kept in memory, beyond which they are moved to a temporary
+            database on disk. None to keep them all in memory, defaults to None
+        :type max_memory_digests: int | None, optional
+        """
+        self.max_memory_digests = max_memory_digests
+        """Number of digests kept in memory, beyond which they are moved to disk, None for no limit."""
+
+        self.duplicates = 0
+        """Number of issues removed."""
+
+        self._digests: set[bytes] = set()
+        """Digests of the fingerprints seen, not moved to disk yet."""
+
+        self._database: "sqlite3.Connection | None" = None
+        """Temporary database holding the digests moved to disk, None until they are first moved."""
+
+        self._spilled = 0
+        """Number of digests moved to disk."""
+
+    def __len__(self) -> int:
+        """Get the number of distinct fingerprints seen.
+
+        :return: The number of fingerprints.
+        :rtype: int
+        """
+        return len(self._digests) + self._spilled
+
+    def __enter__(self) -> "DuplicateFilter":
+        """Use the filter in a ``with`` statement, removing its temporary database at the end.
+
+        :return: The filter.
+        :rtype: DuplicateFilter
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the filter.
+
+        :param exc_type: The type of the exception raised in the ``with`` statement, if any.
+        :type exc_type: type[BaseException] | None
+        :param exc_value: The exception raised in the ``with`` statement, if any.
+        :type exc_value: BaseException | None
+        :param traceback: The traceback of the exception, if any.
+        :type traceback: TracebackType | None
+        """
+        self.close()
+
+    def close(self) -> None:
+        """Forget the fingerprints seen, and remove the temporary database. The number of duplicates is kept."""
+        self._digests.clear()
+        self._spilled = 0
+
+        if self._database is not None:
+            self._database.close()
+            self._database = None
+
+    def add(self, fingerprint: str) -> bool:
+        """Record a fingerprint as seen.
+
+        :param fingerprint: The fingerprint.
+        :type fingerprint: str
+        :return: True if the fingerprint was not seen before.
+        :rtype: bool
+        """
+        digest = fingerprint_digest(fingerprint)
+
+        if digest in self._digests or (
+            self._database is not None
+            and self._database.execute("SELECT 1 FROM digests WHERE digest = ?", (digest,)).fetchone()
+        ):
+            return False
+
+        self._digests.add(digest)
+
+        if self.max_memory_digests is not None and len(self._digests) >= self.max_memory_digests:
+            self._spill()
+
+        return True
+
+    def _spill(self) -> None:
+        """Move the digests held in memory to the temporary database, created on first use."""
+        if self._database is None:
+            import sqlite3  # pylint: disable=import-outside-toplevel  # Only needed for very large reports
+
+            # An empty file name is a temporary database on disk, removed when it is closed
+            self._database = sqlite3.connect("", isolation_level=None)
+            self._database.execute("PRAGMA journal_mode = OFF")
+            self._database.execute("PRAGMA synchronous = OFF")
+            self._database.execute("CREATE TABLE digests (digest BLOB PRIMARY KEY) WITHOUT ROWID")
+
+            logger.info("More than %d distinct fingerprints, moving them to disk", self.max_memory_digests)
+
+        # A single transaction for the whole batch
+        with self._database:
+            self._database.execute("BEGIN")
+            self._database.executemany("INSERT INTO digests VALUES (?)", ((digest,) for digest in self._digests))
+
+        self._spilled += len(self._digests)
+        self._digests.clear()
+
+    def __call__(self, issues: Iterable[codequality.Report]) -> Iterator[codequality.Report]:
+        """Filter out the issues whose fingerprint has already been seen.
+
+        :param issues: The issues to filter.
+        :type issues: Iterable[codequality.Report]
+        :yield: The issues seen for the first time.
+        :rtype: Iterator[codequality.Report]
+        """
+        for issue in issues:
+            if not self.add(issue["fingerprint"]):
+                self.duplicates += 1
+                logger.debug("Removed the duplicated issue %s", issue["fingerprint"])
+                continue
+
+            yield issue
@@ -0,0 +1,186 @@
+"""Module providing the engines computing the fingerprint of a diagnostic.
+
+GitLab uses the fingerprint to follow an issue from a pipeline to another. Three engines are available:
+
+- ``Md5Fingerprint``: hashes the position and the message of the diagnostic with MD5, computing the same fingerprints
+  as the previous versions of this tool. Any diagnostic located after an edited line gets a new fingerprint. This is
+  the default engine, so upgrading does not report all the existing issues as fixed and new again.
+- ``CoordinatesFingerprint``: hashes the same string with the faster BLAKE2b, changing the fingerprints.
+- ``ContentFingerprint``: hashes the offending source line, once normalized, instead of its position. The fingerprint
+  is kept when lines are added or removed above the diagnostic.
+"""
+
+import hashlib
+import logging
+import os
+from typing import TYPE_CHECKING
+
+from qmllint_codequality import lru
+
+if TYPE_CHECKING:
+    from qmllint_codequality import Diagnostic
+
+logger = logging.getLogger(__name__)
+
+
+class FingerprintEngine:
+    """Base class of the engines computing the fingerprint of a diagnostic."""
+
+    def fingerprint(self, diagnostic: "Diagnostic") -> str:
+        """Compute the fingerprint of a diagnostic.
+
+        :param diagnostic: The diagnostic, whose fingerprint is not set yet.
+        :type diagnostic: Diagnostic
+        :raises NotImplementedError: Must be implemented by the subclasses.
+        :return: The fingerprint, as an hexadecimal string.
+        :rtype: str
+        """
+        raise NotImplementedError
+
+    def reset(self) -> None:
+        """Forget the state kept from the previous diagnostics, before converting a new report."""
+
+
+class Md5Fingerprint(FingerprintEngine):
+    """Engine hashing the string representation of the diagnostic with MD5."""
+
+    def fingerprint(self, diagnostic: "Diagnostic") -> str:
+        """Compute the MD5 of the string representation of the diagnostic.
+
+        :param diagnostic: The diagnostic, whose fingerprint is not set yet.
+        :type diagnostic: Diagnostic
+        :return: The fingerprint, as an hexadecimal string.
+        :rtype: str
+        """
+        return hashlib.md5(str(diagnostic).encode("utf8"), usedforsecurity=False).hexdigest()
+
+
+class CoordinatesFingerprint(FingerprintEngine):
+    """Engine hashing the string representation of the diagnostic, containing its position, with BLAKE2b."""
+
+    def __init__(self, digest_size: int = 16) -> None:
+        """Initialize a new engine.
+
+        :param digest_size: The size of the digest in bytes, defaults to 16
+        :type digest_size: int, optional
+        """
+        self.digest_size = digest_size
+        """The size of the digest in bytes."""
+
+    def fingerprint(self, diagnostic: "Diagnostic") -> str:
+        """Compute the BLAKE2b of the string representation of the diagnostic.
+
+        :param diagnostic: The diagnostic, whose fingerprint is not set yet.
+        :type diagnostic: Diagnostic
+        :return: The fingerprint, as an hexadecimal string.
+        :rtype: str
+        """
+        return hashlib.blake2b(str(diagnostic).encode("utf8"), digest_size=self.digest_size).hexdigest()
+
+
+class ContentFingerprint(CoordinatesFingerprint):
+    """Engine hashing the offending source line of the diagnostic, instead of its position.
+
+    The fingerprint is computed from the file name, the rule, the source line with its whitespaces collapsed, and the
+    number of previous diagnostics of the file having the same rule and the same source line.
+
+    The source files are kept in a bounded cache, and read again once evicted. If the source line cannot be retrieved,
+    the position of the diagnostic is hashed instead. The occurrences are counted for the whole report, whatever the
+    files evicted from the cache, so the engine must be reset before converting another report.
+    """
+
+    def __init__(
+        self, digest_size: int = 16, source_root: str | os.PathLike | None = None, cache_size: int = 16
+    ) -> None:
+        """Initialize a new engine.
+
+        :param digest_size: The size of the digest in bytes, defaults to 16
+        :type digest_size: int, optional
+        :param source_root: Directory against which the relative file names are resolved, None for the current
+            directory, defaults to None
+        :type source_root: str | os.PathLike | None, optional
+        :param cache_size: Number of source files kept in memory, defaults to 16
+        :type cache_size: int, optional
+        """
+        super().__init__(digest_size)
+
+        self.source_root = source_root
+        """Directory against which the relative file names are resolved."""
+
+        self._sources: lru.LRUCache[str, list[str] | None] = lru.LRUCache(cache_size)
+        """The lines of the last source files."""
+
+        self._occurrences: dict[str, dict[str, int]] = {}
+        """The number of occurrences of each fingerprint key, by source file, since the engine was reset."""
+
+    def reset(self) -> None:
+        """Forget the source files read, and the occurrences counted in them."""
+        self._sources.clear()
+        self._occurrences.clear()
+
+    def _read_source(self, filename: str) -> list[str] | None:
+        """Read the lines of a source file.
+
+        :param filename: The path of the source file.
+        :type filename: str
+        :return: The lines of the file, None if it cannot be read.
+        :rtype: list[str] | None
+        """
+        path = os.path.join(self.source_root, filename) if self.source_root is not None else filename
+
+        try:
+            with open(path, "rt", encoding="utf8", errors="replace") as source:
+                return source.read().splitlines()
+        except OSError as error:
+            logger.warning("Cannot read '%s', fingerprint computed from the position: %s", path, error)
+            return None
+
+    def fingerprint(self, diagnostic: "Diagnostic") -> str:
+        """Compute the BLAKE2b of the normalized source line of the diagnostic.
+
+        :param diagnostic: The diagnostic, whose fingerprint is not set yet.
+        :type diagnostic: Diagnostic
+        :return: The fingerprint, as an hexadecimal string.
+        :rtype: str
+        """
+        lines = self._sources.get(diagnostic.filename, self._read_source)
+
+        if lines is None or diagnostic.line is None or not 0 < diagnostic.line <= len(lines):
+            return super().fingerprint(diagnostic)
+
+        key = f"{diagnostic.name.value}\0{' '.join(lines[diagnostic.line - 1].split())}"
+        occurrences = self._occurrences.setdefault(diagnostic.filename, {})
+        occurrence = occurrences[key] = occurrences.get(key, -1) + 1
+
+        return hashlib.blake2b(
+            f"{diagnostic.filename}\0{key}\0{occurrence}".encode("utf8"), digest_size=self.digest_size
+        ).hexdigest()
+
+
+ENGINES: dict[str, type[FingerprintEngine]] = {
+    "coordinates": CoordinatesFingerprint,
+    "content": ContentFingerprint,
+    "md5": Md5Fingerprint,
+}
+"""The available engines, by name."""
+
+DEFAULT_ENGINE: FingerprintEngine = Md5Fingerprint()
+"""The engine used when none is given."""
+
+
+def create_engine(name: str, source_root: str | os.PathLike | None = None) -> FingerprintEngine:
+    """Create an engine from its name.
+
+    :param name: The name of the engine, one of ``ENGINES``.
+    :type name: str
+    :param source_root: Directory against which the relative file names are resolved, by the engines reading the
+        source files. None for the current directory, defaults to None
+    :type source_root: str | os.PathLike | None, optional
+    :raises KeyError: The engine does not exist.
+    :return: The engine.
+    :rtype: FingerprintEngine
+    """
+    if name == "content":
+        return ContentFingerprint(source_root=source_root)
+
+    return ENGINES[name]()
@@ -0,0 +1,324 @@
+"""Module providing the serializers writing the converted issues in the supported output formats.
+
+A serializer writes the issues one at a time, as soon as they are converted, so a single conversion can feed several
+serializers at once, without parsing the report or building the diagnostics again. The available formats are:
+
+- ``codequality``: the GitLab Code Quality JSON report,
+- ``sarif``: a SARIF 2.1.0 log, read by the security dashboards,
+- ``junit``: a JUnit XML report, each issue being a failed test case, read by the test reports,
+- ``ndjson``: the Code Quality issues, one JSON object per line, easy to process with line-oriented tools.
+
+Other formats can be added to ``SERIALIZERS``, by subclassing ``Serializer``.
+
+:Example:
+
+    ```python
+    convert_file("qmllint.json", "codequality.json", extra_outputs=[("sarif", "qmllint.sarif")])
+    ```
+"""
+
+import logging
+import re
+from typing import IO, Callable
+
+from qmllint_codequality import codequality, jsoncodec, stream
+
+logger = logging.getLogger(__name__)
+
+_REGEX_CAPTURE_RULE = re.compile(r"^qmllint\[(.*)\]$")
+"""Regex capturing the rule from the ``check_name`` field of an issue."""
+
+_REGEX_XML_INVALID = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+"""Regex matching the characters that cannot appear in an XML document."""
+
+_XML_ATTRIBUTE_ENTITIES = {"\n": "&#10;", "\r": "&#13;", "\t": "&#9;"}
+"""Character references of the whitespaces that an XML parser would otherwise normalize to spaces in an attribute."""
+
+
+def _rule(issue: codequality.Report) -> str:
+    """Get the rule of an issue.
+
+    :param issue: The Code Quality issue.
+    :type issue: codequality.Report
+    :return: The rule, without the ``qmllint[]`` wrapper of the ``check_name`` field.
+    :rtype: str
+    """
+    check_name = issue["check_name"]
+    return rule_match.group(1) if (rule_match := _REGEX_CAPTURE_RULE.match(check_name)) else check_name
+
+
+def _begin(issue: codequality.Report) -> codequality.Position:
+    """Get the position where an issue begins.
+
+    :param issue: The Code Quality issue.
+    :type issue: codequality.Report
+    :return: The line and the column, both optional.
+    :rtype: codequality.Position
+    """
+    if (positions := issue["location"].get("position")) is None:
+        return {}
+
+    return positions.get("begin", {})
+
+
+class Serializer:
+    """Base class of the serializers, writing the issues in an output format, one at a time."""
+
+    def __init__(self, output: IO[bytes], indent: int | None = None, codec: jsoncodec.Codec | None = None) -> None:
+        """Initialize a new serializer, writing the start of the document.
+
+        :param output: The binary stream receiving the document, encoded in UTF-8.
+        :type output: IO[bytes]
+        :param indent: The indentation level, None for the most compact representation, ignored by the formats
+            without indentation, defaults to None
+        :type indent: int | None, optional
+        :param codec: The codec encoding the JSON values, None for the fastest one installed, defaults to None
+        :type codec: jsoncodec.Codec | None, optional
+        """
+        self.output = output
+        """The binary stream receiving the document."""
+
+        self.indent = indent
+        """The indentation level, None for the most compact representation."""
+
+        self.codec = codec or jsoncodec.create_codec()
+        """The codec encoding the JSON values."""
+
+        self.count = 0
+        """Number of issues written."""
+
+    def write(self, issue: codequality.Report) -> None:
+        """Write an issue.
+
+        :param issue: The Code Quality issue.
+        :type issue: codequality.Report
+        :raises NotImplementedError: Must be implemented by the subclasses.
+        """
+        raise NotImplementedError
+
+    def close(self) -> int:
+        """Write the end of the document. The stream is not closed.
+
+        :return: The number of issues written.
+        :rtype: int
+        """
+        return self.count
+
+
+class CodeQualitySerializer(Serializer):
+    """Serializer writing the GitLab Code Quality JSON report."""
+
+    def __init__(self, output: IO[bytes], indent: int | None = None, codec: jsoncodec.Codec | None = None) -> None:
+        """Initialize a new serializer.
+
+        :param output: The binary stream receiving the document, encoded in UTF-8.
+        :type output: IO[bytes]
+        :param indent: The indentation level, None for the most compact representation, defaults to None
+        :type indent: int | None, optional
+        :param codec: The codec encoding the issues, None for the fastest one installed, defaults to None
+        :type codec: jsoncodec.Codec | None, optional
+        """
+        super().__init__(output, indent, codec)
+
+        self._writer = stream.ArrayWriter(output, indent, self.codec)
+        """The writer of the array of issues."""
+
+    def write(self, issue: codequality.Report) -> None:
+        """Write an issue.
+
+        :param issue: The Code Quality issue.
+        :type issue: codequality.Report
+        """
+        self._writer.write(issue)
+        self.count += 1
+
+    def close(self) -> int:
+        """Write the end of the array.
+
+        :return: The number of issues written.
+        :rtype: int
+        """
+        return self._writer.close()
+
+
+class NdjsonSerializer(Serializer):
+    """Serializer writing the Code Quality issues, one JSON object per line."""
+
+    def write(self, issue: codequality.Report) -> None:
+        """Write an issue, on its own line.
+
+        :param issue: The Code Quality issue.
+        :type issue: codequality.Report
+        """
+        self.output.write(self.codec.dumps(issue))
+        self.output.write(b"\n")
+        self.count += 1
+
+
+class SarifSerializer(Serializer):
+    """Serializer writing a SARIF 2.1.0 log, with a single run.
+
+    The results are written first, and the rules they reference after them, once they are all known.
+    """
+
+    SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+    """The JSON schema of the SARIF logs."""
+
+    INFORMATION_URI = "https://doc.qt.io/qt-6/qtquick-tool-qmllint.html"
+    """The documentation of the tool producing the results."""
+
+    CODE_QUALITY_SEVERITY_TO_SARIF_LEVEL = {
+        codequality.Severity.INFO: "note",
+        codequality.Severity.MINOR: "note",
+        codequality.Severity.MAJOR: "warning",
+        codequality.Severity.CRITICAL: "error",
+        codequality.Severity.BLOCKER: "error",
+    }
+    """The SARIF level of each Code Quality severity."""
+
+    def __init__(self, output: IO[bytes], indent: int | None = None, codec: jsoncodec.Codec | None = None) -> None:
+        """Initialize a new serializer, writing the start of the log.
+
+        :param output: The binary stream receiving the document, encoded in UTF-8.
+        :type output: IO[bytes]
+        :param indent: Unused, the results are written one per line, defaults to None
+        :type indent: int | None, optional
+        :param codec: The codec encoding the results, None for the fastest one installed, defaults to None
+        :type codec: jsoncodec.Codec | None, optional
+        """
+        super().__init__(output, indent, codec)
+
+        self._rules: dict[str, int] = {}
+        """The index of each rule referenced by the results, in the order they are first referenced."""
+
+        self.output.write(f'{{"$schema": "{self.SCHEMA}", "version": "2.1.0", "runs": [{{"results": ['.encode())
+
+    def write(self, issue: codequality.Report) -> None:
+        """Write the result of an issue.
+
+        :param issue: The Code Quality issue.
+        :type issue: codequality.Report
+        """
+        rule = _rule(issue)
+        begin = _begin(issue)
+        region = {}
+
+        if "lines" in begin:
+            region["startLine"] = begin["lines"]
+
+        if "column" in begin:
+            region["startColumn"] = begin["column"]
+
+        location: dict = {"artifactLocation": {"uri": issue["location"]["path"]}}
+
+        if region:
+            location["region"] = region
+
+        result = {
+            "ruleId": rule,
+            "ruleIndex": self._rules.setdefault(rule, len(self._rules)),
+            "level": self.CODE_QUALITY_SEVERITY_TO_SARIF_LEVEL.get(issue["severity"], "warning"),
+            "message": {"text": issue["description"]},
+            "locations": [{"physicalLocation": location}],
+            "partialFingerprints": {"qmllintCodeQuality/v1": issue["fingerprint"]},
+            "properties": {"categories": issue["categories"]},
+        }
+
+        self.output.write(b",\n" if self.count else b"\n")
+        self.output.write(self.codec.dumps(result))
+        self.count += 1
+
+    def close(self) -> int:
+        """Write the rules referenced by the results, and the end of the log.
+
+        :return: The number of issues written.
+        :rtype: int
+        """
+        driver = {
+            "name": "qmllint",
+            "informationUri": self.INFORMATION_URI,
+            "rules": [{"id": rule} for rule in self._rules],
+        }
+
+        self.output.write(b'\n], "tool": {"driver": ' + self.codec.dumps(driver) + b"}}]}\n")
+        return self.count
+
+
+class JUnitSerializer(Serializer):
+    """Serializer writing a JUnit XML report, with a single test suite, where each issue is a failed test case.
+
+    The numbers of tests and failures of the suite are not written, as they are only known at the end.
+    """
+
+    def __init__(self, output: IO[bytes], indent: int | None = None, codec: jsoncodec.Codec | None = None) -> None:
+        """Initialize a new serializer, writing the start of the report.
+
+        :param output: The binary stream receiving the document, encoded in UTF-8.
+        :type output: IO[bytes]
+        :param indent: Unused, the test cases are written one per line, defaults to None
+        :type indent: int | None, optional
+        :param codec: Unused, the report is not a JSON document, defaults to None
+        :type codec: jsoncodec.Codec | None, optional
+        """
+        super().__init__(output, indent, codec)
+
+        # pylint: disable-next=import-outside-toplevel  # Imports urllib, only needed by this format
+        from xml.sax import saxutils
+
+        self._quoteattr: Callable[[str, dict[str, str]], str] = saxutils.quoteattr
+        """Function quoting and escaping an attribute value."""
+
+        self.output.write(b'<?xml version="1.0" encoding="UTF-8"?>\n<testsuites>\n<testsuite name="qmllint">\n')
+
+    def _attribute(self, value: object) -> str:
+        """Quote a value, to be used as an XML attribute.
+
+        :param value: The value.
+        :type value: object
+        :return: The value, quoted and escaped.
+        :rtype: str
+        """
+        return self._quoteattr(_REGEX_XML_INVALID.sub("", str(value)), _XML_ATTRIBUTE_ENTITIES)
+
+    def write(self, issue: codequality.Report) -> None:
+        """Write the test case of an issue.
+
+        :param issue: The Code Quality issue.
+        :type issue: codequality.Report
+        """
+        rule = _rule(issue)
+        path = issue["location"]["path"]
+        begin = _begin(issue)
+        position = f":{begin['lines']}" if "lines" in begin else ""
+        position += f":{begin['column']}" if "column" in begin else ""
+        line = f" line={self._attribute(begin['lines'])}" if "lines" in begin else ""
+
+        testcase = (
+            f"<testcase name={self._attribute(f'{rule} at {path}{position}')} classname={self._attribute(path)}"
+            f" file={self._attribute(path)}{line}>"
+            f"<failure type={self._attribute(rule)} message={self._attribute(issue['description'])}/>"
+            "</testcase>\n"
+        )
+        self.output.write(testcase.encode("utf8"))
+        self.count += 1
+
+    def close(self) -> int:
+        """Write the end of the report.
+
+        :return: The number of issues written.
+        :rtype: int
+        """
+        self.output.write(b"</testsuite>\n</testsuites>\n")
+        return self.count
+
+
+SERIALIZERS: dict[str, type[Serializer]] = {
+    "codequality": CodeQualitySerializer,
+    "sarif": SarifSerializer,
+    "junit": JUnitSerializer,
+    "ndjson": NdjsonSerializer,
+}
+"""The available serializers, by format name."""
+
+DEFAULT_FORMAT = "codequality"
+"""The format of the output file, when none is given."""
@@ -0,0 +1,259 @@
+"""Module archiving the converted issues of each run in an SQLite database, to follow their trend over time.
+
+Each run records its issues in a single transaction, inserted in batches as they are streamed to the output file. The
+database is indexed by rule, directory and file, so questions such as "number of unqualified accesses per directory
+over time" are answered by an indexed lookup, instead of parsing the archived reports again.
+
+The database can be queried directly, with the ``runs`` table giving the identifier and the date of each run, and the
+``issues`` table giving the rule, category, severity, path, directory, position and fingerprint of each issue.
+
+:Example:
+
+    ```python
+    with HistoryStore("history.sqlite") as history_store:
+        convert_file("qmllint.json", "codequality.json", history_run=history_store.run("pipeline-1234"))
+
+        for run_id, created, rule, count in history_store.trend(by="rule"):
+            print(run_id, created, rule, count)
+    ```
+"""
+
+import logging
+import os
+import posixpath
+import time
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
+
+from qmllint_codequality import codequality, dedup
+
+if TYPE_CHECKING:
+    import sqlite3
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 10000
+"""Number of issues inserted in a single statement."""
+
+TREND_COLUMNS = ["rule", "category", "severity", "path", "directory"]
+"""The columns by which the issues can be counted with ``HistoryStore.trend``."""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    run_id TEXT NOT NULL UNIQUE,
+    created REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS issues (
+    run INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    rule TEXT NOT NULL,
+    category TEXT NOT NULL,
+    severity TEXT NOT NULL,
+    path TEXT NOT NULL,
+    directory TEXT NOT NULL,
+    line INTEGER,
+    column INTEGER,
+    fingerprint BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS issues_run ON issues (run);
+CREATE INDEX IF NOT EXISTS issues_rule ON issues (rule, directory, run);
+CREATE INDEX IF NOT EXISTS issues_directory ON issues (directory, run);
+CREATE INDEX IF NOT EXISTS issues_path ON issues (path, run);
+CREATE INDEX IF NOT EXISTS issues_fingerprint ON issues (fingerprint);
+"""
+"""The tables and the indexes of the database, created if they do not exist."""
+
+
+def _row(run: int, issue: codequality.Report) -> tuple[Any, ...]:
+    """Convert an issue into a row of the ``issues`` table.
+
+    :param run: The primary key of the run.
+    :type run: int
+    :param issue: The Code Quality issue.
+    :type issue: codequality.Report
+    :return: The values of the row.
+    :rtype: tuple[Any, ...]
+    """
+    categories: list[codequality.Category] | codequality.Category = issue["categories"]
+    path = issue["location"]["path"]
+    begin = issue["location"].get("position", {}).get("begin", {})
+
+    return (
+        run,
+        issue["check_name"],
+        categories if isinstance(categories, str) else ",".join(categories),
+        issue["severity"],
+        path,
+        posixpath.dirname(path.replace("\\", "/")),
+        begin.get("lines"),
+        begin.get("column"),
+        dedup.fingerprint_digest(issue["fingerprint"]),
+    )
+
+
+class HistoryRun:
+    """A run recording its issues in the history, as they are streamed."""
+
+    def __init__(self, connection: "sqlite3.Connection", run_id: str) -> None:
+        """Initialize a new run.
+
+        :param connection: The connection to the database.
+        :type connection: sqlite3.Connection
+        :param run_id: The identifier of the run, such as the identifier of the CI pipeline.
+        :type run_id: str
+        """
+        self._connection = connection
+        """The connection to the database."""
+
+        self.run_id = run_id
+        """The identifier of the run."""
+
+        self.recorded = 0
+        """Number of issues recorded."""
+
+    def __call__(self, issues: Iterable[codequality.Report]) -> Iterator[codequality.Report]:
+        """Record the issues, in a single transaction committed once all of them have been produced.
+
+        A run recorded again replaces the previous record. If the issues are not all produced, such as when the
+        conversion fails, the transaction is rolled back.
+
+        :param issues: The issues to record.
+        :type issues: Iterable[codequality.Report]
+        :yield: The issues, unchanged.
+        :rtype: Iterator[codequality.Report]
+        """
+        connection = self._connection
+        connection.execute("BEGIN")
+
+        try:
+            connection.execute("DELETE FROM runs WHERE run_id = ?", (self.run_id,))
+            run = connection.execute(
+                "INSERT INTO runs (run_id, created) VALUES (?, ?)", (self.run_id, time.time())
+            ).lastrowid
+            assert run is not None, "An INSERT always sets the rowid of the cursor"
+            batch: list[tuple[Any, ...]] = []
+            recorded = 0
+
+            for issue in issues:
+                batch.append(_row(run, issue))
+                recorded += 1
+
+                if len(batch) >= BATCH_SIZE:
+                    connection.executemany("INSERT INTO issues VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", batch)
+                    batch.clear()
+
+                yield issue
+
+            connection.executemany("INSERT INTO issues VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", batch)
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+        connection.execute("COMMIT")
+        self.recorded = recorded
+
+        logger.info("Recorded %d qmllint issues in the history, as run '%s'", self.recorded, self.run_id)
+
+
+class HistoryStore:
+    """SQLite database holding the issues of each run."""
+
+    def __init__(self, database_path: str | os.PathLike) -> None:
+        """Open the database, creating it if it does not exist.
+
+        :param database_path: The path of the database.
+        :type database_path: str | os.PathLike
+        :raises OSError: The database cannot be opened, or is not a history database.
+        """
+        import sqlite3  # pylint: disable=import-outside-toplevel  # Only needed with --history
+
+        if directory := os.path.dirname(database_path):
+            os.makedirs(directory, exist_ok=True)  # Ensure that the destination folder exist
+
+        self.database_path = os.fspath(database_path)
+        """The path of the database."""
+
+        self._connection: sqlite3.Connection = sqlite3.connect(self.database_path, isolation_level=None)
+        """The connection to the database, whose transactions are managed explicitly."""
+
+        try:
+            self._connection.execute("PRAGMA journal_mode = WAL")
+            self._connection.execute("PRAGMA foreign_keys = ON")
+            self._connection.executescript(_SCHEMA)
+        except sqlite3.Error as error:
+            self._connection.close()
+            raise OSError(f"Cannot open the history database '{self.database_path}': {error}") from error
+
+    def __enter__(self) -> "HistoryStore":
+        """Use the database in a ``with`` statement, closing it at the end.
+
+        :return: The database.
+        :rtype: HistoryStore
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the database.
+
+        :param exc_type: The type of the exception raised in the ``with`` statement, if any.
+        :type exc_type: type[BaseException] | None
+        :param exc_value: The exception raised in the ``with`` statement, if any.
+        :type exc_value: BaseException | None
+        :param traceback: The traceback of the exception, if any.
+        :type traceback: TracebackType | None
+        """
+        self.close()
+
+    def close(self) -> None:
+        """Close the connection to the database."""
+        self._connection.close()
+
+    def run(self, run_id: str) -> HistoryRun:
+        """Create a run, recording the issues given to it.
+
+        :param run_id: The identifier of the run, such as the identifier of the CI pipeline.
+        :type run_id: str
+        :return: The run.
+        :rtype: HistoryRun
+        """
+        return HistoryRun(self._connection, run_id)
+
+    def runs(self) -> list[tuple[str, float]]:
+        """Get the runs recorded, from the oldest to the newest.
+
+        :return: The identifier, and the creation time in seconds since the epoch, of each run.
+        :rtype: list[tuple[str, float]]
+        """
+        return self._connection.execute("SELECT run_id, created FROM runs ORDER BY id").fetchall()
+
+    def trend(self, rule: str | None = None, by: str = "directory") -> list[tuple[str, float, str, int]]:
+        """Count the issues of each run, grouped by a column.
+
+        :param rule: The rule of the counted issues, as written in the ``check_name`` field, None for all the rules,
+            defaults to None
+        :type rule: str | None, optional
+        :param by: The column grouping the issues, one of ``TREND_COLUMNS``, defaults to "directory"
+        :type by: str, optional
+        :raises ValueError: The column cannot group the issues.
+        :return: The identifier and the creation time of the run, the value of the column, and the number of issues,
+            from the oldest run to the newest.
+        :rtype: list[tuple[str, float, str, int]]
+        """
+        if by not in TREND_COLUMNS:
+            raise ValueError(f"Cannot group the issues by '{by}', expecting one of {', '.join(TREND_COLUMNS)}")
+
+        query = f"SELECT runs.run_id, runs.created, issues.{by}, COUNT(*) FROM issues JOIN runs ON runs.id = issues.run"
+        parameters: tuple[str, ...] = ()
+
+        if rule is not None:
+            query += " WHERE issues.rule = ?"
+            parameters = (rule,)
+
+        query += f" GROUP BY issues.run, issues.{by} ORDER BY issues.run, issues.{by}"
+
+        return self._connection.execute(query, parameters).fetchall()
@@ -0,0 +1,187 @@
+"""Module providing the JSON codecs, decoding and encoding JSON values directly from and to bytes.
+
+The reports are read and written as bytes, so they are never decoded, or encoded, as a whole. Two codecs are available:
+
+- ``StdlibCodec``: the ``json`` module of the standard library, always available,
+- ``OrjsonCodec``: the ``orjson`` package, several times faster, used when it is installed.
+
+Both codecs decode the same values. Their encoded output may differ in its whitespace, but not in its values.
+
+Invalid UTF-8 sequences are replaced by the replacement character, with both codecs.
+
+:Example:
+
+    ```python
+    codec = create_codec("auto")
+    codec.dumps(codec.loads(b'{"a": [1, 2]}'), indent=2)
+    ```
+"""
+
+import functools
+import json
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+Buffer = bytes | bytearray | memoryview
+"""The types of the binary buffers that can be decoded."""
+
+
+class Codec:
+    """Base class of the JSON codecs."""
+
+    name = ""
+    """The name of the codec, one of ``CODECS``."""
+
+    def loads(self, data: Buffer) -> Any:
+        """Decode a JSON value.
+
+        :param data: The UTF-8 encoded JSON document.
+        :type data: Buffer
+        :raises NotImplementedError: Must be implemented by the subclasses.
+        :return: The decoded value.
+        :rtype: Any
+        """
+        raise NotImplementedError
+
+    def dumps(self, value: Any, indent: int | None = None) -> bytes:
+        """Encode a JSON value.
+
+        :param value: The value to encode.
+        :type value: Any
+        :param indent: The indentation level, None for the most compact representation, defaults to None
+        :type indent: int | None, optional
+        :raises NotImplementedError: Must be implemented by the subclasses.
+        :return: The UTF-8 encoded JSON document, without trailing newline.
+        :rtype: bytes
+        """
+        raise NotImplementedError
+
+
+class StdlibCodec(Codec):
+    """Codec using the ``json`` module of the standard library."""
+
+    name = "stdlib"
+
+    def loads(self, data: Buffer) -> Any:
+        """Decode a JSON value.
+
+        :param data: The UTF-8 encoded JSON document.
+        :type data: Buffer
+        :raises json.JSONDecodeError: The document is not valid JSON.
+        :return: The decoded value.
+        :rtype: Any
+        """
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+
+        try:
+            return json.loads(data)
+        except UnicodeDecodeError:
+            return json.loads(data.decode("utf8", errors="replace"))
+
+    def dumps(self, value: Any, indent: int | None = None) -> bytes:
+        """Encode a JSON value, with the same layout as ``json.dumps``.
+
+        :param value: The value to encode.
+        :type value: Any
+        :param indent: The indentation level, None for the most compact representation, defaults to None
+        :type indent: int | None, optional
+        :return: The UTF-8 encoded JSON document.
+        :rtype: bytes
+        """
+        return json.dumps(value, ensure_ascii=False, indent=indent).encode("utf8")
+
+
+class OrjsonCodec(Codec):
+    """Codec using the ``orjson`` package.
+
+    ``orjson`` only indents with 2 spaces, the other indentation levels are encoded with the standard library.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        """Initialize a new codec.
+
+        :raises ImportError: ``orjson`` is not installed.
+        """
+        import orjson  # pylint: disable=import-outside-toplevel  # Optional dependency
+
+        self._loads = orjson.loads
+        """The decoding function of ``orjson``."""
+
+        self._dumps = orjson.dumps
+        """The encoding function of ``orjson``."""
+
+        self._decode_error = orjson.JSONDecodeError
+        """The error raised by ``orjson`` when a document cannot be decoded."""
+
+        self._indent_option = orjson.OPT_INDENT_2
+        """The option indenting the encoded document with 2 spaces."""
+
+    def loads(self, data: Buffer) -> Any:
+        """Decode a JSON value.
+
+        :param data: The UTF-8 encoded JSON document.
+        :type data: Buffer
+        :raises json.JSONDecodeError: The document is not valid JSON.
+        :return: The decoded value.
+        :rtype: Any
+        """
+        try:
+            return self._loads(data)
+        except self._decode_error:
+            # Invalid UTF-8 is rejected: decode it with replacement characters, the error is raised again otherwise
+            return self._loads(bytes(data).decode("utf8", errors="replace"))
+
+    def dumps(self, value: Any, indent: int | None = None) -> bytes:
+        """Encode a JSON value.
+
+        :param value: The value to encode.
+        :type value: Any
+        :param indent: The indentation level, None for the most compact representation, defaults to None
+        :type indent: int | None, optional
+        :return: The UTF-8 encoded JSON document.
+        :rtype: bytes
+        """
+        if indent is None:
+            return self._dumps(value)
+
+        if indent == 2:
+            return self._dumps(value, option=self._indent_option)
+
+        return json.dumps(value, ensure_ascii=False, indent=indent).encode("utf8")
+
+
+CODECS: dict[str, type[Codec]] = {
+    "stdlib": StdlibCodec,
+    "orjson": OrjsonCodec,
+}
+"""The available codecs, by name."""
+
+AUTO = "auto"
+"""The name selecting the fastest codec installed."""
+
+
+@functools.cache
+def create_codec(name: str = AUTO) -> Codec:
+    """Get a codec from its name. The codecs are created once, and shared.
+
+    :param name: The name of the codec, one of ``CODECS``, or ``AUTO`` for the fastest one installed,
+        defaults to AUTO
+    :type name: str, optional
+    :raises KeyError: The codec does not exist.
+    :raises ImportError: The package used by the codec is not installed.
+    :return: The codec.
+    :rtype: Codec
+    """
+    if name != AUTO:
+        return CODECS[name]()
+
+    try:
+        return OrjsonCodec()
+    except ImportError:
+        logger.debug("orjson is not installed, using the json module of the standard library")
+        return StdlibCodec()
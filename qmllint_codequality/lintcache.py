@@ -0,0 +1,310 @@
+"""Module providing an on-disk cache of the converted diagnostics of each QML file.
+
+An entry of the cache holds the Code Quality issues of a single QML file. It is identified by a key computed from:
+
+- the content of the QML file, and its path,
+- the content of the ``qmldir`` file, and of the QML components used by the file, found in the directory of the file
+  and in the directories it imports with ``import "<directory>"``,
+- the nearest ``.qmllint.ini`` file,
+- the qmllint version and arguments, and the fingerprint engine with its source root (given as ``salt``).
+
+So a QML file is linted again when it changes, or when one of the components it uses directly changes. The changes of
+the components used indirectly are not detected.
+
+The cache is bounded: when it is larger than its maximal size, the least recently used entries are removed.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+
+from qmllint_codequality import codequality
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+"""Default maximal size of the cache, in bytes."""
+
+SETTINGS_FILE = ".qmllint.ini"
+"""Name of the qmllint settings file."""
+
+_REGEX_TYPE_NAME = re.compile(rb"\b[A-Z][A-Za-z0-9_]*\b")
+"""Regex matching the words that can be the name of a QML component."""
+
+_REGEX_DIRECTORY_IMPORT = re.compile(rb'^\s*import\s+"([^"]+)"', re.MULTILINE)
+"""Regex capturing the directories imported by a QML file."""
+
+
+def _digest(content: bytes) -> str:
+    """Hash a content.
+
+    :param content: The content to hash.
+    :type content: bytes
+    :return: The hash, as an hexadecimal string.
+    :rtype: str
+    """
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+def _file_digest(path: str) -> str:
+    """Hash the content of a file.
+
+    :param path: The path to the file.
+    :type path: str
+    :return: The hash, as an hexadecimal string, an empty string if the file cannot be read.
+    :rtype: str
+    """
+    try:
+        with open(path, "rb") as file:
+            return _digest(file.read())
+    except OSError:
+        return ""
+
+
+def used_names(content: bytes) -> set[str]:
+    """Find the words of a QML file that can be the name of a component.
+
+    :param content: The content of the QML file.
+    :type content: bytes
+    :return: The words.
+    :rtype: set[str]
+    """
+    return {name.decode() for name in _REGEX_TYPE_NAME.findall(content)}
+
+
+def imported_directories(qml_file: str, content: bytes) -> list[str]:
+    """Find the directories whose components a QML file can use: its own directory, and the directories it imports.
+
+    :param qml_file: The path to the QML file.
+    :type qml_file: str
+    :param content: The content of the QML file.
+    :type content: bytes
+    :return: The absolute paths to the directories, starting with the directory of the file.
+    :rtype: list[str]
+    """
+    directory = os.path.dirname(os.path.abspath(qml_file))
+    directories = [directory]
+
+    for imported in _REGEX_DIRECTORY_IMPORT.findall(content):
+        directories.append(os.path.normpath(os.path.join(directory, imported.decode(errors="replace"))))
+
+    return directories
+
+
+class LintCache:
+    """On-disk cache of the Code Quality issues of each QML file."""
+
+    def __init__(self, directory: str | os.PathLike, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        """Initialize a new cache, stored in a directory.
+
+        :param directory: The directory containing the cache, created if it does not exist.
+        :type directory: str | os.PathLike
+        :param max_size: Maximal size of the cache, in bytes, defaults to DEFAULT_MAX_SIZE
+        :type max_size: int, optional
+        """
+        self.directory = os.fspath(directory)
+        """The directory containing the cache."""
+
+        self.max_size = max_size
+        """Maximal size of the cache, in bytes."""
+
+        self._digests: dict[str, str] = {}
+        """Hash of the content of the files already read by ``keys``, by path."""
+
+        self._settings: dict[str, str] = {}
+        """Hash of the nearest settings file, by directory, found by ``keys``."""
+
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _cached_file_digest(self, path: str) -> str:
+        """Hash the content of a file, reading it only once.
+
+        :param path: The path to the file.
+        :type path: str
+        :return: The hash, as an hexadecimal string, an empty string if the file cannot be read.
+        :rtype: str
+        """
+        if (digest := self._digests.get(path)) is None:
+            digest = self._digests[path] = _file_digest(path)
+
+        return digest
+
+    def _settings_digest(self, directory: str) -> str:
+        """Hash the nearest settings file, found in the directory or in one of its parents.
+
+        :param directory: The directory of the QML file.
+        :type directory: str
+        :return: The hash of the settings file, an empty string if there is none.
+        :rtype: str
+        """
+        if (digest := self._settings.get(directory)) is None:
+            if os.path.isfile(settings := os.path.join(directory, SETTINGS_FILE)):
+                digest = self._cached_file_digest(settings)
+            elif (parent := os.path.dirname(directory)) != directory:
+                digest = self._settings_digest(parent)
+            else:
+                digest = ""
+
+            self._settings[directory] = digest
+
+        return digest
+
+    def keys(self, qml_files: list[str], salt: str = "") -> dict[str, str | None]:
+        """Compute the keys of QML files.
+
+        The files shared by several QML files, such as the components and the settings, are read only once.
+
+        :param qml_files: The paths to the QML files.
+        :type qml_files: list[str]
+        :param salt: A value changing all the keys, such as the qmllint version and arguments, defaults to ""
+        :type salt: str, optional
+        :return: The key of each QML file, None if it cannot be read.
+        :rtype: dict[str, str | None]
+        """
+        keys: dict[str, str | None] = {}
+
+        try:
+            for qml_file in qml_files:
+                try:
+                    keys[qml_file] = self._key(qml_file, salt)
+                except OSError as error:
+                    logger.warning("Cannot read '%s', it is not cached: %s", qml_file, error)
+                    keys[qml_file] = None
+        finally:
+            # The files may change before the next call
+            self._digests.clear()
+            self._settings.clear()
+
+        return keys
+
+    def _key(self, qml_file: str, salt: str) -> str:
+        """Compute the key of a QML file.
+
+        :param qml_file: The path to the QML file.
+        :type qml_file: str
+        :param salt: A value changing all the keys.
+        :type salt: str
+        :raises OSError: The QML file cannot be read.
+        :return: The key, as an hexadecimal string.
+        :rtype: str
+        """
+        with open(qml_file, "rb") as file:
+            content = file.read()
+
+        directories = imported_directories(qml_file, content)
+        names = sorted(used_names(content))
+
+        parts = [salt, os.path.abspath(qml_file), _digest(content), self._settings_digest(directories[0])]
+
+        for imported_directory in directories:
+            parts.append(self._cached_file_digest(os.path.join(imported_directory, "qmldir")))
+
+            for name in names:
+                if os.path.isfile(component := os.path.join(imported_directory, f"{name}.qml")):
+                    parts.append(f"{name}:{self._cached_file_digest(component)}")
+
+        return _digest("\0".join(parts).encode("utf8"))
+
+    def _path(self, key: str) -> str:
+        """Get the path of the file holding an entry.
+
+        :param key: The key of the entry.
+        :type key: str
+        :return: The path of the entry.
+        :rtype: str
+        """
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def __contains__(self, key: str) -> bool:
+        """Check if an entry is in the cache.
+
+        :param key: The key of the entry.
+        :type key: str
+        :return: True if the entry is in the cache.
+        :rtype: bool
+        """
+        return os.path.isfile(self._path(key))
+
+    def load(self, key: str) -> list[codequality.Report] | None:
+        """Get the issues of an entry.
+
+        :param key: The key of the entry.
+        :type key: str
+        :return: The issues, None if the entry is not in the cache.
+        :rtype: list[codequality.Report] | None
+        """
+        path = self._path(key)
+
+        try:
+            with open(path, "rb") as entry:
+                issues: list[codequality.Report] = json.load(entry)
+        except (OSError, ValueError):
+            return None
+
+        try:
+            os.utime(path)  # Mark the entry as recently used
+        except OSError:
+            pass
+
+        return issues
+
+    def store(self, key: str, issues: list[codequality.Report]) -> None:
+        """Add an entry to the cache.
+
+        The entry is written atomically, so a cache shared by concurrent jobs is never corrupted.
+
+        :param key: The key of the entry.
+        :type key: str
+        :param issues: The issues of the entry.
+        :type issues: list[codequality.Report]
+        """
+        import tempfile  # pylint: disable=import-outside-toplevel  # Only needed with --cache-dir, slow to import
+
+        path = self._path(key)
+
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+            with tempfile.NamedTemporaryFile("w", encoding="utf8", dir=os.path.dirname(path), delete=False) as entry:
+                json.dump(issues, entry, ensure_ascii=False)
+
+            os.replace(entry.name, path)
+        except OSError as error:
+            logger.warning("Cannot write the cache entry '%s': %s", path, error)
+
+    def evict(self) -> int:
+        """Remove the least recently used entries, until the cache is not larger than its maximal size.
+
+        :return: The number of entries removed.
+        :rtype: int
+        """
+        entries: list[tuple[float, int, str]] = []
+
+        for dirpath, _, filenames in os.walk(self.directory):
+            for filename in filenames:
+                try:
+                    status = os.stat(path := os.path.join(dirpath, filename))
+                except OSError:
+                    continue
+
+                entries.append((status.st_mtime, status.st_size, path))
+
+        size = sum(entry_size for _, entry_size, _ in entries)
+        removed = 0
+
+        for _, entry_size, path in sorted(entries):
+            if size <= self.max_size:
+                break
+
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+
+            size -= entry_size
+            removed += 1
+
+        logger.debug("Removed %d entries from the lint cache", removed)
+        return removed
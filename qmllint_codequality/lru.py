@@ -0,0 +1,151 @@
+"""Module providing a bounded cache, evicting the least recently used entries.
+
+Contrary to ``functools.lru_cache``, the cache can be resized and inspected at runtime, which allows to tune it from
+the command line, and to check that it pays off on a given report.
+
+The cache can be shared between threads. It can also be pickled, or copied, the copy having its own lock.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Generic, Hashable, NamedTuple, TypeVar
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+ValueT = TypeVar("ValueT")
+
+
+class CacheInfo(NamedTuple):
+    """Statistics about the usage of a cache."""
+
+    hits: int
+    """Number of lookups that found their value in the cache."""
+
+    misses: int
+    """Number of lookups that needed to compute their value."""
+
+    maxsize: int
+    """Maximal number of entries kept in the cache."""
+
+    currsize: int
+    """Current number of entries kept in the cache."""
+
+
+class LRUCache(Generic[KeyT, ValueT]):
+    """Cache keeping at most ``maxsize`` entries, evicting the least recently used one first."""
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialize a new empty cache.
+
+        :param maxsize: Maximal number of entries kept in the cache, 0 to disable the cache.
+        :type maxsize: int
+        """
+        self._entries: OrderedDict[KeyT, ValueT] = OrderedDict()
+        """The cached entries, from the least to the most recently used."""
+
+        self._maxsize = 0
+        """Maximal number of entries kept in the cache."""
+
+        self.hits = 0
+        """Number of lookups that found their value in the cache."""
+
+        self.misses = 0
+        """Number of lookups that needed to compute their value."""
+
+        self._lock = threading.Lock()
+        """Lock protecting the entries and the statistics, the values being computed without holding it."""
+
+        self.resize(maxsize)
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Get the state of the cache, without its lock, which cannot be pickled.
+
+        :return: The attributes of the cache, except its lock.
+        :rtype: dict[str, Any]
+        """
+        with self._lock:
+            state = dict(vars(self))
+
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the state of a cache, with a new lock.
+
+        :param state: The attributes of the cache, except its lock.
+        :type state: dict[str, Any]
+        """
+        vars(self).update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def maxsize(self) -> int:
+        """Maximal number of entries kept in the cache.
+
+        :return: The maximal number of entries.
+        :rtype: int
+        """
+        return self._maxsize
+
+    def resize(self, maxsize: int) -> None:
+        """Change the maximal number of entries, evicting the least recently used ones if needed.
+
+        :param maxsize: Maximal number of entries kept in the cache, 0 to disable the cache.
+        :type maxsize: int
+        :raises ValueError: The size is negative.
+        """
+        if maxsize < 0:
+            raise ValueError(f"Cache size must be positive, not {maxsize}")
+
+        with self._lock:
+            self._maxsize = maxsize
+
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def get(self, key: KeyT, compute: Callable[[KeyT], ValueT]) -> ValueT:
+        """Get the value of the key, computing and caching it if not already cached.
+
+        :param key: The key to look for.
+        :type key: KeyT
+        :param compute: Function computing the value from the key, used if it is not cached.
+        :type compute: Callable[[KeyT], ValueT]
+        :return: The value of the key.
+        :rtype: ValueT
+        """
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+
+                return value
+
+        # Not holding the lock, another thread may compute the same value meanwhile
+        value = compute(key)
+
+        with self._lock:
+            if self._maxsize > 0:
+                self._entries[key] = value
+
+                if len(self._entries) > self._maxsize:
+                    self._entries.popitem(last=False)
+
+        return value
+
+    def clear(self) -> None:
+        """Remove all the entries, and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """Get the statistics about the usage of the cache.
+
+        :return: The statistics of the cache.
+        :rtype: CacheInfo
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self._maxsize, len(self._entries))
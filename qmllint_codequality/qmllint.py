@@ -4,6 +4,7 @@ It's mostly TypedDict.
 It facilitate dictionary/JSON manipulation, representing a report in qmllint format.
 """
 
+import functools
 import re
 from enum import Enum, unique
 from typing import TYPE_CHECKING, TypedDict
@@ -16,6 +17,7 @@ class Rules(str, Enum):
     """Enumeration of know rules used by qmllint.
 
     A rule is composed of its name, and a regex patterns used to retrieve the value from a message produced by qmllint.
+    The patterns are compiled on first use only, so importing this module, or running ``--help``, stays cheap.
 
     The special rule UNKNOWN i used in the case where it was not possible tp retrieve the rule from the message.
     """
@@ -34,15 +36,25 @@ class Rules(str, Enum):
         obj._value_ = value
         return obj
 
-    def __init__(self, _: str, patterns: tuple[re.Pattern] | None = None) -> None:
+    def __init__(self, _: str, sources: tuple[str, ...] | None = None) -> None:
         """Initialize a new Rule object.
 
         :param _: The value of the rule (used in __new__, and ignored here)
         :type _: str
-        :param patterns: A list of message pattern, None if unknown, defaults to None
-        :type patterns: tuple[re.Pattern] | None, optional
+        :param sources: A list of message pattern, not compiled yet, None if unknown, defaults to None
+        :type sources: tuple[str, ...] | None, optional
         """
-        self.patterns = patterns
+        self.sources = sources
+        """The message patterns, not compiled, None if unknown."""
+
+    @functools.cached_property
+    def patterns(self) -> tuple[re.Pattern, ...] | None:
+        """The compiled message patterns, None if unknown.
+
+        :return: The patterns, compiled on first access.
+        :rtype: tuple[re.Pattern, ...] | None
+        """
+        return None if self.sources is None else tuple(re.compile(source) for source in self.sources)
 
     @staticmethod
     def from_message(message: str) -> "Rules":
@@ -52,47 +64,48 @@ class Rules(str, Enum):
         :type message: str
         :return: The rule, UNKNOWN if not found.
         :rtype: str
+
+        .. seealso:: precompile
         """
-        for rule in Rules:
-            if rule.patterns is not None:
-                for pattern in rule.patterns:
-                    if pattern.match(message):
-                        return rule
+        dispatcher, rules = _dispatcher()
+
+        if match := dispatcher.match(message):
+            return rules[match.lastgroup]  # type: ignore[index]
 
         return Rules.UNKNOWN
 
     UNKNOWN = ("UnknownRule",)
     """Special type indicating that the rule is not known."""
 
-    ANCHORS_USAGE = ("AnchorsUsage", (re.compile(r"Using anchors here"),))
+    ANCHORS_USAGE = ("AnchorsUsage", (r"Using anchors here",))
     """Warn about anchors that are used not effectively for optimal layout management and performance."""
 
     IMPORT_FAILURE = (
         "ImportFailure",
         (
-            re.compile(r"Warnings occurred while importing module \".*\":"),
-            re.compile(r"Failed to import .*\. Are your import paths set up properly\?"),
-            re.compile(r".* was not found. Did you add all import paths?"),
+            r"Warnings occurred while importing module \".*\":",
+            r"Failed to import .*\. Are your import paths set up properly\?",
+            r".* was not found. Did you add all import paths?",
         ),
     )
     """Warn about failing imports and deprecated qmltypes."""
 
-    UNUSED_IMPORTS = ("UnusedImports", (re.compile(r"Unused import at .*"),))
+    UNUSED_IMPORTS = ("UnusedImports", (r"Unused import at .*",))
     """"Warns about unused QML imports."""
 
     READ_ONLY_PROPERTY = (
         "ReadOnlyProperty",
-        (re.compile(r"Cannot assign to read-only property .*"), re.compile(r".*Can't assign to read-only property .*")),
+        (r"Cannot assign to read-only property .*", r".*Can't assign to read-only property .*"),
     )
     """Warn about writing to read-only properties."""
 
     DEFERRED_PROPERTY_ID = (
         "DeferredPropertyId",
-        (re.compile(r"Could not compile binding for .*: Cannot load property .*"),),
+        (r"Could not compile binding for .*: Cannot load property .*",),
     )
     """Warn about making deferred properties immediate by giving them an id."""
 
-    DUPLICATED_NAME = ("DuplicatedName", (re.compile(r"Found a duplicated id. id .* was first declared at .*"),))
+    DUPLICATED_NAME = ("DuplicatedName", (r"Found a duplicated id. id .* was first declared at .*",))
     """Warns if there are multiple declarations of the same name within the QML file."""
 
     PREFIXED_IMPORT_TYPE = ("PrefixedImportType",)
@@ -100,13 +113,13 @@ class Rules(str, Enum):
 
     ACCESS_SINGLETON_VIA_OBJECT = (
         "AccessSingletonViaObject",
-        (re.compile(r"Cannot load singleton as property of object"),),
+        (r"Cannot load singleton as property of object",),
     )
     """Warns about accessing QML singletons through object instances rather than directly."""
 
     DEPRECATED = (
         "Deprecated",
-        (re.compile(r"Property \".*\" is deprecated.*"),),
+        (r"Property \".*\" is deprecated.*",),
     )
     """Warns about usage of deprecated QML features or APIs."""
 
@@ -116,8 +129,8 @@ class Rules(str, Enum):
     UNRESOLVED_TYPE = (
         "UnresolvedType",
         [
-            re.compile(r".* is used but it is not resolved"),
-            re.compile(r".* was not found. Did you add all import paths\?"),
+            r".* is used but it is not resolved",
+            r".* was not found. Did you add all import paths\?",
         ],
     )
     """Warns if a referenced QML type cannot be resolved."""
@@ -127,7 +140,7 @@ class Rules(str, Enum):
 
     MULTILINE_STRINGS = (
         "MultilineStrings",
-        (re.compile(r"String contains unescaped line terminator which is deprecated."),),
+        (r"String contains unescaped line terminator which is deprecated.",),
     )
     """Warns about the usage of multiline strings, which may impact readability or maintainability.
 
@@ -139,7 +152,7 @@ class Rules(str, Enum):
 
     PROPERTY_ALIAS_CYCLES = (
         "PropertyAliasCycles",
-        (re.compile(r"Alias \".*\" is part of an alias cycle"),),
+        (r"Alias \".*\" is part of an alias cycle",),
     )
     """Warns about cycles in property aliases, which may lead to unexpected behavior."""
 
@@ -151,40 +164,38 @@ class Rules(str, Enum):
 
     ATTACHED_PROPERTY_TYPE = (
         "AttachedPropertyType",
-        (re.compile(r"Using attached type .* already initialized in a parent scope."),),
+        (r"Using attached type .* already initialized in a parent scope.",),
     )
     """Warns about the instantiation of an attached property in an object of the wrong type."""
 
     REQUIRED_PROPERTY = (
         "RequiredProperty",
-        (re.compile(r"Component is missing required property .* from .*"),),
+        (r"Component is missing required property .* from .*",),
     )
     """Warns about missing required properties in QML components."""
 
     WITH_STATEMENT = (
         "WithStatement",
         (
-            re.compile(
-                r"with statements are strongly discouraged in QML and might cause false positives when analysing unqualified identifiers"
-            ),
+            r"with statements are strongly discouraged in QML and might cause false positives when analysing unqualified identifiers",
         ),
     )
     """Warns about usage of the 'with' statement in QML, which is generally discouraged."""
 
-    INHERITANCE_CYCLE = ("InheritanceCycle", (re.compile(r" is part of an inheritance cycle: "),))
+    INHERITANCE_CYCLE = ("InheritanceCycle", (r" is part of an inheritance cycle: ",))
     """Warns about cycles in QML component inheritance."""
 
     UNCREATABLE_TYPE = (
         "UncreatableType",
-        (re.compile(r"Object type is not derived from QObject or QQmlComponent\..*"),),
+        (r"Object type is not derived from QObject or QQmlComponent\..*",),
     )
     """Warns if a QML type cannot be instantiated."""
 
     MISSING_PROPERTY = (
         "MissingProperty",
         (
-            re.compile(r"Property \".*\" not found on type \".*\""),
-            re.compile(r"Cannot assign to non-existent default property"),
+            r"Property \".*\" not found on type \".*\"",
+            r"Cannot assign to non-existent default property",
         ),
     )
     """Warns about missing properties that are expected to be present in QML components.
@@ -197,11 +208,7 @@ class Rules(str, Enum):
 
     INVALID_QMLLINT_DIRECTIVE = (
         "InvalidQmlLintDirective",
-        (
-            re.compile(
-                r"Invalid qmllint directive \".*\" provided",
-            ),
-        ),
+        (r"Invalid qmllint directive \".*\" provided",),
     )
     """Warns about the use of an invalid qmllint directive in a qmllint comment.
 
@@ -212,7 +219,7 @@ class Rules(str, Enum):
 
     COMPILER_WARNINGS = (
         "CompilerWarnings",
-        (re.compile(r"Could not compile binding for .*"),),
+        (r"Could not compile binding for .*",),
     )
     """Warns about potential issues or inconsistencies detected during QML compilation."""
 
@@ -221,11 +228,11 @@ class Rules(str, Enum):
 
     NON_LIST_PROPERTY = (
         "NonListProperty",
-        (re.compile(r"Cannot assign multiple objects to a default non-list property"),),
+        (r"Cannot assign multiple objects to a default non-list property",),
     )
     """Warns about incorrect usage of non-list properties in QML."""
 
-    INCOMPATIBLE_TYPE = ("IncompatibleType", (re.compile(r"Cannot assign to default property of incompatible type"),))
+    INCOMPATIBLE_TYPE = ("IncompatibleType", (r"Cannot assign to default property of incompatible type",))
     """Warns about incompatible types used in QML bindings."""
 
     TOP_LEVEL_COMPONENT = ("TopLevelComponent",)
@@ -237,29 +244,61 @@ class Rules(str, Enum):
     DUPLICATE_PROPERTY_BINDING = (
         "DuplicatePropertyBinding",
         (
-            re.compile(r"Duplicate interceptor on property \".*\""),
-            re.compile(r"Duplicate value source on property \".*\""),
-            re.compile(r"Cannot combine value source and binding on property \".*\""),
+            r"Duplicate interceptor on property \".*\"",
+            r"Duplicate value source on property \".*\"",
+            r"Cannot combine value source and binding on property \".*\"",
         ),
     )
     """Warns about duplicate property bindings in QML components."""
 
-    BAD_SIGNAL_HANDLER_PARAMETERS = ("BadSignalHandlerParameters", (re.compile(r"Declared signal handler \".*\""),))
+    BAD_SIGNAL_HANDLER_PARAMETERS = ("BadSignalHandlerParameters", (r"Declared signal handler \".*\"",))
     """Warns about incorrect parameters in signal handlers."""
 
     UNQUALIFIED_ACCESS = (
         "UnqualifiedAccess",
-        (re.compile(r"Unqualified access"),),
+        (r"Unqualified access",),
     )
     """Warns about unqualified access."""
 
     UNQUALIFIED_ALIAS = (
         "UnresolvedAlias",
-        (re.compile(r"Cannot resolve alias \".*\""),),
+        (r"Cannot resolve alias \".*\"",),
     )
     """Warns about unqualified access."""
 
-    ID_QUOTATION = ("IdQuotation", (re.compile(r"ids do not need quotation marks"),))
+    ID_QUOTATION = ("IdQuotation", (r"ids do not need quotation marks",))
+
+
+@functools.cache
+def _dispatcher() -> tuple[re.Pattern, dict[str, Rules]]:
+    """Compile the patterns of all the rules into a single regex, on first call only.
+
+    Each pattern becomes a named alternative of the regex, in the order of declaration of the rules and of their
+    patterns. As the alternatives are tried from left to right, the first alternative matching a message is the first
+    pattern that would have matched it, when trying them one by one.
+
+    :return: The regex, and the rule associated to the name of each alternative.
+    :rtype: tuple[re.Pattern, dict[str, Rules]]
+    """
+    alternatives: list[str] = []
+    rules: dict[str, Rules] = {}
+
+    for rule in Rules:
+        for source in rule.sources or ():
+            name = f"_{len(alternatives)}"
+            alternatives.append(f"(?P<{name}>{source})")
+            rules[name] = rule
+
+    return re.compile("|".join(alternatives)), rules
+
+
+def precompile() -> None:
+    """Compile the regex classifying the messages now, instead of on the first classification.
+
+    The processes forked afterward, such as the workers of a process pool, inherit the compiled regex, instead of each
+    compiling it again.
+    """
+    _dispatcher()
 
 
 @unique
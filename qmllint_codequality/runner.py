@@ -0,0 +1,156 @@
+"""Module running qmllint on a tree of QML files.
+
+The QML files are split into batches, each batch being linted by its own qmllint process. The processes run in
+parallel, without shell, and their JSON output is read from their standard output, so no temporary file is needed.
+
+:Example:
+
+    ```python
+    for filename, warning in iter_lint_warnings(discover_qml_files(["./qml"])):
+        print(filename, warning["message"])
+    ```
+"""
+
+import io
+import logging
+import os
+import re
+from typing import Iterable, Iterator, Sequence
+
+from qmllint_codequality import qmllint, stream
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QMLLINT = "qmllint"
+"""The qmllint executable used by default, searched in the ``PATH``."""
+
+DEFAULT_BATCH_SIZE = 64
+"""Default number of QML files linted by a single qmllint process."""
+
+_REGEX_CAPTURE_VERSION = re.compile(r"(\d+(?:\.\d+)+)")
+"""Regex used to capture the version of qmllint."""
+
+
+class QmllintError(RuntimeError):
+    """Error raised when qmllint failed to produce a report."""
+
+
+def discover_qml_files(paths: Iterable[str | os.PathLike[str]]) -> list[str]:
+    """Get the QML files to lint.
+
+    The directories are searched recursively for QML files.
+
+    :param paths: The QML files, and the directories containing them.
+    :type paths: Iterable[str | os.PathLike[str]]
+    :return: The QML files, without duplicates, in the order of the arguments and sorted within each directory.
+    :rtype: list[str]
+    """
+    qml_files: dict[str, None] = {}
+
+    for path in [os.fspath(path) for path in paths]:
+        if not os.path.isdir(path):
+            qml_files.setdefault(path)
+            continue
+
+        for dirpath, dirnames, filenames in os.walk(path):
+            dirnames.sort()
+
+            for filename in sorted(filenames):
+                if filename.endswith(".qml"):
+                    qml_files.setdefault(os.path.join(dirpath, filename))
+
+    logger.debug("Find %d QML files", len(qml_files))
+    return list(qml_files)
+
+
+def qmllint_version(executable: str = DEFAULT_QMLLINT) -> str | None:
+    """Get the version of qmllint.
+
+    :param executable: The qmllint executable, defaults to DEFAULT_QMLLINT
+    :type executable: str, optional
+    :return: The version, None if it cannot be determined.
+    :rtype: str | None
+    """
+    import subprocess  # pylint: disable=import-outside-toplevel  # Only needed with --lint, slow to import
+
+    try:
+        result = subprocess.run([executable, "--version"], capture_output=True, check=False, text=True)
+    except OSError as error:
+        logger.warning("Cannot run '%s': %s", executable, error)
+        return None
+
+    if version_match := _REGEX_CAPTURE_VERSION.search(result.stdout):
+        return version_match.group(1)
+
+    return None
+
+
+def _lint_batch(
+    qml_files: Sequence[str], executable: str, arguments: Sequence[str]
+) -> list[tuple[str, qmllint.WarningDetails]]:
+    """Run qmllint on a batch of QML files.
+
+    :param qml_files: The QML files to lint.
+    :type qml_files: Sequence[str]
+    :param executable: The qmllint executable.
+    :type executable: str
+    :param arguments: Additional arguments given to qmllint.
+    :type arguments: Sequence[str]
+    :raises QmllintError: qmllint failed to produce a report.
+    :return: The warnings of the batch, with the name of the file containing them.
+    :rtype: list[tuple[str, qmllint.WarningDetails]]
+    """
+    import subprocess  # pylint: disable=import-outside-toplevel  # Only needed with --lint, slow to import
+
+    command = [executable, "--json", "-", *arguments, "--", *qml_files]
+    logger.debug("Run %s", command)
+
+    try:
+        # qmllint exits with an error code when a warning is found, so the code is not checked
+        result = subprocess.run(command, capture_output=True, check=False)
+    except OSError as error:
+        raise QmllintError(f"Cannot run '{executable}': {error}") from error
+
+    if not result.stdout.strip():
+        raise QmllintError(
+            f"'{executable}' did not produce a report (exit code {result.returncode}): "
+            f"{result.stderr.decode('utf8', errors='replace').strip()}"
+        )
+
+    return list(stream.iter_warnings(io.BytesIO(result.stdout)))
+
+
+def iter_lint_warnings(
+    qml_files: Sequence[str],
+    executable: str = DEFAULT_QMLLINT,
+    arguments: Sequence[str] = (),
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    jobs: int | None = None,
+) -> Iterator[tuple[str, qmllint.WarningDetails]]:
+    """Lint the QML files with qmllint processes running in parallel, and iterate over their warnings.
+
+    :param qml_files: The QML files to lint.
+    :type qml_files: Sequence[str]
+    :param executable: The qmllint executable, defaults to DEFAULT_QMLLINT
+    :type executable: str, optional
+    :param arguments: Additional arguments given to qmllint, such as import paths, defaults to ()
+    :type arguments: Sequence[str], optional
+    :param batch_size: Maximal number of QML files linted by a single qmllint process, defaults to DEFAULT_BATCH_SIZE
+    :type batch_size: int, optional
+    :param jobs: Maximal number of qmllint processes running at the same time, None for the number of processors,
+        defaults to None
+    :type jobs: int | None, optional
+    :raises QmllintError: qmllint failed to produce a report.
+    :return: An iterator over the warnings, with the name of the file containing them, in the order of the QML files.
+    :rtype: Iterator[tuple[str, qmllint.WarningDetails]]
+    """
+    batches = [qml_files[index : index + batch_size] for index in range(0, len(qml_files), batch_size)]
+
+    logger.info("Run qmllint on %d QML files, in %d batches", len(qml_files), len(batches))
+
+    import concurrent.futures  # pylint: disable=import-outside-toplevel  # Only needed to lint the QML files
+
+    # The threads only wait for the qmllint processes, the actual work is done outside of the interpreter
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs or os.cpu_count()) as executor:
+        for warnings in executor.map(_lint_batch, batches, [executable] * len(batches), [arguments] * len(batches)):
+            yield from warnings
@@ -0,0 +1,296 @@
+"""Module collecting statistics about a conversion.
+
+The statistics contain the wall-clock and CPU time spent in each stage of the conversion, the number of warnings
+converted per second, the peak resident memory, the number of issues per rule, severity and file, and the number of
+duplicated issues removed.
+
+The stages are:
+
+- ``parsing``: reading the qmllint report, or waiting for qmllint when it is run by this tool,
+- ``classification``: building the diagnostics, except their fingerprint,
+- ``fingerprinting``: computing the fingerprints,
+- ``conversion``: converting the diagnostics into Code Quality issues, and the work not measured by the other stages,
+- ``serialization``: writing the Code Quality report.
+
+When the conversion runs in several processes, the work done by the other processes is accounted in ``conversion``.
+
+:Example:
+
+    ```python
+    statistics = Statistics()
+    convert_file("qmllint.json", "codequality.json", statistics=statistics)
+    statistics.write()
+    ```
+"""
+
+import collections
+import contextlib
+import json
+import os
+import sys
+import time
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, TextIO, TypeVar
+
+from qmllint_codequality import codequality, fingerprint
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from qmllint_codequality import Diagnostic
+
+ItemT = TypeVar("ItemT")
+ResultT = TypeVar("ResultT")
+
+STAGES = ["parsing", "classification", "fingerprinting", "conversion", "serialization"]
+"""The stages of the conversion, in the order they are reported."""
+
+
+class _Timer:
+    """Accumulator of the wall-clock and CPU time spent in a part of the code."""
+
+    __slots__ = ("wall", "cpu")
+
+    def __init__(self) -> None:
+        """Initialize a new timer, without any time accumulated."""
+        self.wall = 0.0
+        """Accumulated wall-clock time, in seconds."""
+
+        self.cpu = 0.0
+        """Accumulated CPU time of the current process, in seconds."""
+
+
+class TimedFingerprint(fingerprint.FingerprintEngine):
+    """Fingerprint engine measuring the time spent by another engine."""
+
+    def __init__(self, engine: fingerprint.FingerprintEngine, statistics: "Statistics") -> None:
+        """Initialize a new engine.
+
+        :param engine: The engine computing the fingerprints.
+        :type engine: fingerprint.FingerprintEngine
+        :param statistics: The statistics receiving the time spent.
+        :type statistics: Statistics
+        """
+        self.engine = engine
+        """The engine computing the fingerprints."""
+
+        self._statistics = statistics
+        """The statistics receiving the time spent."""
+
+    def fingerprint(self, diagnostic: "Diagnostic") -> str:
+        """Compute the fingerprint of a diagnostic with the wrapped engine.
+
+        :param diagnostic: The diagnostic, whose fingerprint is not set yet.
+        :type diagnostic: Diagnostic
+        :return: The fingerprint, as an hexadecimal string.
+        :rtype: str
+        """
+        return self._statistics.call("fingerprint", self.engine.fingerprint, diagnostic)
+
+    def reset(self) -> None:
+        """Reset the wrapped engine."""
+        self.engine.reset()
+
+
+class Statistics:
+    """Statistics about a conversion."""
+
+    def __init__(self) -> None:
+        """Initialize new statistics, without anything measured."""
+        self._timers: collections.defaultdict[str, _Timer] = collections.defaultdict(_Timer)
+        """Time spent in the measured parts of the code, by name."""
+
+        self.by_rule: collections.Counter[str] = collections.Counter()
+        """Number of issues per rule."""
+
+        self.by_severity: collections.Counter[str] = collections.Counter()
+        """Number of issues per severity."""
+
+        self.by_file: collections.Counter[str] = collections.Counter()
+        """Number of issues per file."""
+
+        self.duplicates = 0
+        """Number of issues removed because their fingerprint was already written."""
+
+    @contextlib.contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        """Measure the time spent in the body of the ``with`` statement.
+
+        :param name: The name of the measured part of the code.
+        :type name: str
+        :return: An iterator producing None, once, around the measured code.
+        :rtype: Iterator[None]
+        """
+        timer = self._timers[name]
+        start_wall, start_cpu = time.perf_counter(), time.process_time()
+
+        try:
+            yield
+        finally:
+            timer.wall += time.perf_counter() - start_wall
+            timer.cpu += time.process_time() - start_cpu
+
+    def call(self, name: str, function: Callable[..., ResultT], *args: Any) -> ResultT:
+        """Call a function, and measure the time spent in it.
+
+        :param name: The name of the measured part of the code.
+        :type name: str
+        :param function: The function to call.
+        :type function: Callable[..., ResultT]
+        :param args: The arguments of the function.
+        :type args: Any
+        :return: The result of the function.
+        :rtype: ResultT
+        """
+        timer = self._timers[name]
+        start_wall, start_cpu = time.perf_counter(), time.process_time()
+
+        try:
+            return function(*args)
+        finally:
+            timer.wall += time.perf_counter() - start_wall
+            timer.cpu += time.process_time() - start_cpu
+
+    def timed(self, name: str, items: Iterable[ItemT]) -> Iterator[ItemT]:
+        """Iterate over items, measuring the time spent producing them.
+
+        :param name: The name of the measured part of the code.
+        :type name: str
+        :param items: The items to iterate over.
+        :type items: Iterable[ItemT]
+        :return: An iterator over the items.
+        :rtype: Iterator[ItemT]
+        """
+        iterator = iter(items)
+
+        while True:
+            try:
+                item = self.call(name, next, iterator)
+            except StopIteration:
+                return
+
+            yield item
+
+    def observe(self, issues: Iterable[codequality.Report]) -> Iterator[codequality.Report]:
+        """Iterate over the converted issues, measuring the time spent producing them, and counting them.
+
+        :param issues: The Code Quality issues.
+        :type issues: Iterable[codequality.Report]
+        :return: An iterator over the issues.
+        :rtype: Iterator[codequality.Report]
+        """
+        for issue in self.timed("issues", issues):
+            self.by_rule[issue["check_name"]] += 1
+            self.by_severity[issue["severity"]] += 1
+            self.by_file[issue["location"]["path"]] += 1
+
+            yield issue
+
+    def timed_engine(self, engine: fingerprint.FingerprintEngine | None) -> fingerprint.FingerprintEngine:
+        """Wrap a fingerprint engine, to measure the time spent computing the fingerprints.
+
+        :param engine: The engine, None for the default one.
+        :type engine: fingerprint.FingerprintEngine | None
+        :return: The wrapped engine.
+        :rtype: fingerprint.FingerprintEngine
+        """
+        return TimedFingerprint(engine or fingerprint.DEFAULT_ENGINE, self)
+
+    def _exclusive_times(self) -> dict[str, _Timer]:
+        """Compute the time spent in each stage only.
+
+        The measures are nested: the issues are produced from the diagnostics, built from the parsed warnings, and
+        the serialization consumes the issues. The time of a stage is its measure, minus the measures nested in it.
+
+        :return: The time spent in each stage.
+        :rtype: dict[str, _Timer]
+        """
+        stages = {name: _Timer() for name in STAGES}
+
+        for attribute in _Timer.__slots__:
+            parsing, diagnostic, fingerprinting, issues, total = (
+                getattr(self._timers.get(name, _Timer()), attribute)
+                for name in ["parsing", "diagnostic", "fingerprint", "issues", "total"]
+            )
+
+            setattr(stages["parsing"], attribute, parsing)
+            setattr(stages["classification"], attribute, max(0.0, diagnostic - fingerprinting))
+            setattr(stages["fingerprinting"], attribute, fingerprinting)
+            setattr(stages["conversion"], attribute, max(0.0, issues - parsing - diagnostic))
+            setattr(stages["serialization"], attribute, max(0.0, total - issues))
+
+        return stages
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get the statistics, in a JSON-serializable dictionary.
+
+        :return: The statistics.
+        :rtype: dict[str, Any]
+        """
+        total = self._timers.get("total", _Timer())
+        nb_issues = sum(self.by_rule.values())
+
+        peak_rss = None
+
+        if resource is not None:
+            # Kibibytes on Linux, bytes on macOS
+            peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+
+        return {
+            "stages": {
+                name: {"wall_seconds": timer.wall, "cpu_seconds": timer.cpu}
+                for name, timer in self._exclusive_times().items()
+            },
+            "total": {"wall_seconds": total.wall, "cpu_seconds": total.cpu},
+            "issues": nb_issues,
+            "duplicates": self.duplicates,
+            "issues_per_second": nb_issues / total.wall if total.wall else None,
+            "peak_rss_bytes": peak_rss,
+            "by_rule": dict(self.by_rule.most_common()),
+            "by_severity": dict(self.by_severity.most_common()),
+            "by_file": dict(self.by_file.most_common()),
+        }
+
+    def write(self, output: str | os.PathLike | TextIO | None = None) -> None:
+        """Write the statistics in JSON.
+
+        :param output: The path of the file, or the text stream, receiving the statistics, None for the standard
+            error, defaults to None
+        :type output: str | os.PathLike | TextIO | None, optional
+        """
+        if output is None or not isinstance(output, (str, os.PathLike)):
+            json.dump(self.to_dict(), output or sys.stderr, indent=4)
+            (output or sys.stderr).write("\n")
+            return
+
+        with open(output, "w", encoding="utf8") as stats_file:
+            json.dump(self.to_dict(), stats_file, indent=4)
+
+
+@contextlib.contextmanager
+def profile(output_file_path: str | os.PathLike | None) -> Iterator[None]:
+    """Profile the body of the ``with`` statement with cProfile, and dump the profile in a file.
+
+    The profile can be read with ``python3 -m pstats <file>``, or tools such as snakeviz.
+
+    :param output_file_path: The path of the profile, None to not profile.
+    :type output_file_path: str | os.PathLike | None
+    :return: An iterator producing None, once, around the profiled code.
+    :rtype: Iterator[None]
+    """
+    if output_file_path is None:
+        yield
+        return
+
+    import cProfile  # pylint: disable=import-outside-toplevel  # Only needed with --profile, slow to import
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(output_file_path)
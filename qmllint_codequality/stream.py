@@ -0,0 +1,592 @@
+"""Module providing incremental readers for qmllint and Code Quality JSON reports, and an incremental writer for JSON
+arrays.
+
+The qmllint report is never loaded as a whole. Instead, its structure is scanned chunk by chunk, and only the
+``files[*].warnings[*]`` objects are decoded, one at a time. The memory used stays the same whatever the size of the
+report.
+
+A report file can also be memory-mapped: it is then scanned in place, without being copied into a buffer, and only
+the values decoded are copied out of it. The operating system pages the report in, and out, as the scanner goes
+through it, so the resident memory stays low whatever the size of the report.
+
+In the same way, the Code Quality issues are written one by one in the output array, as soon as they are converted.
+
+Both directions work on bytes: the values are decoded and encoded by a ``jsoncodec.Codec``, without copying the report
+into a string.
+
+:Example:
+
+    ```python
+    with open("qmllint.json", "rb") as report:
+        for filename, warning in iter_warnings(report):
+            print(filename, warning["message"])
+    ```
+"""
+
+import functools
+import json
+import logging
+import os
+import re
+from typing import IO, TYPE_CHECKING, Any, Iterable, Iterator
+
+from qmllint_codequality import codequality, jsoncodec, qmllint
+
+if TYPE_CHECKING:
+    import mmap
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+"""Number of bytes read at once from the report."""
+
+_REGEX_NON_WHITESPACE = re.compile(rb"[^ \t\n\r]")
+"""Regex used to find the next significant character."""
+
+_REGEX_STRING_END = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+"""Regex matching the body of a string, up to its closing quote (the opening quote must be already consumed)."""
+
+_REGEX_STRUCTURE = re.compile(rb'["{}\[\]]')
+"""Regex used to find the next character opening or closing a string, an object or an array."""
+
+_REGEX_SCALAR_END = re.compile(rb"[,}\] \t\n\r]")
+"""Regex used to find the end of a number, or of a literal (``true``, ``false``, ``null``)."""
+
+CONTAINER_FAST_DEPTH = 3
+"""Nesting depth of the objects and arrays matched at once by a regex, the deeper ones are scanned character by
+character."""
+
+
+def _container_pattern(depth: int) -> bytes:
+    """Build the pattern matching a whole object or array, whose strings and containers are nested up to a depth.
+
+    Each alternative starts with a distinct character, so the pattern never backtracks and runs in linear time.
+
+    :param depth: Number of levels of objects and arrays nested in the matched one.
+    :type depth: int
+    :return: The pattern.
+    :rtype: bytes
+    """
+    string = rb'"[^"\\]*(?:\\.[^"\\]*)*"'
+    value = string if depth == 0 else rb"(?:" + string + rb"|" + _container_pattern(depth - 1) + rb")"
+    body = rb'[^"{}\[\]]*(?:' + value + rb'[^"{}\[\]]*)*'
+    return rb"(?:\{" + body + rb"\}|\[" + body + rb"\])"
+
+
+@functools.cache
+def _container_regex() -> re.Pattern[bytes]:
+    """Get the regex matching a whole object or array, compiled on first use.
+
+    :return: The compiled regex.
+    :rtype: re.Pattern[bytes]
+    """
+    return re.compile(_container_pattern(CONTAINER_FAST_DEPTH), re.DOTALL)
+
+
+class _Scanner:
+    """Scanner walking through the structure of a JSON document held in a buffer.
+
+    The base scanner expects the whole document in the buffer. ``_StreamScanner`` reads it incrementally instead.
+    """
+
+    def __init__(self, buffer: "bytearray | mmap.mmap", codec: jsoncodec.Codec | None = None) -> None:
+        """Initialize a new scanner.
+
+        :param buffer: The buffer containing the JSON document.
+        :type buffer: bytearray | mmap.mmap
+        :param codec: The codec decoding the values, None for the fastest one installed, defaults to None
+        :type codec: jsoncodec.Codec | None, optional
+        """
+        self._buffer = buffer
+        """Bytes of the document not yet discarded."""
+
+        self._codec = codec or jsoncodec.create_codec()
+        """Codec decoding the values."""
+
+        self._pos = 0
+        """Position of the scanner in the buffer."""
+
+        self._keep = 0
+        """Position in the buffer before which the bytes can be discarded."""
+
+        self._offset = 0
+        """Number of bytes already discarded, used to report error positions."""
+
+    def error(self, message: str) -> json.JSONDecodeError:
+        """Create an error located at the current position.
+
+        :param message: The error message.
+        :type message: str
+        :return: The error to raise.
+        :rtype: json.JSONDecodeError
+        """
+        return json.JSONDecodeError(message, "", self._offset + self._pos)
+
+    def _fill(self) -> bool:
+        """Add new bytes at the end of the buffer.
+
+        :return: True if new bytes has been added, False if the end of the document is reached, as the whole document
+            is already in the buffer.
+        :rtype: bool
+        """
+        return False
+
+    def peek(self) -> bytes:
+        """Skip the whitespaces, and return the next significant character, without consuming it.
+
+        :return: The next character, an empty bytes if the end of the document is reached.
+        :rtype: bytes
+        """
+        self._keep = self._pos
+
+        while not (match := _REGEX_NON_WHITESPACE.search(self._buffer, self._pos)):
+            self._pos = self._keep = len(self._buffer)
+
+            if not self._fill():
+                return b""
+
+        self._pos = self._keep = match.start()
+        return match.group()
+
+    def expect(self, character: bytes) -> None:
+        """Consume the next significant character, ensuring it's the expected one.
+
+        :param character: The expected character.
+        :type character: bytes
+        :raises json.JSONDecodeError: Another character has been found.
+        """
+        if self.peek() != character:
+            raise self.error(f"Expecting '{character.decode()}'")
+
+        self._pos += 1
+
+    def _skip_string(self) -> None:
+        """Move after the closing quote of the current string, the opening quote being already consumed.
+
+        :raises json.JSONDecodeError: The string is not terminated.
+        """
+        while not (match := _REGEX_STRING_END.match(self._buffer, self._pos)):
+            if not self._fill():
+                raise self.error("Unterminated string")
+
+        self._pos = match.end()
+
+    def _skip_container(self) -> None:
+        """Move after the end of the current object or array.
+
+        :raises json.JSONDecodeError: The object or the array is not terminated.
+        """
+        depth = 0
+
+        while True:
+            if not (match := _REGEX_STRUCTURE.search(self._buffer, self._pos)):
+                self._pos = len(self._buffer)
+
+                if not self._fill():
+                    raise self.error("Unterminated object or array")
+
+                continue
+
+            self._pos = match.end()
+            character = match.group()
+
+            if character == b'"':
+                self._skip_string()
+            elif character in (b"{", b"["):
+                depth += 1
+            else:
+                depth -= 1
+
+                if depth == 0:
+                    return
+
+    def _skip_scalar(self) -> None:
+        """Move after the end of the current number or literal."""
+        while not (match := _REGEX_SCALAR_END.search(self._buffer, self._pos)):
+            if not self._fill():
+                self._pos = len(self._buffer)
+                return
+
+        self._pos = match.start()
+
+    def _skip_value(self) -> None:
+        """Move after the end of the next value, keeping its start in the buffer.
+
+        :raises json.JSONDecodeError: No value found.
+        """
+        if not (character := self.peek()):
+            raise self.error("Expecting value")
+
+        # ``_keep`` has been moved to the start of the value by ``peek``, so it is kept in the buffer
+        if character == b'"':
+            self._pos += 1
+            self._skip_string()
+        elif character in (b"{", b"["):
+            # Most containers are matched at once, the unterminated or deeply nested ones are scanned step by step
+            if match := _container_regex().match(self._buffer, self._pos):
+                self._pos = match.end()
+            else:
+                self._skip_container()
+        else:
+            self._skip_scalar()
+
+    def read_raw(self) -> bytes:
+        """Consume the next value, and return it without decoding it.
+
+        :raises json.JSONDecodeError: No value found.
+        :return: The bytes of the value.
+        :rtype: bytes
+        """
+        self._skip_value()
+        return bytes(self._buffer[self._keep : self._pos])
+
+    def read(self) -> Any:
+        """Consume and decode the next value.
+
+        Invalid UTF-8 sequences are replaced by the replacement character.
+
+        :return: The decoded value.
+        :rtype: Any
+        """
+        raw = self.read_raw()
+
+        # Most strings, such as the keys, have no escape sequence and are decoded without the codec
+        if raw[:1] == b'"' and b"\\" not in raw:
+            return raw[1:-1].decode("utf8", errors="replace")
+
+        return self._codec.loads(raw)
+
+    def skip(self) -> None:
+        """Consume the next value, without decoding it."""
+        self._skip_value()
+
+    def iter_object(self) -> Iterator[str]:
+        """Iterate over the keys of the next object.
+
+        After each key, the scanner is located at the value, that must be consumed before resuming the iteration.
+
+        :raises json.JSONDecodeError: The object is malformed.
+        :return: An iterator over the keys of the object.
+        :rtype: Iterator[str]
+        """
+        self.expect(b"{")
+
+        if self.peek() == b"}":
+            self._pos += 1
+            return
+
+        while True:
+            if self.peek() != b'"':
+                raise self.error("Expecting property name enclosed in double quotes")
+
+            key = self.read()
+            self.expect(b":")
+
+            yield key
+
+            separator = self.peek()
+            self._pos += 1
+
+            if separator == b"}":
+                return
+
+            if separator != b",":
+                raise self.error("Expecting ',' delimiter")
+
+    def iter_array(self) -> Iterator[None]:
+        """Iterate over the elements of the next array.
+
+        After each iteration, the scanner is located at the element, that must be consumed before resuming
+        the iteration.
+
+        :raises json.JSONDecodeError: The array is malformed.
+        :return: An iterator producing None, for each element.
+        :rtype: Iterator[None]
+        """
+        self.expect(b"[")
+
+        if self.peek() == b"]":
+            self._pos += 1
+            return
+
+        while True:
+            yield
+
+            separator = self.peek()
+            self._pos += 1
+
+            if separator == b"]":
+                return
+
+            if separator != b",":
+                raise self.error("Expecting ',' delimiter")
+
+
+class _StreamScanner(_Scanner):
+    """Scanner walking through the structure of a JSON document read incrementally."""
+
+    def __init__(
+        self, stream: IO[bytes], chunk_size: int = DEFAULT_CHUNK_SIZE, codec: jsoncodec.Codec | None = None
+    ) -> None:
+        """Initialize a new scanner.
+
+        :param stream: The binary stream to read.
+        :type stream: IO[bytes]
+        :param chunk_size: The number of bytes read at once, defaults to DEFAULT_CHUNK_SIZE
+        :type chunk_size: int, optional
+        :param codec: The codec decoding the values, None for the fastest one installed, defaults to None
+        :type codec: jsoncodec.Codec | None, optional
+        """
+        self._chunks = bytearray()
+        """Bytes read from the stream, and not yet discarded: the buffer of the scanner, modified in place."""
+
+        super().__init__(self._chunks, codec)
+
+        self._stream = stream
+        """Stream containing the JSON document."""
+
+        self._chunk_size = chunk_size
+        """Number of bytes read at once."""
+
+        self._eof = False
+        """Indicate if the end of the stream is reached."""
+
+    def _fill(self) -> bool:
+        """Read a new chunk from the stream.
+
+        The bytes located before the ``_keep`` position are discarded.
+
+        :return: True if new bytes has been read, False if the end of the stream is reached.
+        :rtype: bool
+        """
+        if self._eof:
+            return False
+
+        if not (chunk := self._stream.read(self._chunk_size)):
+            self._eof = True
+            return False
+
+        if self._keep > 0:
+            del self._chunks[: self._keep]
+            self._offset += self._keep
+            self._pos -= self._keep
+            self._keep = 0
+
+        self._chunks += chunk
+        return True
+
+
+def _iter_file_warnings(scanner: _Scanner) -> Iterator[tuple[str, qmllint.WarningDetails]]:
+    """Iterate over the warnings of the next file diagnostic.
+
+    The warnings are streamed when the ``filename`` field comes before the ``warnings`` one, which is the order used
+    by qmllint. Otherwise, the warnings of this file are kept until the file name is found.
+
+    :param scanner: The scanner located at a file diagnostic.
+    :type scanner: _Scanner
+    :yield: The file name, and a warning found in it.
+    :rtype: Iterator[tuple[str, qmllint.WarningDetails]]
+    """
+    filename: str | None = None
+    pending: list[qmllint.WarningDetails] = []
+
+    for key in scanner.iter_object():
+        if key == "filename":
+            filename = scanner.read()
+        elif key == "warnings":
+            for _ in scanner.iter_array():
+                warning: qmllint.WarningDetails = scanner.read()
+
+                if filename is None:
+                    pending.append(warning)
+                else:
+                    yield filename, warning
+        else:
+            scanner.skip()
+
+    if pending:
+        if filename is None:
+            raise KeyError("filename")
+
+        for warning in pending:
+            yield filename, warning
+
+
+def _iter_report_warnings(scanner: _Scanner) -> Iterator[tuple[str, qmllint.WarningDetails]]:
+    """Iterate over the warnings of a whole qmllint JSON report.
+
+    :param scanner: The scanner located at the start of the report.
+    :type scanner: _Scanner
+    :raises json.JSONDecodeError: The report is not a valid JSON document.
+    :yield: The name of the file containing the warning, and the warning itself.
+    :rtype: Iterator[tuple[str, qmllint.WarningDetails]]
+    """
+    for key in scanner.iter_object():
+        if key == "files":
+            for _ in scanner.iter_array():
+                yield from _iter_file_warnings(scanner)
+        else:
+            scanner.skip()
+
+    if scanner.peek():
+        raise scanner.error("Extra data")
+
+
+def iter_warnings(
+    stream: IO[bytes], chunk_size: int = DEFAULT_CHUNK_SIZE, codec: jsoncodec.Codec | None = None
+) -> Iterator[tuple[str, qmllint.WarningDetails]]:
+    """Iterate over the warnings of a qmllint JSON report, without loading the whole report.
+
+    :param stream: The binary stream containing the qmllint JSON report.
+    :type stream: IO[bytes]
+    :param chunk_size: The number of bytes read at once, defaults to DEFAULT_CHUNK_SIZE
+    :type chunk_size: int, optional
+    :param codec: The codec decoding the warnings, None for the fastest one installed, defaults to None
+    :type codec: jsoncodec.Codec | None, optional
+    :raises json.JSONDecodeError: The report is not a valid JSON document.
+    :return: An iterator over the name of the file containing each warning, and the warning itself.
+    :rtype: Iterator[tuple[str, qmllint.WarningDetails]]
+    """
+    return _iter_report_warnings(_StreamScanner(stream, chunk_size, codec))
+
+
+def iter_mapped_warnings(
+    file: IO[bytes], codec: jsoncodec.Codec | None = None
+) -> Iterator[tuple[str, qmllint.WarningDetails]]:
+    """Iterate over the warnings of a qmllint JSON report file, scanned in place from a memory map.
+
+    The file is mapped while the warnings are iterated, and unmapped at the end of the iteration. Only the bytes of
+    each warning, and of the file names, are copied out of the map, to be decoded. The other values are skipped in
+    place.
+
+    :param file: The report file, opened in binary mode, that must support ``fileno``.
+    :type file: IO[bytes]
+    :param codec: The codec decoding the warnings, None for the fastest one installed, defaults to None
+    :type codec: jsoncodec.Codec | None, optional
+    :raises json.JSONDecodeError: The report is not a valid JSON document.
+    :raises OSError: The file cannot be mapped.
+    :return: An iterator over the name of the file containing each warning, and the warning itself.
+    :rtype: Iterator[tuple[str, qmllint.WarningDetails]]
+    """
+    import mmap  # pylint: disable=import-outside-toplevel,redefined-outer-name  # Only needed with --mmap
+
+    if not os.fstat(file.fileno()).st_size:
+        raise json.JSONDecodeError("Expecting value", "", 0)  # An empty file cannot be mapped
+
+    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            buffer.madvise(mmap.MADV_SEQUENTIAL)  # The pages already scanned can be dropped first
+
+        yield from _iter_report_warnings(_Scanner(buffer, codec))
+
+
+def iter_report_issues(
+    stream: IO[bytes], chunk_size: int = DEFAULT_CHUNK_SIZE, codec: jsoncodec.Codec | None = None
+) -> Iterator[codequality.Report]:
+    """Iterate over the issues of a Code Quality JSON report, without loading the whole report.
+
+    :param stream: The binary stream containing the Code Quality JSON report.
+    :type stream: IO[bytes]
+    :param chunk_size: The number of bytes read at once, defaults to DEFAULT_CHUNK_SIZE
+    :type chunk_size: int, optional
+    :param codec: The codec decoding the issues, None for the fastest one installed, defaults to None
+    :type codec: jsoncodec.Codec | None, optional
+    :raises json.JSONDecodeError: The report is not a valid JSON document.
+    :return: An iterator over the issues.
+    :rtype: Iterator[codequality.Report]
+    """
+    scanner = _StreamScanner(stream, chunk_size, codec)
+
+    for _ in scanner.iter_array():
+        yield scanner.read()
+
+    if scanner.peek():
+        raise scanner.error("Extra data")
+
+
+class ArrayWriter:
+    """Writer of a JSON array, whose items are written as soon as they are produced.
+
+    With the ``stdlib`` codec, the layout is the same as the one produced by ``json.dump``, when called with the whole
+    list of items.
+    """
+
+    def __init__(self, stream: IO[bytes], indent: int | None = None, codec: jsoncodec.Codec | None = None) -> None:
+        """Initialize a new writer, without writing anything yet.
+
+        :param stream: The binary stream in which the array is written, encoded in UTF-8.
+        :type stream: IO[bytes]
+        :param indent: The indentation level, None for the most compact representation, defaults to None
+        :type indent: int | None, optional
+        :param codec: The codec encoding the items, None for the fastest one installed, defaults to None
+        :type codec: jsoncodec.Codec | None, optional
+        """
+        self._stream = stream
+        """The binary stream in which the array is written."""
+
+        self._indent = indent
+        """The indentation level, None for the most compact representation."""
+
+        self._codec = codec or jsoncodec.create_codec()
+        """The codec encoding the items."""
+
+        self._newline = b"\n" + b" " * (indent or 0)
+        """The bytes starting a new line, followed by the indentation of the items."""
+
+        self.count = 0
+        """Number of items written."""
+
+    def write(self, item: Any) -> None:
+        """Write an item of the array.
+
+        :param item: The item, must be serializable in JSON.
+        :type item: Any
+        """
+        if self._indent is None:
+            self._stream.write(b", " if self.count else b"[")
+            self._stream.write(self._codec.dumps(item))
+        else:
+            self._stream.write(b"," + self._newline if self.count else b"[" + self._newline)
+            self._stream.write(self._codec.dumps(item, self._indent).replace(b"\n", self._newline))
+
+        self.count += 1
+
+    def close(self) -> int:
+        """Write the end of the array.
+
+        :return: The number of items written.
+        :rtype: int
+        """
+        if not self.count:
+            self._stream.write(b"[]")
+        else:
+            self._stream.write(b"]" if self._indent is None else b"\n]")
+
+        return self.count
+
+
+def write_array(
+    items: Iterable[Any], stream: IO[bytes], indent: int | None = None, codec: jsoncodec.Codec | None = None
+) -> int:
+    """Write the items into a JSON array, as soon as they are produced.
+
+    With the ``stdlib`` codec, the layout is the same as the one produced by ``json.dump``, when called with the whole
+    list of items.
+
+    :param items: The items to write, each one must be serializable in JSON.
+    :type items: Iterable[Any]
+    :param stream: The binary stream in which the array is written, encoded in UTF-8.
+    :type stream: IO[bytes]
+    :param indent: The indentation level, None for the most compact representation, defaults to None
+    :type indent: int | None, optional
+    :param codec: The codec encoding the items, None for the fastest one installed, defaults to None
+    :type codec: jsoncodec.Codec | None, optional
+    :return: The number of items written.
+    :rtype: int
+    """
+    writer = ArrayWriter(stream, indent, codec)
+
+    for item in items:
+        writer.write(item)
+
+    return writer.close()
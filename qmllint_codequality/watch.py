@@ -0,0 +1,356 @@
+"""Module watching a qmllint report, or a tree of QML files, and updating the Code Quality report when they change.
+
+The files are watched by polling their modification time and size, so no dependency is needed. The issues of each QML
+file are kept in memory, and only the QML files affected by a change are converted, or linted, again:
+
+- when watching a report, the QML files whose warnings changed,
+- when watching the QML files, the files that changed, and the files that may use a changed component, found in
+  their own directory or in the directories they import.
+
+The Code Quality report is then written from the issues kept, and replaced atomically, so its readers never see a
+partially written report.
+
+:Example:
+
+    ```python
+    LintWatcher(["./qml"], "codequality.json").run()
+    ```
+"""
+
+import logging
+import os
+import time
+from typing import Iterable, Sequence
+
+from qmllint_codequality import (
+    codequality,
+    compression,
+    fingerprint,
+    group_issues,
+    iter_issues,
+    jsoncodec,
+    lintcache,
+    qmllint,
+    runner,
+    stream,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL = 1.0
+"""Default time between two polls of the watched files, in seconds."""
+
+FileState = tuple[int, int] | None
+"""The modification time and the size of a file, None if it does not exist."""
+
+
+def _file_state(path: str) -> FileState:
+    """Get the state of a file, changing when the file is modified.
+
+    :param path: The path to the file.
+    :type path: str
+    :return: The modification time in nanoseconds, and the size of the file, None if it does not exist.
+    :rtype: FileState
+    """
+    try:
+        status = os.stat(path)
+    except OSError:
+        return None
+
+    return status.st_mtime_ns, status.st_size
+
+
+class Watcher:
+    """Base class of the watchers, keeping the issues of each QML file, and writing them in the output file."""
+
+    def __init__(
+        self, output_file_path: str | os.PathLike, fingerprint_engine: fingerprint.FingerprintEngine | None = None
+    ) -> None:
+        """Initialize a new watcher.
+
+        :param output_file_path: Output file path (Code Quality JSON).
+        :type output_file_path: str | os.PathLike
+        :param fingerprint_engine: The engine computing the fingerprints, None for the default one, defaults to None
+        :type fingerprint_engine: fingerprint.FingerprintEngine | None, optional
+        """
+        self.output_file_path = os.fspath(output_file_path)
+        """Output file path (Code Quality JSON)."""
+
+        self.fingerprint_engine = fingerprint_engine
+        """The engine computing the fingerprints, None for the default one."""
+
+        self.issues: dict[str, list[codequality.Report]] = {}
+        """The issues of each QML file, in the order they are written."""
+
+        self.indent: int | None = None
+        """The indentation level of the output file, None for the most compact representation."""
+
+        self.codec: jsoncodec.Codec | None = None
+        """The codec decoding the report and encoding the issues, None for the fastest one installed."""
+
+        self.compression_level: int | None = None
+        """The compression level of the output file, if compressed, None for the default one."""
+
+    def poll(self) -> bool:
+        """Check the watched files, and update the issues of the QML files affected by their changes.
+
+        :raises NotImplementedError: Must be implemented by the subclasses.
+        :return: True if the issues changed.
+        :rtype: bool
+        """
+        raise NotImplementedError
+
+    def write(self) -> int:
+        """Write the issues in the output file, replacing it atomically, compressed according to its extension.
+
+        :return: The number of issues written.
+        :rtype: int
+        """
+        import tempfile  # pylint: disable=import-outside-toplevel  # Only needed with --watch, slow to import
+
+        directory = os.path.dirname(os.path.abspath(self.output_file_path))
+        os.makedirs(directory, exist_ok=True)  # Ensure that the destination folder exist
+
+        issues = (issue for file_issues in self.issues.values() for issue in file_issues)
+
+        with (
+            tempfile.NamedTemporaryFile("wb", dir=directory, delete=False) as ou_f,
+            compression.open_output(
+                ou_f, compression.from_path(self.output_file_path), self.compression_level
+            ) as output,
+        ):
+            nb_issues = stream.write_array(issues, output, self.indent, self.codec)
+
+        os.replace(ou_f.name, self.output_file_path)
+        return nb_issues
+
+    def run(self, interval: float = DEFAULT_INTERVAL, iterations: int | None = None) -> None:
+        """Poll the watched files, and update the output file when the issues change, until interrupted.
+
+        :param interval: The time between two polls, in seconds, defaults to DEFAULT_INTERVAL
+        :type interval: float, optional
+        :param iterations: The number of polls, None to poll until interrupted, defaults to None
+        :type iterations: int | None, optional
+        """
+        iteration = 0
+
+        while iterations is None or iteration < iterations:
+            if iteration:
+                time.sleep(interval)
+
+            if self.poll():
+                logger.info("Wrote %d qmllint issues into '%s'", self.write(), self.output_file_path)
+
+            iteration += 1
+
+    def _convert(
+        self, warnings: Iterable[tuple[str, qmllint.WarningDetails]], qml_files: list[str]
+    ) -> dict[str, list[codequality.Report]]:
+        """Convert the warnings of some QML files.
+
+        :param warnings: The warnings, with the name of the file containing them.
+        :type warnings: Iterable[tuple[str, qmllint.WarningDetails]]
+        :param qml_files: The QML files whose warnings are converted.
+        :type qml_files: list[str]
+        :return: The issues of each QML file.
+        :rtype: dict[str, list[codequality.Report]]
+        """
+        return group_issues(iter_issues(warnings, self.fingerprint_engine), qml_files)
+
+
+class ReportWatcher(Watcher):
+    """Watcher of a qmllint report, converting the warnings of the QML files that changed."""
+
+    def __init__(
+        self,
+        input_file_path: str | os.PathLike,
+        output_file_path: str | os.PathLike,
+        fingerprint_engine: fingerprint.FingerprintEngine | None = None,
+    ) -> None:
+        """Initialize a new watcher.
+
+        :param input_file_path: Input file path (qmllint JSON).
+        :type input_file_path: str | os.PathLike
+        :param output_file_path: Output file path (Code Quality JSON).
+        :type output_file_path: str | os.PathLike
+        :param fingerprint_engine: The engine computing the fingerprints, None for the default one, defaults to None
+        :type fingerprint_engine: fingerprint.FingerprintEngine | None, optional
+        """
+        super().__init__(output_file_path, fingerprint_engine)
+
+        self.input_file_path = os.fspath(input_file_path)
+        """Input file path (qmllint JSON)."""
+
+        self._state: FileState = None
+        """The state of the report when it was last read."""
+
+        self._warnings: dict[str, list[qmllint.WarningDetails]] | None = None
+        """The warnings of each QML file, when the report was last read, None if it was never read."""
+
+    def poll(self) -> bool:
+        """Read the report if it changed, and convert the warnings of the QML files whose warnings changed.
+
+        :return: True if the issues changed.
+        :rtype: bool
+        """
+        if (state := _file_state(self.input_file_path)) == self._state or state is None:
+            return False
+
+        warnings: dict[str, list[qmllint.WarningDetails]] = {}
+
+        try:
+            with open(self.input_file_path, "rb") as in_f, compression.open_input(in_f) as report:
+                for filename, warning in stream.iter_warnings(report, codec=self.codec):
+                    warnings.setdefault(filename, []).append(warning)
+        except (OSError, EOFError, ValueError) as error:
+            # The report may be being written, it is read again at the next poll
+            logger.debug("Cannot read '%s': %s", self.input_file_path, error)
+            return False
+
+        self._state = state
+        previous = self._warnings or {}
+        changed = [name for name, file_warnings in warnings.items() if previous.get(name) != file_warnings]
+
+        if not changed and self._warnings is not None and warnings.keys() == self._warnings.keys():
+            return False
+
+        logger.info("Converting the warnings of %d QML files", len(changed))
+        converted = self._convert(
+            ((filename, warning) for filename in changed for warning in warnings[filename]), changed
+        )
+
+        self.issues = {
+            filename: converted[filename] if filename in converted else self.issues[filename] for filename in warnings
+        }
+        self._warnings = warnings
+        return True
+
+
+class LintWatcher(Watcher):
+    """Watcher of a tree of QML files, linting the QML files affected by the changes."""
+
+    def __init__(
+        self,
+        qml_paths: Iterable[str | os.PathLike],
+        output_file_path: str | os.PathLike,
+        fingerprint_engine: fingerprint.FingerprintEngine | None = None,
+        executable: str = runner.DEFAULT_QMLLINT,
+        arguments: Sequence[str] = (),
+        batch_size: int = runner.DEFAULT_BATCH_SIZE,
+        jobs: int | None = None,
+    ) -> None:
+        """Initialize a new watcher.
+
+        :param qml_paths: The QML files, and the directories containing them.
+        :type qml_paths: Iterable[str | os.PathLike]
+        :param output_file_path: Output file path (Code Quality JSON).
+        :type output_file_path: str | os.PathLike
+        :param fingerprint_engine: The engine computing the fingerprints, None for the default one, defaults to None
+        :type fingerprint_engine: fingerprint.FingerprintEngine | None, optional
+        :param executable: The qmllint executable, defaults to runner.DEFAULT_QMLLINT
+        :type executable: str, optional
+        :param arguments: Additional arguments given to qmllint, such as import paths, defaults to ()
+        :type arguments: Sequence[str], optional
+        :param batch_size: Maximal number of QML files linted by a single qmllint process,
+            defaults to runner.DEFAULT_BATCH_SIZE
+        :type batch_size: int, optional
+        :param jobs: Maximal number of qmllint processes running at the same time, None for the number of
+            processors, defaults to None
+        :type jobs: int | None, optional
+        """
+        super().__init__(output_file_path, fingerprint_engine)
+
+        self.qml_paths = list(qml_paths)
+        """The QML files, and the directories containing them."""
+
+        self.executable = executable
+        """The qmllint executable."""
+
+        self.arguments = arguments
+        """Additional arguments given to qmllint."""
+
+        self.batch_size = batch_size
+        """Maximal number of QML files linted by a single qmllint process."""
+
+        self.jobs = jobs
+        """Maximal number of qmllint processes running at the same time."""
+
+        self._states: dict[str, FileState] = {}
+        """The state of the QML files, and of the files they may use, when they were last linted, by absolute path."""
+
+        self._dependencies: dict[str, set[str]] = {}
+        """The absolute paths of the files each QML file may use, existing or not."""
+
+        self._linted = False
+        """True once the QML files have been linted."""
+
+    @staticmethod
+    def _find_dependencies(qml_file: str) -> set[str]:
+        """Find the files a QML file may use: the ``qmldir`` files, and the components named after its words.
+
+        The files that do not exist yet are included, so creating a missing component is detected.
+
+        :param qml_file: The path to the QML file.
+        :type qml_file: str
+        :return: The absolute paths of the files.
+        :rtype: set[str]
+        """
+        try:
+            with open(qml_file, "rb") as file:
+                content = file.read()
+        except OSError:
+            return set()
+
+        names = lintcache.used_names(content)
+        dependencies = set()
+
+        for directory in lintcache.imported_directories(qml_file, content):
+            dependencies.add(os.path.join(directory, "qmldir"))
+            dependencies.update(os.path.join(directory, f"{name}.qml") for name in names)
+
+        dependencies.discard(os.path.abspath(qml_file))
+        return dependencies
+
+    def poll(self) -> bool:
+        """Find the QML files affected by the changes since the last poll, and lint them.
+
+        :return: True if the issues changed.
+        :rtype: bool
+        """
+        qml_files = runner.discover_qml_files(self.qml_paths)
+        absolute_paths = {qml_file: os.path.abspath(qml_file) for qml_file in qml_files}
+
+        watched = set(absolute_paths.values()).union(*(self._dependencies.get(path, ()) for path in absolute_paths))
+        states = {path: _file_state(path) for path in watched}
+        changed = {path for path, state in states.items() if path in self._states and self._states[path] != state}
+
+        affected = [
+            qml_file
+            for qml_file, path in absolute_paths.items()
+            if qml_file not in self.issues or path in changed or not changed.isdisjoint(self._dependencies[path])
+        ]
+
+        if not affected and self._linted and self.issues.keys() == set(qml_files):
+            return False
+
+        try:
+            warnings = runner.iter_lint_warnings(affected, self.executable, self.arguments, self.batch_size, self.jobs)
+            linted = self._convert(warnings, affected) if affected else {}
+        except runner.QmllintError as error:
+            # The states are kept, so the changed files are linted again at the next poll
+            logger.error("%s", error)
+            return False
+
+        self._states.update(states)
+        self._linted = True
+
+        for qml_file in affected:
+            dependencies = self._dependencies[absolute_paths[qml_file]] = self._find_dependencies(qml_file)
+
+            # The dependencies found now are changed if they differ from their current state
+            for path in dependencies:
+                if path not in self._states:
+                    self._states[path] = _file_state(path)
+
+        self.issues = {qml_file: linted.get(qml_file, self.issues.get(qml_file, [])) for qml_file in qml_files}
+        return True
@@ -0,0 +1,254 @@
+"""Client of the qmllint-codequality conversion server.
+
+The client asks the server started by ``qmllint-codequality-server`` to convert a report. It does not import the
+``qmllint_codequality`` package, so it starts in a fraction of the time needed to convert a report in process. When no
+server can be reached, when the server is of another version, or when the report is read from the standard input or
+written to the standard output, the package is imported, and the report is converted in process. A conversion failed
+by the server is not retried in process. For the same reason, ``logging`` is only imported when needed.
+
+:Example:
+
+    ```shell
+    qmllint-codequality-server &
+    qmllint-codequality-client qmllint.json codequality.json
+    ```
+
+.. seealso:: qmllint_codequality.daemon
+"""
+
+import argparse
+import json
+import os
+import re
+import socket
+import sys
+
+CONNECT_TIMEOUT = 1.0
+"""Maximal time waiting for the server to accept a connection, in seconds."""
+
+STANDARD_STREAM = "-"
+"""The file name standing for the standard input, or the standard output, always converted in process."""
+
+_REGEX_CAPTURE_VERSION = re.compile(r'^__version__ = "([^"]+)"', re.MULTILINE)
+"""Regex capturing the version of the package, in its source."""
+
+REASON_REQUEST = "request"
+"""Reason of the error of the server when the request is invalid."""
+
+REASON_VERSION = "version"
+"""Reason of the error of the server when the client is of another version."""
+
+REASON_FINGERPRINT = "fingerprint"
+"""Reason of the error of the server when the fingerprint engine does not exist."""
+
+REASON_CONVERSION = "conversion"
+"""Reason of the error of the server when the conversion failed."""
+
+ERROR_REASONS = (REASON_REQUEST, REASON_VERSION, REASON_FINGERPRINT, REASON_CONVERSION)
+"""The reasons of the errors returned by the server."""
+
+
+class ServerUnavailableError(RuntimeError):
+    """No server is running, the report cannot be sent to it, or it is of another version."""
+
+
+class ServerError(RuntimeError):
+    """The server failed to convert the report."""
+
+
+def default_socket_path() -> str:
+    """Get the path of the socket used when none is given, private to the current user.
+
+    :return: The path, in the runtime directory of the user if it exists, in the temporary directory otherwise.
+    :rtype: str
+    """
+    if runtime_directory := os.environ.get("XDG_RUNTIME_DIR"):
+        return os.path.join(runtime_directory, "qmllint-codequality.sock")
+
+    import tempfile  # pylint: disable=import-outside-toplevel  # Slow to import, rarely needed
+
+    return os.path.join(tempfile.gettempdir(), f"qmllint-codequality-{os.getuid()}.sock")
+
+
+def package_version() -> str | None:
+    """Get the version of the package installed beside the client, without importing it.
+
+    The server only converts the reports of the clients of the same version.
+
+    :return: The version, None if it cannot be read.
+    :rtype: str | None
+    """
+    init_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "qmllint_codequality", "__init__.py")
+
+    try:
+        with open(init_path, "rt", encoding="utf8") as init_file:
+            version_match = _REGEX_CAPTURE_VERSION.search(init_file.read())
+    except OSError:
+        return None
+
+    return version_match.group(1) if version_match else None
+
+
+def request_conversion(
+    input_file_path: str | os.PathLike,
+    output_file_path: str | os.PathLike,
+    fingerprint_name: str = "md5",
+    source_root: str | os.PathLike | None = None,
+    socket_path: str | os.PathLike | None = None,
+) -> int:
+    """Ask a running server to convert a report.
+
+    :param input_file_path: Input file path (qmllint JSON).
+    :type input_file_path: str | os.PathLike
+    :param output_file_path: Output file path (Code Quality JSON).
+    :type output_file_path: str | os.PathLike
+    :param fingerprint_name: The name of the fingerprint engine, defaults to "md5"
+    :type fingerprint_name: str, optional
+    :param source_root: Directory against which the relative QML file names are resolved, None for the current
+        directory, defaults to None
+    :type source_root: str | os.PathLike | None, optional
+    :param socket_path: The path of the socket, None for the default one, defaults to None
+    :type socket_path: str | os.PathLike | None, optional
+    :raises ServerUnavailableError: No server is running, the server is of another version, or the report is read or
+        written with a standard stream.
+    :raises KeyError: The fingerprint engine does not exist.
+    :raises ServerError: The server failed to convert the report.
+    :return: The result of ``convert_file``: if processing failed, a negative value, if successful, number of qmllint
+        issues written.
+    :rtype: int
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        raise ServerUnavailableError("Unix domain sockets are not supported on this platform")
+
+    if STANDARD_STREAM in (os.fspath(input_file_path), os.fspath(output_file_path)):
+        raise ServerUnavailableError("the standard streams of the client cannot be used by the server")
+
+    # The server has its own current directory
+    request = {
+        "version": package_version(),
+        "input": os.path.abspath(input_file_path),
+        "output": os.path.abspath(output_file_path),
+        "fingerprint": fingerprint_name,
+        "source_root": os.path.abspath(source_root or os.curdir),
+    }
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(CONNECT_TIMEOUT)
+            client.connect(os.fspath(socket_path or default_socket_path()))
+            client.settimeout(None)  # The conversion of a large report may be long
+            client.sendall(json.dumps(request).encode("utf8") + b"\n")
+
+            with client.makefile("rb") as server:
+                response = json.loads(server.readline())
+    except (OSError, ValueError) as error:
+        raise ServerUnavailableError(f"no conversion server available: {error}") from error
+
+    if "error" in response:
+        if response.get("reason") == REASON_VERSION:
+            raise ServerUnavailableError(f"the conversion server cannot be used: {response['error']}")
+
+        if response.get("reason") == REASON_FINGERPRINT:
+            raise KeyError(fingerprint_name)
+
+        raise ServerError(f"the conversion server failed: {response['error']}")
+
+    return response["issues"]
+
+
+def convert(
+    input_file_path: str | os.PathLike,
+    output_file_path: str | os.PathLike,
+    fingerprint_name: str = "md5",
+    source_root: str | os.PathLike | None = None,
+    socket_path: str | os.PathLike | None = None,
+) -> int:
+    """Convert a report with a running server, or in this process if no server of the same version is available.
+
+    :param input_file_path: Input file path (qmllint JSON), ``STANDARD_STREAM`` for the standard input.
+    :type input_file_path: str | os.PathLike
+    :param output_file_path: Output file path (Code Quality JSON), ``STANDARD_STREAM`` for the standard output.
+    :type output_file_path: str | os.PathLike
+    :param fingerprint_name: The name of the fingerprint engine, defaults to "md5"
+    :type fingerprint_name: str, optional
+    :param source_root: Directory against which the relative QML file names are resolved, None for the current
+        directory, defaults to None
+    :type source_root: str | os.PathLike | None, optional
+    :param socket_path: The path of the socket, None for the default one, defaults to None
+    :type socket_path: str | os.PathLike | None, optional
+    :raises KeyError: The fingerprint engine does not exist.
+    :raises ServerError: The server failed to convert the report.
+    :return: If processing failed, a negative value. If successful, number of qmllint issues written.
+    :rtype: int
+    """
+    try:
+        return request_conversion(input_file_path, output_file_path, fingerprint_name, source_root, socket_path)
+    except ServerUnavailableError as error:
+        # pylint: disable-next=import-outside-toplevel  # Only imported when no server is available
+        import logging
+
+        # pylint: disable-next=import-outside-toplevel
+        from qmllint_codequality import convert_file, fingerprint
+
+        logging.getLogger("qmllint_codequality.client").debug("%s, converting in process", error)
+
+        engine = fingerprint.create_engine(fingerprint_name, source_root)
+        return convert_file(input_file_path, output_file_path, fingerprint_engine=engine)
+
+
+def main() -> int:
+    """Convert a report with a running server, or in this process, at the command line.
+
+    :return: 0 if successful, 1 otherwise.
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(
+        formatter_class=argparse.RawTextHelpFormatter, prog="qmllint-codequality-client", description=__doc__
+    )
+    parser.add_argument("input_file", help="the path to the qmllint JSON output to be converted, '-' for stdin")
+    parser.add_argument("output_file", help="output filename to write JSON to, '-' for the standard output")
+    parser.add_argument(
+        "--fingerprint",
+        help="how the fingerprints are computed: md5, coordinates or content (default: %(default)s)",
+        default="md5",
+    )
+    parser.add_argument(
+        "--source-root",
+        help="directory against which the relative QML file names are resolved (default: current directory)",
+        default=None,
+    )
+    parser.add_argument("--socket", help="path of the socket of the server (default: %(default)s)", default=None)
+    parser.add_argument(
+        "-v",
+        "--verbosity",
+        choices=["WARNING", "INFO", "DEBUG"],
+        help="indicates the level of verbosity",
+        default="WARNING",
+    )
+    args = parser.parse_args()
+
+    if args.verbosity != "WARNING":
+        # pylint: disable-next=import-outside-toplevel  # Slow to import, only needed to display more than warnings
+        import logging
+
+        # The standard output may receive the report
+        logging.basicConfig(level=args.verbosity, format="%(asctime)s %(levelname)s : %(message)s", stream=sys.stderr)
+
+    try:
+        nb_issues = convert(args.input_file, args.output_file, args.fingerprint, args.source_root, args.socket)
+    except KeyError as error:
+        sys.stderr.write(f"Unknown fingerprint engine: {error}\n")
+        return 1
+    except ServerError as error:
+        sys.stderr.write(f"Conversion failed: {error}\n")
+        return 1
+
+    if nb_issues < 0:
+        sys.stderr.write("Conversion failed\n")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,6 +8,8 @@ import json
 import pathlib
 import pytest
 import qmllint_codequality
+import stat
+import sys
 import tempfile
 
 from tests import get_all_qml_file, logger, run_qmllint
@@ -58,3 +60,65 @@ def code_quality_report(qmllint_report: pathlib.Path) -> list[qmllint_codequalit
 
         # Load the JSON report resulting of the conversion
         return json.load(codequality_report)
+
+
+FAKE_QMLLINT = f"""#!{sys.executable}
+import json
+import pathlib
+import sys
+
+arguments = sys.argv[1:]
+assert arguments[:2] == ["--json", "-"], arguments
+files = arguments[arguments.index("--") + 1 :]
+
+with pathlib.Path(__file__).with_suffix(".log").open("a") as log:
+    log.write(json.dumps(files) + "\\n")
+
+warnings = [{{"line": 1, "column": 1, "length": 1, "message": "Unqualified access", "type": "warning"}}]
+json.dump({{"files": [{{"filename": file, "success": False, "warnings": warnings}} for file in files]}}, sys.stdout)
+sys.exit(255)
+"""
+"""Script behaving as qmllint, reporting one warning per file, and logging the files of each call."""
+
+
+def write_report(path: pathlib.Path, filename: str, messages: list[str]) -> None:
+    """Write a qmllint report, containing one warning per message.
+
+    :param path: Path of the report to write.
+    :type path: pathlib.Path
+    :param filename: Name of the QML file containing the warnings.
+    :type filename: str
+    :param messages: The messages of the warnings.
+    :type messages: list[str]
+    """
+    report: qmllint_codequality.qmllint.Report = {
+        "files": [
+            {
+                "filename": filename,
+                "success": False,
+                "warnings": [
+                    {"column": 1, "length": 1, "line": line, "message": message, "type": "warning"}
+                    for line, message in enumerate(messages, 1)
+                ],
+            }
+        ]
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report), encoding="utf8")
+
+
+@pytest.fixture(name="fake_qmllint")
+def fixture_fake_qmllint(tmp_path: pathlib.Path) -> pathlib.Path:
+    """Write the fake qmllint executable.
+
+    :param tmp_path: A temporary directory.
+    :type tmp_path: pathlib.Path
+    :return: The path to the executable.
+    :rtype: pathlib.Path
+    """
+    executable = tmp_path.joinpath("bin", "qmllint")
+    executable.parent.mkdir()
+    executable.write_text(FAKE_QMLLINT, encoding="utf8")
+    executable.chmod(executable.stat().st_mode | stat.S_IXUSR)
+
+    return executable
@@ -0,0 +1,81 @@
+"""Module for testing the conversions run from asyncio."""
+
+import asyncio
+import concurrent.futures
+import json
+import logging
+import pathlib
+import pytest
+
+import qmllint_codequality
+from qmllint_codequality import aio, codequality, fingerprint
+from tests.conftest import write_report
+
+logger = logging.getLogger(f"qmllint_codequality.{__name__}")
+
+
+class TestAsyncConversion:
+    """Check that the asynchronous conversions produce the same issues as the blocking ones."""
+
+    def test_convert_file_async(self, tmp_path: pathlib.Path) -> None:
+        """Check that many reports converted at once, with a limit, give the same outputs as ``convert_file``.
+
+        :param tmp_path: A temporary directory.
+        :type tmp_path: pathlib.Path
+        """
+        reports = [tmp_path.joinpath(f"qmllint-{index}.json") for index in range(8)]
+        engine = fingerprint.ContentFingerprint(source_root=tmp_path)
+
+        for index, report in enumerate(reports):
+            write_report(report, f"{index}.qml", ["Unqualified access", "Unknown", "Unknown"])
+            qmllint_codequality.convert_file(report, report.with_suffix(".expected"), fingerprint_engine=engine)
+
+        async def convert_all() -> list[int]:
+            limiter = asyncio.Semaphore(3)
+
+            return await asyncio.gather(
+                *(
+                    aio.convert_file_async(report, report.with_suffix(".out"), engine, limiter=limiter)
+                    for report in reports
+                )
+            )
+
+        assert asyncio.run(convert_all()) == [3] * len(reports)
+
+        for report in reports:
+            assert report.with_suffix(".out").read_bytes() == report.with_suffix(".expected").read_bytes()
+
+    @pytest.mark.parametrize("processes", [False, True])
+    def test_iter_issues_async(self, tmp_path: pathlib.Path, processes: bool) -> None:
+        """Check that the issues are produced in order, without duplicates, whatever the executor.
+
+        :param tmp_path: A temporary directory.
+        :type tmp_path: pathlib.Path
+        :param processes: Whether to convert the chunks in other processes, instead of threads.
+        :type processes: bool
+        """
+        write_report(report := tmp_path.joinpath("qmllint.json"), "A.qml", ["Unqualified access", "Unknown"] * 3)
+        qmllint_codequality.convert_file(report, expected := tmp_path.joinpath("codequality.json"))
+
+        async def collect(executor: concurrent.futures.Executor) -> list[codequality.Report]:
+            return [issue async for issue in aio.iter_issues_async(report, executor=executor, chunk_size=1)]
+
+        executor_type = concurrent.futures.ProcessPoolExecutor if processes else concurrent.futures.ThreadPoolExecutor
+
+        with executor_type(max_workers=2) as executor:
+            issues = asyncio.run(collect(executor))
+
+        assert issues == json.loads(expected.read_bytes())
+
+    def test_missing_file(self, tmp_path: pathlib.Path) -> None:
+        """Check that iterating over the issues of a missing report fails.
+
+        :param tmp_path: A temporary directory.
+        :type tmp_path: pathlib.Path
+        """
+
+        async def collect() -> list[codequality.Report]:
+            return [issue async for issue in aio.iter_issues_async(tmp_path.joinpath("missing.json"))]
+
+        with pytest.raises(OSError):
+            asyncio.run(collect())
@@ -0,0 +1,73 @@
+"""Module for testing the comparison of a conversion against a baseline report."""
+
+import bz2
+import json
+import logging
+import pathlib
+
+import qmllint_codequality
+from qmllint_codequality import baseline
+from tests.conftest import write_report
+
+logger = logging.getLogger(f"qmllint_codequality.{__name__}")
+
+
+class TestBaselineIndex:
+    """Check that only the issues absent from the baseline are written, and that the fixed ones are listed."""
+
+    def test_new_and_fixed(self, tmp_path: pathlib.Path) -> None:
+        """Check that the new issues are written, and the issues of the baseline not found anymore listed apart.
+
+        :param tmp_path: A temporary directory.
+        :type tmp_path: pathlib.Path
+        """
+        write_report(previous := tmp_path.joinpath("previous.json"), "A.qml", ["Unqualified access", "Unknown"])
+        write_report(current := tmp_path.joinpath("current.json"), "A.qml", ["Unqualified access", "Other"])
+        qmllint_codequality.convert_file(previous, reference := tmp_path.joinpath("baseline.json"))
+        output = tmp_path.joinpath("codequality.json")
+
+        with baseline.BaselineIndex.open(reference) as baseline_index:
+            assert len(baseline_index) == 2
+            assert qmllint_codequality.convert_file(current, output, baseline_index=baseline_index) == 1
+            assert baseline_index.write_fixed(fixed := tmp_path.joinpath("fixed.json")) == 1
+
+        assert [issue["description"] for issue in json.loads(output.read_bytes())] == ["Other"]
+        assert [issue["description"] for issue in json.loads(fixed.read_bytes())] == ["Unknown"]
+
+    def test_reuse(self, tmp_path: pathlib.Path) -> None:
+        """Check that the index is reused while the baseline does not change, and built again otherwise.
+
+        :param tmp_path: A temporary directory.
+        :type tmp_path: pathlib.Path
+        """
+        write_report(report := tmp_path.joinpath("qmllint.json"), "A.qml", ["Unqualified access"])
+        qmllint_codequality.convert_file(report, reference := tmp_path.joinpath("baseline.json"))
+        index_path = tmp_path.joinpath("baseline.json" + baseline.INDEX_SUFFIX)
+
+        baseline.BaselineIndex.open(reference).close()
+        inode = index_path.stat().st_ino
+
+        baseline.BaselineIndex.open(reference).close()
+        assert index_path.stat().st_ino == inode
+
+        write_report(report, "A.qml", ["Unqualified access", "Unknown"])
+        qmllint_codequality.convert_file(report, reference)
+
+        with baseline.BaselineIndex.open(reference) as baseline_index:
+            assert index_path.stat().st_ino != inode
+            assert len(baseline_index) == 2
+
+    def test_compressed(self, tmp_path: pathlib.Path) -> None:
+        """Check that a compressed baseline is read, and that the fixed issues are compressed by extension.
+
+        :param tmp_path: A temporary directory.
+        :type tmp_path: pathlib.Path
+        """
+        write_report(previous := tmp_path.joinpath("previous.json"), "A.qml", ["Unqualified access", "Unknown"])
+        qmllint_codequality.convert_file(previous, reference := tmp_path.joinpath("baseline.json.gz"))
+
+        with baseline.BaselineIndex.open(reference) as baseline_index:
+            assert len(baseline_index) == 2
+            assert baseline_index.write_fixed(fixed := tmp_path.joinpath("fixed.json.bz2")) == 2
+
+        assert len(json.loads(bz2.decompress(fixed.read_bytes()))) == 2
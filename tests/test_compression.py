@@ -0,0 +1,99 @@
+"""Module for testing the reading and the writing of compressed reports."""
+
+import bz2
+import gzip
+import io
+import json
+import logging
+import lzma
+import pathlib
+import pytest
+
+import qmllint_codequality
+from qmllint_codequality import compression
+from tests.conftest import write_report
+
+logger = logging.getLogger(f"qmllint_codequality.{__name__}")
+
+MODULES = {"gzip": gzip, "xz": lzma, "bz2": bz2}
+"""The standard library module of each compression."""
+
+
+class TestCompression:
+    """Check that the compressed reports are read and written transparently."""
+
+    @pytest.mark.parametrize("memory_map", [False, True])
+    @pytest.mark.parametrize("extension", list(compression.EXTENSIONS))
+    def test_round_trip(self, tmp_path: pathlib.Path, extension: str, memory_map: bool) -> None:
+        """Check that a compressed report gives the same issues as the uncompressed one, compressed the same way.
+
+        :param tmp_path: A temporary directory.
+        :type tmp_path: pathlib.Path
+        :param extension: The extension of the compressed files.
+        :type extension: str
+        :param memory_map: Whether to memory-map the input, ignored as it is compressed.
+        :type memory_map: bool
+        """
+        module = MODULES[compression.EXTENSIONS[extension]]
+        write_report(report := tmp_path.joinpath("qmllint.json"), "A.qml", ["Unqualified access", "Unknown"])
+
+        # The compression of the input is detected from its content, not from its name
+        compressed_report = tmp_path.joinpath("qmllint.json.in")
+        compressed_report.write_bytes(module.compress(report.read_bytes()))
+
+        assert qmllint_codequality.convert_file(report, expected := tmp_path.joinpath("expected.json")) == 2
+
+        output = tmp_path.joinpath(f"codequality.json{extension}")
+        assert qmllint_codequality.convert_file(compressed_report, output, compression_level=1, memory_map=memory_map)
+
+        assert module.decompress(output.read_bytes()) == expected.read_bytes()
+
+    def test_reproducible(self, tmp_path: pathlib.Path) -> None:
+        """Check that the gzip output does not depend on the time of the conversion.
+
+        :param tmp_path: A temporary directory.
+        :type tmp_path: pathlib.Path
+        """
+        write_report(report := tmp_path.joinpath("qmllint.json"), "A.qml", ["Unqualified access"])
+
+        qmllint_codequality.convert_file(report, first := tmp_path.joinpath("first.json.gz"))
+        qmllint_codequality.convert_file(report, second := tmp_path.joinpath("second.json.gz"))
+
+        assert first.read_bytes() == second.read_bytes()
+
+    def test_directory(self, tmp_path: pathlib.Path) -> None:
+        """Check that the compressed reports of a directory are merged with the uncompressed ones.
+
+        :param tmp_path: A temporary directory.
+        :type tmp_path: pathlib.Path
+        """
+        write_report(tmp_path.joinpath("shards", "1.json"), "A.qml", ["Unqualified access"])
+        write_report(report := tmp_path.joinpath("2.json"), "B.qml", ["Unknown"])
+        tmp_path.joinpath("shards", "2.json.xz").write_bytes(lzma.compress(report.read_bytes()))
+
+        assert qmllint_codequality.convert_files([tmp_path.joinpath("shards")], tmp_path / "out.json") == 2
+
+    def test_uncompressed_input(self) -> None:
+        """Check that an uncompressed input is read unchanged, even without ``peek``."""
+        content = b'{"files": []}'
+
+        with compression.open_input(io.BytesIO(content)) as file:
+            assert file.read() == content
+
+    def test_unknown_compression(self) -> None:
+        """Check that an unknown compression is rejected."""
+        with pytest.raises(ValueError):
+            compression.open_output(io.BytesIO(), "zstd")
+
+    @pytest.mark.parametrize(
+        ("path", "expected"), [("a.json", None), ("a.json.gz", "gzip"), ("a.JSON.XZ", "xz"), ("a.bz2", "bz2")]
+    )
+    def test_from_path(self, path: str, expected: str | None) -> None:
+        """Check that the compression of an output is chosen from its extension.
+
+        :param path: The path of the output.
+        :type path: str
+        :param expected: The expected compression.
+        :type expected: str | None
+        """
+        assert compression.from_path(path) == expected
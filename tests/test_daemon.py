@@ -0,0 +1,147 @@
+"""Module for testing the conversion server and its client."""
+
+import json
+import logging
+import pathlib
+import subprocess
+import sys
+import threading
+from typing import Iterator
+import pytest
+
+import qmllint_codequality
+import qmllint_codequality_client
+from qmllint_codequality import daemon
+from tests.conftest import write_report
+
+logger = logging.getLogger(f"qmllint_codequality.{__name__}")
+
+
+@pytest.fixture(name="server")
+def fixture_server(tmp_path: pathlib.Path) -> Iterator[daemon.ConversionServer]:
+    """Run a conversion server in a thread.
+
+    :param tmp_path: A temporary directory, containing the socket.
+    :type tmp_path: pathlib.Path
+    :yield: The running server.
+    :rtype: Iterator[daemon.ConversionServer]
+    """
+    with daemon.ConversionServer(tmp_path.joinpath("server.sock")) as server:
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+
+        try:
+            yield server
+        finally:
+            server.shutdown()
+            thread.join()
+
+
+class TestDaemon:
+    """Check the conversion of reports by a server."""
+
+    def test_convert(self, tmp_path: pathlib.Path, server: daemon.ConversionServer) -> None:
+        """Check that the server converts the reports as in process, reusing its engine.
+
+        :param tmp_path: A temporary directory.
+        :type tmp_path: pathlib.Path
+        :param server: A running server.
+        :type server: daemon.ConversionServer
+        """
+        write_report(report := tmp_path.joinpath("qmllint.json"), "A.qml", ["Unqualified access", "Unknown"])
+        qmllint_codequality.convert_file(report, expected := tmp_path.joinpath("expected.json"))
+
+        for _ in range(2):
+            output = tmp_path.joinpath("codequality.json")
+            output.unlink(missing_ok=True)
+
+            nb_issues = qmllint_codequality_client.request_conversion(report, output, socket_path=server.server_address)
+
+            assert nb_issues == 2
+            assert json.loads(output.read_bytes()) == json.loads(expected.read_bytes())
+
+        assert len(server._engines) == 1  # pylint: disable=protected-access
+
+    def test_unknown_engine(self, tmp_path: pathlib.Path, server: daemon.ConversionServer) -> None:
+        """Check that an unknown fingerprint engine is reported to the client as in process.
+
+        :param tmp_path: A temporary directory.
+        :type tmp_path: pathlib.Path
+        :param server: A running server.
+        :type server: daemon.ConversionServer
+        """
+        write_report(report := tmp_path.joinpath("qmllint.json"), "A.qml", ["Unqualified access"])
+
+        with pytest.raises(KeyError):
+            qmllint_codequality_client.request_conversion(
+                report, tmp_path / "out.json", "unknown", socket_path=server.server_address
+            )
+
+    def test_conversion_error(self, tmp_path: pathlib.Path, server: daemon.ConversionServer) -> None:
+        """Check that a failed conversion is reported to the client, not retried in process, and keeps the server up.
+
+        :param tmp_path: A temporary directory.
+        :type tmp_path: pathlib.Path
+        :param server: A running server.
+        :type server: daemon.ConversionServer
+        """
+        (report := tmp_path.joinpath("qmllint.json")).write_text('{"files": [{"filename": "A.qml", "warnings": [')
+
+        with pytest.raises(qmllint_codequality_client.ServerError, match="cannot convert"):
+            qmllint_codequality_client.convert(report, tmp_path / "out.json", socket_path=server.server_address)
+
+        write_report(report, "A.qml", ["Unqualified access"])
+
+        assert (
+            qmllint_codequality_client.request_conversion(
+                report, tmp_path / "out.json", socket_path=server.server_address
+            )
+            == 1
+        )
+
+    def test_invalid_request(self, server: daemon.ConversionServer) -> None:
+        """Check that the invalid requests, and the requests of other versions, are answered with their reason.
+
+        :param server: A running server.
+        :type server: daemon.ConversionServer
+        """
+        assert server.convert({"version": "0"})["reason"] == qmllint_codequality_client.REASON_VERSION
+
+        with pytest.raises(KeyError):
+            server.convert({"version": qmllint_codequality.__version__})
+
+    def test_already_running(self, server: daemon.ConversionServer) -> None:
+        """Check that a second server cannot listen on the socket of a running one.
+
+        :param server: A running server.
+        :type server: daemon.ConversionServer
+        """
+        with pytest.raises(OSError, match="already listening"):
+            daemon.ConversionServer(server.server_address)
+
+    def test_fallback(self, tmp_path: pathlib.Path) -> None:
+        """Check that the report is converted in process when no server is running.
+
+        :param tmp_path: A temporary directory.
+        :type tmp_path: pathlib.Path
+        """
+        write_report(report := tmp_path.joinpath("qmllint.json"), "A.qml", ["Unqualified access"])
+        socket_path = tmp_path.joinpath("missing.sock")
+
+        with pytest.raises(qmllint_codequality_client.ServerUnavailableError):
+            qmllint_codequality_client.request_conversion(report, tmp_path / "out.json", socket_path=socket_path)
+
+        assert qmllint_codequality_client.convert(report, tmp_path / "out.json", socket_path=socket_path) == 1
+
+    def test_client_does_not_import_package(self) -> None:
+        """Check that the client starts without importing the package, nor logging."""
+        result = subprocess.run(
+            [sys.executable, "-c", "import sys, qmllint_codequality_client; print(sorted(sys.modules))"],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+
+        assert "'qmllint_codequality'" not in result.stdout
+        assert "'logging'" not in result.stdout
+        assert qmllint_codequality_client.package_version() == qmllint_codequality.__version__
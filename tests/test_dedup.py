@@ -0,0 +1,62 @@
+"""Module for testing the removal of the duplicated Code Quality issues."""
+
+import json
+import logging
+import pathlib
+import pytest
+
+import qmllint_codequality
+from qmllint_codequality import dedup, qmllint, stats
+
+logger = logging.getLogger(f"qmllint_codequality.{__name__}")
+
+
+def _write_duplicated_report(path: pathlib.Path, nb_warnings: int) -> None:
+    """Write a qmllint report, where each warning is reported twice.
+
+    :param path: Path of the report to write.
+    :type path: pathlib.Path
+    :param nb_warnings: Number of distinct warnings.
+    :type nb_warnings: int
+    """
+    warnings: list[qmllint.WarningDetails] = [
+        {"column": 1, "length": 1, "line": line, "message": "Unqualified access", "type": "warning"}
+        for line in range(1, nb_warnings + 1)
+    ]
+    report: qmllint.Report = {"files": [{"filename": "A.qml", "success": False, "warnings": warnings + warnings}]}
+    path.write_text(json.dumps(report), encoding="utf8")
+
+
+class TestDuplicateFilter:
+    """Check that the issues whose fingerprint was already written are removed."""
+
+    @pytest.mark.parametrize("max_memory_digests", [None, 1, 3])
+    def test_convert_file(self, tmp_path: pathlib.Path, max_memory_digests: int | None) -> None:
+        """Check that a warning reported twice is written once, whether the fingerprints are moved to disk or not.
+
+        :param tmp_path: A temporary directory.
+        :type tmp_path: pathlib.Path
+        :param max_memory_digests: Number of digests kept in memory.
+        :type max_memory_digests: int | None
+        """
+        _write_duplicated_report(report := tmp_path.joinpath("qmllint.json"), 5)
+        output = tmp_path.joinpath("codequality.json")
+        statistics = stats.Statistics()
+
+        with dedup.DuplicateFilter(max_memory_digests) as duplicate_filter:
+            nb_issues = qmllint_codequality.convert_file(
+                report, output, statistics=statistics, duplicate_filter=duplicate_filter
+            )
+            assert len(duplicate_filter) == 5
+
+        assert nb_issues == 5
+
+        assert duplicate_filter.duplicates == 5
+        assert statistics.to_dict()["duplicates"] == 5
+        lines = [issue["location"]["position"]["begin"]["lines"] for issue in json.loads(output.read_bytes())]
+        assert lines == [1, 2, 3, 4, 5]
+
+    def test_digest(self) -> None:
+        """Check that the hexadecimal fingerprints are stored in binary, and the others hashed."""
+        assert dedup.fingerprint_digest("00ff") == b"\x00\xff"
+        assert len(dedup.fingerprint_digest("not hexadecimal")) == dedup.DIGEST_SIZE
@@ -0,0 +1,100 @@
+"""Module for testing the conversion of a single qmllint diagnostic."""
+
+import hashlib
+import logging
+import pathlib
+
+from qmllint_codequality import Diagnostic, fingerprint
+
+logger = logging.getLogger(f"qmllint_codequality.{__name__}")
+
+
+class TestLayout:
+    """Check the compact layout of the diagnostics."""
+
+    def test_no_instance_dictionary(self) -> None:
+        """Check that the diagnostics do not have an instance dictionary."""
+        assert not hasattr(Diagnostic("Main.qml", "warning", "Unqualified access", 1, 2, 3), "__dict__")
+
+    def test_interned_strings(self) -> None:
+        """Check that equal file names and messages are shared between the diagnostics."""
+        first = Diagnostic("".join(["Main", ".qml"]), "warning", "".join(["Unqualified", " access"]))
+        second = Diagnostic("".join(["Main.", "qml"]), "warning", "".join(["Unqualified ", "access"]))
+
+        assert first.to_code_quality()["location"]["path"] is second.to_code_quality()["location"]["path"]
+        assert first.to_code_quality()["description"] is second.to_code_quality()["description"]
+
+
+class TestFingerprint:
+    """Check the fingerprint engines."""
+
+    def test_md5_compatibility(self) -> None:
+        """Check that the MD5 engine computes the fingerprints of the previous versions."""
+        diagnostic = Diagnostic("Main.qml", "warning", "Unqualified access", 1, 2, 3, fingerprint.Md5Fingerprint())
+
+        assert diagnostic.fingerprint == hashlib.md5(str(diagnostic).encode("utf8")).hexdigest()
+
+    def test_coordinates_depend_on_line(self) -> None:
+        """Check that the default engine changes the fingerprint when the diagnostic moves."""
+        first = Diagnostic("Main.qml", "warning", "Unqualified access", 1, 2, 3)
+        second = Diagnostic("Main.qml", "warning", "Unqualified access", 2, 2, 3)
+
+        assert first.fingerprint != second.fingerprint
+
+    def test_content_stable_on_line_shift(self, tmp_path: pathlib.Path) -> None:
+        """Check that the content engine keeps the fingerprints when lines are added above the diagnostics.
+
+        :param tmp_path: A temporary directory.
+        :type tmp_path: pathlib.Path
+        """
+        source = tmp_path.joinpath("Main.qml")
+        engine = fingerprint.ContentFingerprint(source_root=tmp_path)
+
+        def fingerprints(*lines: int) -> list[str]:
+            engine.reset()
+            return [
+                Diagnostic("Main.qml", "warning", "Unqualified access", line, 5, 1, engine).fingerprint
+                for line in lines
+            ]
+
+        source.write_text("Item {\n    x: foo\n    y: foo\n}\n")
+        before = fingerprints(2, 3)
+
+        source.write_text("import QtQuick\n\nItem {\n      x:   foo\n    y: foo\n}\n")
+        after = fingerprints(4, 5)
+
+        assert before == after
+        assert len(set(before)) == len(before)
+        assert engine._sources.info().misses == 1  # pylint: disable=protected-access
+
+    def test_content_occurrences_kept_on_eviction(self, tmp_path: pathlib.Path) -> None:
+        """Check that the occurrences of a file are still counted once it has been evicted from the cache.
+
+        :param tmp_path: A temporary directory.
+        :type tmp_path: pathlib.Path
+        """
+        for name in ("A.qml", "B.qml"):
+            tmp_path.joinpath(name).write_text("Item {\n    x: foo\n}\n")
+
+        engine = fingerprint.ContentFingerprint(source_root=tmp_path, cache_size=1)
+        fingerprints = [
+            Diagnostic(name, "warning", "Unqualified access", 2, 5, 1, engine).fingerprint
+            for name in ("A.qml", "B.qml", "A.qml", "B.qml")
+        ]
+
+        assert len(set(fingerprints)) == len(fingerprints)
+
+    def test_content_fallback(self, tmp_path: pathlib.Path) -> None:
+        """Check that the content engine hashes the position, when the source file cannot be read.
+
+        :param tmp_path: A temporary directory.
+        :type tmp_path: pathlib.Path
+        """
+        engine = fingerprint.ContentFingerprint(source_root=tmp_path)
+
+        assert (
+            Diagnostic("Missing.qml", "warning", "Unqualified access", 1, 2, 3, engine).fingerprint
+            == Diagnostic(
+                "Missing.qml", "warning", "Unqualified access", 1, 2, 3, fingerprint.CoordinatesFingerprint()
+            ).fingerprint
+        )
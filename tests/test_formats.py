@@ -0,0 +1,77 @@
+"""Module for testing the output formats."""
+
+import json
+import logging
+import pathlib
+import xml.etree.ElementTree
+import pytest
+
+import qmllint_codequality
+from qmllint_codequality import formats
+from tests.conftest import write_report
+
+logger = logging.getLogger(f"qmllint_codequality.{__name__}")
+
+
+class TestSerializers:
+    """Check that a single conversion writes the issues in several formats."""
+
+    @pytest.fixture(name="outputs")
+    def fixture_outputs(self, tmp_path: pathlib.Path) -> dict[str, pathlib.Path]:
+        """Convert a report into all the formats at once.
+
+        :param tmp_path: A temporary directory.
+        :type tmp_path: pathlib.Path
+        :return: The path of the output file of each format.
+        :rtype: dict[str, pathlib.Path]
+        """
+        write_report(
+            report := tmp_path.joinpath("qmllint.json"), "A.qml", ["Unqualified access", "Unknown <&>\"'\r\n\t\x01"]
+        )
+        outputs = {name: tmp_path.joinpath(f"output.{name}") for name in formats.SERIALIZERS}
+        extra_outputs = [(name, path) for name, path in outputs.items() if name != formats.DEFAULT_FORMAT]
+
+        nb_issues = qmllint_codequality.convert_file(
+            report, outputs[formats.DEFAULT_FORMAT], extra_outputs=extra_outputs
+        )
+        assert nb_issues == 2
+
+        return outputs
+
+    def test_ndjson(self, outputs: dict[str, pathlib.Path]) -> None:
+        """Check that the NDJSON output holds the same issues as the Code Quality report.
+
+        :param outputs: The path of the output file of each format.
+        :type outputs: dict[str, pathlib.Path]
+        """
+        issues = [json.loads(line) for line in outputs["ndjson"].read_text(encoding="utf8").splitlines()]
+
+        assert issues == json.loads(outputs["codequality"].read_bytes())
+
+    def test_sarif(self, outputs: dict[str, pathlib.Path]) -> None:
+        """Check that the SARIF results reference the rules, and keep the fingerprints.
+
+        :param outputs: The path of the output file of each format.
+        :type outputs: dict[str, pathlib.Path]
+        """
+        (run,) = json.loads(outputs["sarif"].read_bytes())["runs"]
+        issues = json.loads(outputs["codequality"].read_bytes())
+        rules = [rule["id"] for rule in run["tool"]["driver"]["rules"]]
+
+        assert len(rules) == 2
+        assert all(rules[result["ruleIndex"]] == result["ruleId"] for result in run["results"])
+        assert [result["partialFingerprints"]["qmllintCodeQuality/v1"] for result in run["results"]] == [
+            issue["fingerprint"] for issue in issues
+        ]
+        assert run["results"][0]["locations"][0]["physicalLocation"]["region"] == {"startLine": 1, "startColumn": 1}
+
+    def test_junit(self, outputs: dict[str, pathlib.Path]) -> None:
+        """Check that each issue is a failed test case, with its message escaped, whitespaces included.
+
+        :param outputs: The path of the output file of each format.
+        :type outputs: dict[str, pathlib.Path]
+        """
+        root = xml.etree.ElementTree.parse(outputs["junit"]).getroot()
+        failures = root.findall("./testsuite/testcase/failure")
+
+        assert [failure.get("message") for failure in failures] == ["Unqualified access", "Unknown <&>\"'\r\n\t"]
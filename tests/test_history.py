@@ -0,0 +1,75 @@
+"""Module for testing the history of the converted issues."""
+
+import logging
+import pathlib
+from typing import Iterator
+import pytest
+
+import qmllint_codequality
+from qmllint_codequality import codequality, history
+from tests.conftest import write_report
+
+logger = logging.getLogger(f"qmllint_codequality.{__name__}")
+
+
+class TestHistoryStore:
+    """Check that the issues of each run are recorded, and counted over time."""
+
+    def test_trend(self, tmp_path: pathlib.Path) -> None:
+        """Check that the issues are counted per run and directory, a run recorded again being replaced.
+
+        :param tmp_path: A temporary directory.
+        :type tmp_path: pathlib.Path
+        """
+        first, second = tmp_path.joinpath("first.json"), tmp_path.joinpath("second.json")
+        write_report(first, "qml/A.qml", ["Unqualified access", "Unqualified access", "Unknown"])
+        write_report(second, "qml/A.qml", ["Unqualified access"])
+        output = tmp_path.joinpath("codequality.json")
+
+        with history.HistoryStore(tmp_path.joinpath("history", "history.sqlite")) as history_store:
+            qmllint_codequality.convert_file(second, output, history_run=history_store.run("1"))
+            qmllint_codequality.convert_file(first, output, history_run=history_store.run("1"))
+            qmllint_codequality.convert_file(second, output, history_run=(run := history_store.run("2")))
+
+            assert run.recorded == 1
+            assert [run_id for run_id, _ in history_store.runs()] == ["1", "2"]
+            assert [(run_id, directory, count) for run_id, _, directory, count in history_store.trend()] == [
+                ("1", "qml", 3),
+                ("2", "qml", 1),
+            ]
+            assert [(run_id, count) for run_id, _, _, count in history_store.trend("Unknown", by="rule")] == []
+
+            with pytest.raises(ValueError):
+                history_store.trend(by="fingerprint")
+
+    def test_rollback(self, tmp_path: pathlib.Path) -> None:
+        """Check that a run whose issues are not all produced is not recorded.
+
+        :param tmp_path: A temporary directory.
+        :type tmp_path: pathlib.Path
+        """
+
+        def failing_issues() -> Iterator[codequality.Report]:
+            """Produce an issue, then fail.
+
+            :raises RuntimeError: Always, after the first issue.
+            :yield: An issue.
+            :rtype: Iterator[codequality.Report]
+            """
+            yield {
+                "type": "issue",
+                "severity": codequality.Severity.MAJOR,
+                "check_name": "qmllint[Unknown]",
+                "description": "Unknown",
+                "categories": codequality.Category.BUG_RISK,
+                "fingerprint": "00",
+                "location": {"path": "A.qml"},
+            }
+            raise RuntimeError("conversion failed")
+
+        with history.HistoryStore(tmp_path.joinpath("history.sqlite")) as history_store:
+            with pytest.raises(RuntimeError):
+                list(history_store.run("1")(failing_issues()))
+
+            assert not history_store.runs()
+            assert not history_store.trend()
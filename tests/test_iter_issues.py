@@ -0,0 +1,59 @@
+"""Module for testing the conversion of the qmllint warnings already in memory."""
+
+import json
+import logging
+import pathlib
+from typing import Iterator
+
+import qmllint_codequality
+from qmllint_codequality import dedup, qmllint
+from tests.conftest import write_report
+
+logger = logging.getLogger(f"qmllint_codequality.{__name__}")
+
+
+class TestIterIssues:
+    """Check that the warnings in memory are converted lazily, into the same issues as the reports on disk."""
+
+    def test_same_as_convert_file(self, tmp_path: pathlib.Path) -> None:
+        """Check that the file diagnostics, and the warnings given with their file, give the issues of the report.
+
+        :param tmp_path: A temporary directory.
+        :type tmp_path: pathlib.Path
+        """
+        write_report(report := tmp_path.joinpath("qmllint.json"), "A.qml", ["Unqualified access", "Unknown"])
+        qmllint_codequality.convert_file(report, output := tmp_path.joinpath("codequality.json"))
+        expected = json.loads(output.read_bytes())
+
+        (file_diagnostic,) = json.loads(report.read_bytes())["files"]
+        warnings = [(file_diagnostic["filename"], warning) for warning in file_diagnostic["warnings"]]
+
+        assert list(qmllint_codequality.iter_issues([file_diagnostic])) == expected
+        assert list(qmllint_codequality.iter_issues(iter(warnings))) == expected
+        assert list(qmllint_codequality.iter_issues([warnings[0], {**file_diagnostic, "warnings": []}])) == expected[:1]
+
+    def test_lazy(self) -> None:
+        """Check that each warning is only converted when its issue is requested."""
+        consumed: list[str] = []
+
+        def warnings() -> Iterator[tuple[str, qmllint.WarningDetails]]:
+            for line in range(1, 4):
+                consumed.append(f"{line}")
+                yield "A.qml", {"column": 1, "length": 1, "line": line, "message": "Unknown", "type": "warning"}
+
+        issues = qmllint_codequality.iter_issues(warnings())
+        assert not consumed
+
+        next(issues)
+        assert consumed == ["1"]
+
+    def test_duplicates(self) -> None:
+        """Check that the duplicated issues are only removed when a filter is given."""
+        warning: qmllint.WarningDetails = {"column": 1, "length": 1, "line": 1, "message": "Unknown", "type": "warning"}
+        warnings = [("A.qml", warning)] * 2
+
+        assert len(list(qmllint_codequality.iter_issues(warnings))) == 2
+
+        with dedup.DuplicateFilter() as duplicate_filter:
+            assert len(list(qmllint_codequality.iter_issues(warnings, duplicate_filter=duplicate_filter))) == 1
+            assert duplicate_filter.duplicates == 1
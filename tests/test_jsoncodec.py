@@ -0,0 +1,99 @@
+"""Module for testing the JSON codecs."""
+
+import json
+import logging
+import pytest
+
+from qmllint_codequality import jsoncodec
+
+logger = logging.getLogger(f"qmllint_codequality.{__name__}")
+
+VALUE = {"files": [{"filename": "/path/to/Main.qml", "warnings": [{"message": 'a "b" ✓', "line": 2}]}], "x": None}
+"""A value holding every kind of JSON value, and non-ASCII characters."""
+
+
+@pytest.fixture(name="codec", params=list(jsoncodec.CODECS))
+def fixture_codec(request: pytest.FixtureRequest) -> jsoncodec.Codec:
+    """Create each codec, skipping those whose package is not installed.
+
+    :param request: The request, holding the name of the codec.
+    :type request: pytest.FixtureRequest
+    :return: The codec.
+    :rtype: jsoncodec.Codec
+    """
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+
+    return jsoncodec.create_codec(request.param)
+
+
+class TestCodec:
+    """Check that the codecs decode and encode the same values as the standard library."""
+
+    @pytest.mark.parametrize("indent", [None, 2, 4])
+    def test_round_trip(self, codec: jsoncodec.Codec, indent: int | None) -> None:
+        """Check that an encoded value is decoded back, by the codec and by the standard library.
+
+        :param codec: The codec.
+        :type codec: jsoncodec.Codec
+        :param indent: The indentation level.
+        :type indent: int | None
+        """
+        data = codec.dumps(VALUE, indent)
+
+        assert codec.loads(data) == VALUE
+        assert json.loads(data) == VALUE
+        assert (b"\n" in data) == (indent is not None)
+
+    @pytest.mark.parametrize("data", [b'{"a": 1}', bytearray(b'{"a": 1}'), memoryview(b'[{"a": 1}]')[1:-1]])
+    def test_buffers(self, codec: jsoncodec.Codec, data: jsoncodec.Buffer) -> None:
+        """Check that all the binary buffers are decoded.
+
+        :param codec: The codec.
+        :type codec: jsoncodec.Codec
+        :param data: The buffer.
+        :type data: jsoncodec.Buffer
+        """
+        assert codec.loads(data) == {"a": 1}
+
+    def test_invalid_utf8(self, codec: jsoncodec.Codec) -> None:
+        """Check that the invalid UTF-8 sequences are replaced.
+
+        :param codec: The codec.
+        :type codec: jsoncodec.Codec
+        """
+        assert codec.loads(b'{"a": "b\xff"}') == {"a": "b�"}
+
+    @pytest.mark.parametrize("data", [b"", b'{"a": }', b"[1] 2"])
+    def test_malformed(self, codec: jsoncodec.Codec, data: bytes) -> None:
+        """Check that a malformed document raises the error of the standard library.
+
+        :param codec: The codec.
+        :type codec: jsoncodec.Codec
+        :param data: The document.
+        :type data: bytes
+        """
+        with pytest.raises(json.JSONDecodeError):
+            codec.loads(data)
+
+
+class TestCreateCodec:
+    """Check the selection of the codecs."""
+
+    def test_auto(self) -> None:
+        """Check that orjson is used when it is installed."""
+        try:
+            import orjson  # noqa: F401  # pylint: disable=import-outside-toplevel,unused-import
+        except ImportError:
+            assert isinstance(jsoncodec.create_codec(), jsoncodec.StdlibCodec)
+        else:
+            assert isinstance(jsoncodec.create_codec(), jsoncodec.OrjsonCodec)
+
+    def test_shared(self) -> None:
+        """Check that the codecs are created once."""
+        assert jsoncodec.create_codec("stdlib") is jsoncodec.create_codec("stdlib")
+
+    def test_unknown(self) -> None:
+        """Check that an unknown codec is rejected."""
+        with pytest.raises(KeyError):
+            jsoncodec.create_codec("unknown")
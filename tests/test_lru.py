@@ -0,0 +1,79 @@
+"""Module for testing the bounded cache."""
+
+import concurrent.futures
+import copy
+import logging
+import pickle
+import pytest
+
+from qmllint_codequality import CLASSIFICATION_CACHE, Diagnostic, lru, qmllint
+
+logger = logging.getLogger(f"qmllint_codequality.{__name__}")
+
+
+class TestLRUCache:
+    """Check the eviction and the statistics of the cache."""
+
+    def test_eviction(self) -> None:
+        """Check that the least recently used entry is evicted first."""
+        cache: lru.LRUCache[int, int] = lru.LRUCache(2)
+
+        assert cache.get(1, str) == "1"
+        assert cache.get(2, str) == "2"
+        assert cache.get(1, pytest.fail) == "1"  # 2 becomes the least recently used
+        assert cache.get(3, str) == "3"
+        assert cache.get(2, lambda key: "computed again") == "computed again"
+        assert cache.info() == lru.CacheInfo(hits=1, misses=4, maxsize=2, currsize=2)
+
+    def test_resize(self) -> None:
+        """Check that shrinking the cache evicts the entries, and that a null size disables the cache."""
+        cache: lru.LRUCache[int, int] = lru.LRUCache(3)
+
+        for key in range(3):
+            cache.get(key, str)
+
+        cache.resize(1)
+        assert cache.get(2, pytest.fail) == "2"
+
+        cache.resize(0)
+        assert cache.info().currsize == 0
+        cache.get(2, str)
+        assert cache.info().currsize == 0
+
+        with pytest.raises(ValueError):
+            cache.resize(-1)
+
+    def test_pickle(self) -> None:
+        """Check that a pickled, or copied, cache keeps its entries, and gets its own lock."""
+        cache: lru.LRUCache[int, str] = lru.LRUCache(2)
+        cache.get(1, str)
+
+        for copied in (pickle.loads(pickle.dumps(cache)), copy.deepcopy(cache)):
+            assert copied.get(1, pytest.fail) == "1"
+            assert copied.info() == lru.CacheInfo(hits=1, misses=1, maxsize=2, currsize=1)
+            assert copied._lock is not cache._lock  # pylint: disable=protected-access
+
+    def test_threads(self) -> None:
+        """Check that the cache stays consistent when shared between threads."""
+        cache: lru.LRUCache[int, str] = lru.LRUCache(8)
+
+        def lookup(start: int) -> None:
+            for key in range(start, start + 1000):
+                assert cache.get(key % 16, str) == str(key % 16)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lookup, range(0, 4000, 1000)))
+
+        info = cache.info()
+        assert info.hits + info.misses == 4000
+        assert info.currsize == 8
+
+
+def test_diagnostic_classification_cached() -> None:
+    """Check that the classification of a repeated message is found in the cache."""
+    hits = CLASSIFICATION_CACHE.info().hits
+
+    for _ in range(3):
+        assert Diagnostic.classify("Unqualified access")[0] is qmllint.Rules.UNQUALIFIED_ACCESS
+
+    assert CLASSIFICATION_CACHE.info().hits >= hits + 2
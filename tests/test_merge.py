@@ -0,0 +1,135 @@
+"""Module for testing the merge of several qmllint reports."""
+
+import concurrent.futures
+import json
+import logging
+import pathlib
+import pytest
+
+import qmllint_codequality
+from tests.conftest import write_report
+
+logger = logging.getLogger(f"qmllint_codequality.{__name__}")
+
+
+class TestConvertFiles:
+    """Check the conversion of several reports into a single Code Quality report."""
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_merge(self, tmp_path: pathlib.Path, jobs: int) -> None:
+        """Check that the reports given as directory and glob are merged in order, without duplicates.
+
+        :param tmp_path: A temporary directory.
+        :type tmp_path: pathlib.Path
+        :param jobs: The number of reports converted at the same time.
+        :type jobs: int
+        """
+        write_report(tmp_path.joinpath("shards", "a", "1.json"), "A.qml", ["Unqualified access", "Unknown"])
+        write_report(tmp_path.joinpath("shards", "b", "2.json"), "A.qml", ["Unqualified access"])
+        write_report(tmp_path.joinpath("last-3.json"), "B.qml", ["Unqualified access"])
+        output = tmp_path.joinpath("shards", "codequality.json")
+
+        inputs = [tmp_path.joinpath("shards"), str(tmp_path.joinpath("last-*.json"))]
+
+        assert qmllint_codequality.convert_files(inputs, output, jobs=jobs) == 3
+
+        issues = json.loads(output.read_text(encoding="utf8"))
+        assert [(issue["location"]["path"], issue["description"]) for issue in issues] == [
+            ("A.qml", "Unqualified access"),
+            ("A.qml", "Unknown"),
+            ("B.qml", "Unqualified access"),
+        ]
+
+    def test_no_input(self, tmp_path: pathlib.Path) -> None:
+        """Check that the conversion fails when no report is found.
+
+        :param tmp_path: A temporary directory.
+        :type tmp_path: pathlib.Path
+        """
+        assert qmllint_codequality.convert_files([str(tmp_path.joinpath("*.json"))], tmp_path / "out.json") < 0
+
+    @pytest.mark.parametrize("nb_reports, jobs", [(1, None), (2, 1)])
+    def test_serial(self, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch, nb_reports: int, jobs: int) -> None:
+        """Check that a single report, or a single job, is converted without starting a pool of processes.
+
+        :param tmp_path: A temporary directory.
+        :type tmp_path: pathlib.Path
+        :param monkeypatch: Fixture making the pool of processes unusable.
+        :type monkeypatch: pytest.MonkeyPatch
+        :param nb_reports: The number of reports converted.
+        :type nb_reports: int
+        :param jobs: The number of reports converted at the same time.
+        :type jobs: int
+        """
+        monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", None)
+        inputs = [tmp_path.joinpath(f"{index}.json") for index in range(nb_reports)]
+
+        for index, input_path in enumerate(inputs):
+            write_report(input_path, f"{index}.qml", ["Unknown"])
+
+        assert qmllint_codequality.convert_files(inputs, tmp_path.joinpath("out.json"), jobs=jobs) == nb_reports
+
+    def test_invalid_jobs(self, tmp_path: pathlib.Path) -> None:
+        """Check that the conversion refuses a number of jobs that is not strictly positive.
+
+        :param tmp_path: A temporary directory.
+        :type tmp_path: pathlib.Path
+        """
+        write_report(tmp_path.joinpath("qmllint.json"), "A.qml", ["Unknown"])
+
+        with pytest.raises(ValueError, match="strictly positive"):
+            qmllint_codequality.convert_files(
+                [tmp_path.joinpath("qmllint.json")], tmp_path.joinpath("out.json"), jobs=0
+            )
+
+
+class TestParallelConversion:
+    """Check the conversion of a single report split into chunks converted in parallel."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 100])
+    def test_same_order(self, chunk_size: int) -> None:
+        """Check that the issues are the same, and in the same order, as with the serial conversion.
+
+        :param chunk_size: Minimal number of warnings in a chunk.
+        :type chunk_size: int
+        """
+        warnings = [
+            (f"File{index // 3}.qml", {"line": index, "message": f"Message {index}", "type": "warning"})
+            for index in range(20)
+        ]
+
+        # pylint: disable=protected-access
+        assert list(qmllint_codequality._iter_code_quality_parallel(warnings, None, 3, chunk_size)) == list(
+            qmllint_codequality._iter_code_quality(warnings)
+        )
+
+    def test_byte_identical(self, tmp_path: pathlib.Path) -> None:
+        """Check that the output file is the same as with the serial conversion.
+
+        :param tmp_path: A temporary directory.
+        :type tmp_path: pathlib.Path
+        """
+        write_report(tmp_path.joinpath("qmllint.json"), "A.qml", ["Unqualified access"] * 5)
+
+        qmllint_codequality.convert_file(tmp_path.joinpath("qmllint.json"), tmp_path.joinpath("serial.json"))
+        qmllint_codequality.convert_file(tmp_path.joinpath("qmllint.json"), tmp_path.joinpath("parallel.json"), jobs=2)
+
+        assert tmp_path.joinpath("serial.json").read_bytes() == tmp_path.joinpath("parallel.json").read_bytes()
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_memory_map(self, tmp_path: pathlib.Path, jobs: int) -> None:
+        """Check that the output file is the same when the report is memory-mapped.
+
+        :param tmp_path: A temporary directory.
+        :type tmp_path: pathlib.Path
+        :param jobs: Number of processes converting the warnings.
+        :type jobs: int
+        """
+        write_report(tmp_path.joinpath("qmllint.json"), "A.qml", ["Unqualified access", 'Unknown "é"'] * 5)
+
+        qmllint_codequality.convert_file(tmp_path.joinpath("qmllint.json"), tmp_path.joinpath("streamed.json"))
+        qmllint_codequality.convert_file(
+            tmp_path.joinpath("qmllint.json"), tmp_path.joinpath("mapped.json"), jobs=jobs, memory_map=True
+        )
+
+        assert tmp_path.joinpath("streamed.json").read_bytes() == tmp_path.joinpath("mapped.json").read_bytes()
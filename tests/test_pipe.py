@@ -0,0 +1,68 @@
+"""Module for testing the conversion from the standard input to the standard output."""
+
+import json
+import logging
+import pathlib
+import subprocess
+import sys
+import pytest
+
+import qmllint_codequality
+from tests.conftest import write_report
+
+logger = logging.getLogger(f"qmllint_codequality.{__name__}")
+
+
+class TestPipe:
+    """Check the conversion of a report piped into the application."""
+
+    @pytest.mark.parametrize("jobs", ["1", "2"])
+    def test_stdin_to_stdout(self, tmp_path: pathlib.Path, jobs: str) -> None:
+        """Check that a report read from the standard input is converted to the standard output, without log.
+
+        :param tmp_path: A temporary directory.
+        :type tmp_path: pathlib.Path
+        :param jobs: The number of processes converting the report.
+        :type jobs: str
+        """
+        report = tmp_path.joinpath("qmllint.json")
+        write_report(report, "A.qml", ["Unqualified access", "Unknown"])
+        qmllint_codequality.convert_file(report, expected := tmp_path.joinpath("codequality.json"))
+
+        result = subprocess.run(
+            [sys.executable, "-m", "qmllint_codequality", "-", "-", "--jobs", jobs],
+            input=report.read_bytes(),
+            capture_output=True,
+            check=True,
+        )
+
+        assert json.loads(result.stdout) == json.loads(expected.read_bytes())
+        assert b"Converted 2 qmllint issues" in result.stderr
+
+    @pytest.mark.parametrize("jobs", ["0", "-3"])
+    def test_invalid_jobs(self, jobs: str) -> None:
+        """Check that a number of jobs that is not strictly positive is refused with the matching message.
+
+        :param jobs: The number of processes converting the report.
+        :type jobs: str
+        """
+        result = subprocess.run(
+            [sys.executable, "-m", "qmllint_codequality", "-", "-", "--jobs", jobs], capture_output=True, check=False
+        )
+
+        assert result.returncode == 2
+        assert f"must be strictly positive: '{jobs}'".encode() in result.stderr
+
+    def test_bare_output_filename(self, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Check that an output file name without folder is written in the current directory.
+
+        :param tmp_path: A temporary directory.
+        :type tmp_path: pathlib.Path
+        :param monkeypatch: Fixture changing the current directory.
+        :type monkeypatch: pytest.MonkeyPatch
+        """
+        write_report(report := tmp_path.joinpath("qmllint.json"), "A.qml", ["Unqualified access"])
+        monkeypatch.chdir(tmp_path)
+
+        assert qmllint_codequality.convert_file(report, "codequality.json") == 1
+        assert len(json.loads(tmp_path.joinpath("codequality.json").read_bytes())) == 1
@@ -0,0 +1,81 @@
+"""Module for testing the classification of the qmllint messages."""
+
+import logging
+import pytest
+
+from qmllint_codequality import qmllint
+
+logger = logging.getLogger(f"qmllint_codequality.{__name__}")
+
+MESSAGES = [
+    "Using anchors here",
+    'Warnings occurred while importing module "QtQuick.Controls":',
+    "Failed to import QtFoo. Are your import paths set up properly?",
+    "QtFoo was not found. Did you add all import paths?",
+    "Unused import at Main.qml:3:1",
+    "Cannot assign to read-only property width",
+    "Could not compile binding for x: Cannot load property y",
+    "Could not compile binding for x: unsupported",
+    "Found a duplicated id. id root was first declared at 3:5",
+    "Cannot load singleton as property of object",
+    'Property "foo" is deprecated. Reason: none',
+    'Property "foo" not found on type "Item"',
+    "Foo is used but it is not resolved",
+    "String contains unescaped line terminator which is deprecated.",
+    'Alias "a" is part of an alias cycle',
+    "Using attached type Foo already initialized in a parent scope.",
+    "Component is missing required property foo from here",
+    "with statements are strongly discouraged in QML and might cause false positives when analysing unqualified "
+    "identifiers",
+    "Foo is part of an inheritance cycle: Foo -> Bar -> Foo",
+    " is part of an inheritance cycle: Foo -> Bar -> Foo",  # The pattern only matches from the start of the message
+    "Object type is not derived from QObject or QQmlComponent. Foo",
+    "Cannot assign to non-existent default property",
+    'Invalid qmllint directive "foo" provided',
+    "Cannot assign multiple objects to a default non-list property",
+    "Cannot assign to default property of incompatible type",
+    'Duplicate interceptor on property "x"',
+    'Cannot combine value source and binding on property "x"',
+    'Declared signal handler "onFoo" is expecting 1 arguments',
+    "Unqualified access",
+    'Cannot resolve alias "a"',
+    "ids do not need quotation marks",
+    "A message unknown from all the rules",
+    "",
+]
+"""Messages matching each kind of pattern, including messages matched by several rules."""
+
+
+def _from_message_one_by_one(message: str) -> qmllint.Rules:
+    """Determine the rule of a message by trying the patterns one by one.
+
+    :param message: The diagnostic's message.
+    :type message: str
+    :return: The rule, UNKNOWN if not found.
+    :rtype: qmllint.Rules
+    """
+    for rule in qmllint.Rules:
+        for pattern in rule.patterns or ():
+            if pattern.match(message):
+                return rule
+
+    return qmllint.Rules.UNKNOWN
+
+
+class TestFromMessage:
+    """Check the classification of the messages."""
+
+    @pytest.mark.parametrize("message", MESSAGES)
+    def test_first_match(self, message: str) -> None:
+        """Check that the rule is the first one whose pattern matches the message.
+
+        :param message: The diagnostic's message.
+        :type message: str
+        """
+        assert qmllint.Rules.from_message(message) is _from_message_one_by_one(message)
+
+    def test_all_rules_found(self) -> None:
+        """Check that the messages cover all the rules having patterns, so the test above is meaningful."""
+        found = {qmllint.Rules.from_message(message) for message in MESSAGES}
+
+        assert found >= {rule for rule in qmllint.Rules if rule.patterns} | {qmllint.Rules.UNKNOWN}
@@ -0,0 +1,141 @@
+"""Module for testing the qmllint runner, with a fake qmllint executable."""
+
+import json
+import logging
+import os
+import pathlib
+
+import qmllint_codequality
+from qmllint_codequality import fingerprint, lintcache, runner
+
+logger = logging.getLogger(f"qmllint_codequality.{__name__}")
+
+
+class TestLintAndConvert:
+    """Check the conversion of the warnings produced by the qmllint runner."""
+
+    def test_batches(self, tmp_path: pathlib.Path, fake_qmllint: pathlib.Path) -> None:
+        """Check that the QML files are found, linted in batches, and converted in order.
+
+        :param tmp_path: A temporary directory.
+        :type tmp_path: pathlib.Path
+        :param fake_qmllint: The fake qmllint executable.
+        :type fake_qmllint: pathlib.Path
+        """
+        for name in ["b/Second.qml", "a/First.qml", "a/Ignored.js", "Third.qml", "c d/Fourth.qml"]:
+            tmp_path.joinpath("qml", name).parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.joinpath("qml", name).touch()
+
+        output = tmp_path.joinpath("codequality.json")
+        nb_issus = qmllint_codequality.lint_and_convert(
+            [tmp_path.joinpath("qml")], output, jobs=2, executable=str(fake_qmllint), batch_size=3
+        )
+
+        expected = [str(tmp_path.joinpath("qml", name)) for name in ["Third.qml", "a/First.qml", "b/Second.qml"]]
+        expected.append(str(tmp_path.joinpath("qml", "c d", "Fourth.qml")))
+
+        assert nb_issus == 4
+        assert [issue["location"]["path"] for issue in json.loads(output.read_text())] == expected
+        assert len(fake_qmllint.with_suffix(".log").read_text().splitlines()) == 2
+
+    def test_failure(self, tmp_path: pathlib.Path) -> None:
+        """Check that the conversion fails when qmllint cannot be run.
+
+        :param tmp_path: A temporary directory.
+        :type tmp_path: pathlib.Path
+        """
+        tmp_path.joinpath("Main.qml").touch()
+
+        assert (
+            qmllint_codequality.lint_and_convert(
+                [tmp_path], tmp_path.joinpath("out.json"), executable=str(tmp_path.joinpath("missing"))
+            )
+            < 0
+        )
+        assert runner.qmllint_version(str(tmp_path.joinpath("missing"))) is None
+
+
+class TestLintCache:
+    """Check that only the QML files that changed are linted again."""
+
+    def test_incremental(self, tmp_path: pathlib.Path, fake_qmllint: pathlib.Path) -> None:
+        """Check that the unchanged files are not linted, and that the output stays the same.
+
+        :param tmp_path: A temporary directory.
+        :type tmp_path: pathlib.Path
+        :param fake_qmllint: The fake qmllint executable.
+        :type fake_qmllint: pathlib.Path
+        """
+        qml = tmp_path.joinpath("qml")
+        qml.mkdir()
+        qml.joinpath("Button.qml").write_text("Item {}")
+        qml.joinpath("Main.qml").write_text("Item { Button {} }")
+        qml.joinpath("Other.qml").write_text("Item {}")
+
+        cache = lintcache.LintCache(tmp_path.joinpath("cache"))
+        log = fake_qmllint.with_suffix(".log")
+
+        def lint() -> tuple[list[str], str]:
+            log.unlink(missing_ok=True)
+            output = tmp_path.joinpath("codequality.json")
+            qmllint_codequality.lint_and_convert([qml], output, executable=str(fake_qmllint), cache=cache)
+            linted = (
+                [file for line in log.read_text().splitlines() for file in json.loads(line)] if log.exists() else []
+            )
+            return sorted(pathlib.Path(file).name for file in linted), output.read_text()
+
+        linted, first_output = lint()
+        assert linted == ["Button.qml", "Main.qml", "Other.qml"]
+
+        linted, output = lint()
+        assert not linted
+        assert output == first_output
+
+        qml.joinpath("Other.qml").write_text("Item { width: 1 }")
+        assert lint()[0] == ["Other.qml"]
+
+        # Main.qml uses the Button component
+        qml.joinpath("Button.qml").write_text("Item { height: 1 }")
+        assert lint()[0] == ["Button.qml", "Main.qml"]
+
+    def test_source_root(self, tmp_path: pathlib.Path, fake_qmllint: pathlib.Path) -> None:
+        """Check that the files are linted again when the content fingerprints are computed from another source root.
+
+        :param tmp_path: A temporary directory.
+        :type tmp_path: pathlib.Path
+        :param fake_qmllint: The fake qmllint executable.
+        :type fake_qmllint: pathlib.Path
+        """
+        tmp_path.joinpath("Main.qml").write_text("Item {}")
+        cache = lintcache.LintCache(tmp_path.joinpath("cache"))
+        log = fake_qmllint.with_suffix(".log")
+
+        for source_root, linted in [("first", True), ("first", False), ("second", True)]:
+            log.unlink(missing_ok=True)
+            qmllint_codequality.lint_and_convert(
+                [tmp_path.joinpath("Main.qml")],
+                tmp_path.joinpath("codequality.json"),
+                fingerprint_engine=fingerprint.ContentFingerprint(source_root=tmp_path.joinpath(source_root)),
+                executable=str(fake_qmllint),
+                cache=cache,
+            )
+
+            assert log.exists() == linted
+
+    def test_eviction(self, tmp_path: pathlib.Path) -> None:
+        """Check that the least recently used entries are removed first.
+
+        :param tmp_path: A temporary directory.
+        :type tmp_path: pathlib.Path
+        """
+        cache = lintcache.LintCache(tmp_path, max_size=1)
+
+        for index, key in enumerate(["aa01", "bb02", "cc03"]):
+            cache.store(key, [])
+            os.utime(cache._path(key), (index, index))  # pylint: disable=protected-access
+
+        cache.max_size = 2 * os.path.getsize(cache._path("aa01"))  # pylint: disable=protected-access
+
+        assert cache.evict() == 1
+        assert "aa01" not in cache
+        assert "bb02" in cache and "cc03" in cache
@@ -0,0 +1,94 @@
+"""Module for testing the cost of starting the command line application."""
+
+import json
+import logging
+import subprocess
+import sys
+
+logger = logging.getLogger(f"qmllint_codequality.{__name__}")
+
+IMPORT_BUDGET_MICROSECONDS = 50_000
+"""Maximal time spent importing the modules of this package, excluding the standard library."""
+
+LAZY_MODULES = [
+    "asyncio",
+    "bz2",
+    "cProfile",
+    "concurrent.futures.process",
+    "gzip",
+    "lzma",
+    "multiprocessing",
+    "orjson",
+    "sqlite3",
+    "subprocess",
+    "tempfile",
+    "xml.sax",
+]
+"""Modules only needed by some options, that must not be imported on startup."""
+
+IMPORT_RUNS = 3
+"""Number of imports timed, the fastest one being checked against the budget."""
+
+
+def _run_python(code: str, *options: str) -> subprocess.CompletedProcess:
+    """Run Python code in a new interpreter.
+
+    :param code: The code to run.
+    :type code: str
+    :param options: Options given to the interpreter.
+    :type options: str
+    :return: The completed process.
+    :rtype: subprocess.CompletedProcess
+    """
+    return subprocess.run([sys.executable, *options, "-c", code], capture_output=True, check=True, text=True)
+
+
+class TestStartup:
+    """Check that starting the command line application stays cheap."""
+
+    def test_lazy_imports(self) -> None:
+        """Check that the modules only needed by some options are not imported, and the rules not compiled."""
+        result = _run_python(
+            "import json, sys\n"
+            "import qmllint_codequality.__main__\n"
+            "from qmllint_codequality import qmllint\n"
+            "print(json.dumps({\n"
+            "    'modules': sorted(sys.modules),\n"
+            "    'dispatcher': qmllint._dispatcher.cache_info().currsize,\n"
+            "    'patterns': [rule.name for rule in qmllint.Rules if 'patterns' in vars(rule)],\n"
+            "}))"
+        )
+        startup = json.loads(result.stdout)
+
+        assert not set(LAZY_MODULES) & set(startup["modules"])
+        assert startup["dispatcher"] == 0
+        assert not startup["patterns"]
+
+    def test_import_budget(self) -> None:
+        """Check that the modules of this package are imported within the budget.
+
+        The bytecode is compiled first, so the time spent compiling stale modules, as with ``PYTHONDONTWRITEBYTECODE``,
+        is not counted, and the fastest of several imports is kept, to not fail on a busy machine.
+        """
+        _run_python(
+            "import compileall, os, qmllint_codequality\n"
+            "compileall.compile_dir(os.path.dirname(qmllint_codequality.__file__), quiet=1)"
+        )
+        timings = []
+
+        for _ in range(IMPORT_RUNS):
+            result = _run_python("import qmllint_codequality.__main__", "-X", "importtime")
+
+            # Lines of the form "import time: <self us> | <cumulative us> | <module>"
+            timings.append(
+                sum(
+                    int(line.split(":", 1)[1].split("|")[0])
+                    for line in result.stderr.splitlines()
+                    if line.startswith("import time:") and line.split("|")[-1].strip().startswith("qmllint_codequality")
+                )
+            )
+
+        spent = min(timings)
+        logger.info("Modules of the package imported in %d us", spent)
+
+        assert 0 < spent < IMPORT_BUDGET_MICROSECONDS
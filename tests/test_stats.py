@@ -0,0 +1,57 @@
+"""Module for testing the statistics of a conversion."""
+
+import json
+import logging
+import pathlib
+import pytest
+
+import qmllint_codequality
+from qmllint_codequality import stats
+from tests.conftest import write_report
+
+logger = logging.getLogger(f"qmllint_codequality.{__name__}")
+
+
+class TestStatistics:
+    """Check the statistics collected during a conversion."""
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_convert_file(self, tmp_path: pathlib.Path, jobs: int) -> None:
+        """Check that every stage is reported, and that the issues are counted.
+
+        :param tmp_path: A temporary directory.
+        :type tmp_path: pathlib.Path
+        :param jobs: The number of processes converting the report.
+        :type jobs: int
+        """
+        report = tmp_path.joinpath("qmllint.json")
+        write_report(report, "A.qml", ["Unqualified access", "Unqualified access", "Unknown"])
+        statistics = stats.Statistics()
+
+        nb_issues = qmllint_codequality.convert_file(
+            report, tmp_path.joinpath("codequality.json"), jobs=jobs, statistics=statistics
+        )
+        result = statistics.to_dict()
+
+        assert nb_issues == result["issues"] == 3
+        assert list(result["stages"]) == stats.STAGES
+        assert all(stage["wall_seconds"] >= 0 for stage in result["stages"].values())
+        assert sorted(result["by_rule"].values()) == [1, 2]
+        assert result["by_file"] == {"A.qml": 3}
+        assert sum(result["by_severity"].values()) == 3
+
+        if jobs == 1:
+            assert result["stages"]["fingerprinting"]["wall_seconds"] > 0
+
+    def test_write(self, tmp_path: pathlib.Path) -> None:
+        """Check that the statistics are written in JSON.
+
+        :param tmp_path: A temporary directory.
+        :type tmp_path: pathlib.Path
+        """
+        statistics = stats.Statistics()
+        list(statistics.observe([]))
+
+        statistics.write(output := tmp_path.joinpath("stats.json"))
+
+        assert json.loads(output.read_text(encoding="utf8"))["issues"] == 0
@@ -0,0 +1,173 @@
+"""Module for testing the incremental reading of a qmllint report."""
+
+import io
+import json
+import logging
+import pathlib
+import pytest
+
+from qmllint_codequality import jsoncodec, qmllint, stream
+
+logger = logging.getLogger(f"qmllint_codequality.{__name__}")
+
+REPORT: qmllint.Report = {
+    "files": [
+        {
+            "filename": "/path/to/Main.qml",
+            "success": False,
+            "warnings": [
+                {"column": 5, "length": 3, "line": 12, "message": "Unqualified access", "type": "warning"},
+                {
+                    "charOffset": 42,
+                    "column": 1,
+                    "length": 20,
+                    "line": 2,
+                    "message": 'Property "a\\"b" not found on type "[{}]" ✓',
+                    "suggestions": [{"message": "nested", "replacement": "]}"}],
+                    "type": "info",
+                },
+            ],
+        },
+        {"filename": "/path/to/Empty.qml", "success": True, "warnings": []},
+        {
+            "warnings": [{"message": "Unused import at /path/to/Late.qml:1:1", "type": "info"}],
+            "success": False,
+            "filename": "/path/to/Late.qml",
+        },
+    ],
+    "revision": 3,
+}
+"""A report covering the particularities handled by the scanner."""
+
+
+def _expected_warnings(report: qmllint.Report) -> list[tuple[str, qmllint.WarningDetails]]:
+    """Flatten a loaded report into the list of its warnings.
+
+    :param report: The qmllint report.
+    :type report: qmllint.Report
+    :return: The file name and the warning, for each warning.
+    :rtype: list[tuple[str, qmllint.WarningDetails]]
+    """
+    return [(file["filename"], warning) for file in report["files"] for warning in file["warnings"]]
+
+
+class TestIterWarnings:
+    """Check that the incremental reader produces the same warnings as a full load of the report."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 7, stream.DEFAULT_CHUNK_SIZE])
+    @pytest.mark.parametrize("indent", [None, 4])
+    def test_same_as_load(self, chunk_size: int, indent: int | None) -> None:
+        """Check that the warnings are the same, whatever the size of the chunks and the layout of the report.
+
+        :param chunk_size: The number of bytes read at once.
+        :type chunk_size: int
+        :param indent: The indentation of the report.
+        :type indent: int | None
+        """
+        content = json.dumps(REPORT, indent=indent, ensure_ascii=False).encode("utf8")
+
+        assert list(stream.iter_warnings(io.BytesIO(content), chunk_size)) == _expected_warnings(REPORT)
+
+    @pytest.mark.parametrize("chunk_size", [3, stream.DEFAULT_CHUNK_SIZE])
+    def test_deeply_nested(self, chunk_size: int) -> None:
+        """Check that the values nested deeper than the regex matching whole containers are skipped, and decoded.
+
+        :param chunk_size: The number of bytes read at once.
+        :type chunk_size: int
+        """
+        nested: list = ["]}"]
+
+        for _ in range(stream.CONTAINER_FAST_DEPTH + 2):
+            nested = [{"a": nested}, "{["]
+
+        report = {"meta": nested, "files": [{"filename": "A.qml", "warnings": [{"message": "x", "extra": nested}]}]}
+        content = json.dumps(report).encode("utf8")
+
+        assert list(stream.iter_warnings(io.BytesIO(content), chunk_size)) == _expected_warnings(report)
+
+    def test_empty_report(self) -> None:
+        """Check that an empty report does not contain any warning."""
+        assert not list(stream.iter_warnings(io.BytesIO(b" { } ")))
+
+    @pytest.mark.parametrize("content", [b"", b'{"files": [', b'{"files": []} []', b'{"files": [{"filename" "a"}]}'])
+    def test_malformed_report(self, content: bytes) -> None:
+        """Check that a malformed report is rejected.
+
+        :param content: The content of the report.
+        :type content: bytes
+        """
+        with pytest.raises(json.JSONDecodeError):
+            list(stream.iter_warnings(io.BytesIO(content), 3))
+
+
+class TestIterMappedWarnings:
+    """Check that the memory-mapped reader produces the same warnings as the incremental one."""
+
+    @pytest.mark.parametrize("indent", [None, 4])
+    def test_same_as_load(self, tmp_path: pathlib.Path, indent: int | None) -> None:
+        """Check that the warnings are the same, whatever the layout of the report.
+
+        :param tmp_path: A temporary directory.
+        :type tmp_path: pathlib.Path
+        :param indent: The indentation of the report.
+        :type indent: int | None
+        """
+        report = tmp_path.joinpath("qmllint.json")
+        report.write_text(json.dumps(REPORT, indent=indent, ensure_ascii=False), encoding="utf8")
+
+        with report.open("rb") as file:
+            assert list(stream.iter_mapped_warnings(file)) == _expected_warnings(REPORT)
+
+    @pytest.mark.parametrize("content", [b"", b'{"files": [', b'{"files": []} []'])
+    def test_malformed_report(self, tmp_path: pathlib.Path, content: bytes) -> None:
+        """Check that a malformed report, or an empty file, is rejected.
+
+        :param tmp_path: A temporary directory.
+        :type tmp_path: pathlib.Path
+        :param content: The content of the report.
+        :type content: bytes
+        """
+        report = tmp_path.joinpath("qmllint.json")
+        report.write_bytes(content)
+
+        with report.open("rb") as file, pytest.raises(json.JSONDecodeError):
+            list(stream.iter_mapped_warnings(file))
+
+
+class TestWriteArray:
+    """Check that the incremental writer produces the same JSON as a full dump of the array."""
+
+    @pytest.mark.parametrize("items", [[], [{"a": 1}], [{"a": [1, {"b": "x\ny"}]}, "é", 3]])
+    @pytest.mark.parametrize("indent", [None, 4])
+    def test_same_as_dump(self, items: list, indent: int | None) -> None:
+        """Check that the output is the same as ``json.dump``, and that the items are counted.
+
+        :param items: The items to write.
+        :type items: list
+        :param indent: The indentation of the array.
+        :type indent: int | None
+        """
+        output = io.BytesIO()
+
+        assert stream.write_array(iter(items), output, indent, jsoncodec.StdlibCodec()) == len(items)
+        assert output.getvalue() == json.dumps(items, ensure_ascii=False, indent=indent).encode("utf8")
+
+    @pytest.mark.parametrize("codec_name", list(jsoncodec.CODECS))
+    @pytest.mark.parametrize("indent", [None, 2, 4])
+    def test_same_values(self, codec_name: str, indent: int | None) -> None:
+        """Check that every codec writes an array holding the same values.
+
+        :param codec_name: The name of the codec.
+        :type codec_name: str
+        :param indent: The indentation of the array.
+        :type indent: int | None
+        """
+        if codec_name == "orjson":
+            pytest.importorskip("orjson")
+
+        items = [{"a": [1, {"b": "x\ny"}]}, "é", 3, []]
+        output = io.BytesIO()
+
+        stream.write_array(items, output, indent, jsoncodec.create_codec(codec_name))
+
+        assert json.loads(output.getvalue()) == items
@@ -0,0 +1,104 @@
+"""Module for testing the update of the Code Quality report when the watched files change."""
+
+import json
+import logging
+import pathlib
+
+from qmllint_codequality import watch
+from tests.conftest import write_report
+
+logger = logging.getLogger(f"qmllint_codequality.{__name__}")
+
+
+class TestReportWatcher:
+    """Check that only the QML files whose warnings changed are converted again."""
+
+    def test_update(self, tmp_path: pathlib.Path) -> None:
+        """Check that the output is updated when the report changes, keeping the issues of the unchanged files.
+
+        :param tmp_path: A temporary directory.
+        :type tmp_path: pathlib.Path
+        """
+        report = tmp_path.joinpath("qmllint.json")
+        output = tmp_path.joinpath("codequality.json")
+        write_report(report, "A.qml", ["Unqualified access"])
+        watcher = watch.ReportWatcher(report, output)
+
+        watcher.run(iterations=1)
+        issues = watcher.issues["A.qml"]
+
+        assert not watcher.poll()
+        assert len(json.loads(output.read_bytes())) == 1
+
+        write_report(report, "A.qml", ["Unqualified access", "Unknown message"])
+
+        assert watcher.poll()
+        assert watcher.issues["A.qml"] is not issues
+        assert watcher.write() == 2
+
+
+class TestLintWatcher:
+    """Check that only the QML files affected by a change are linted again."""
+
+    def test_update(self, tmp_path: pathlib.Path, fake_qmllint: pathlib.Path) -> None:
+        """Check that the changed files, and the files using a changed component, are linted again.
+
+        :param tmp_path: A temporary directory.
+        :type tmp_path: pathlib.Path
+        :param fake_qmllint: The fake qmllint executable.
+        :type fake_qmllint: pathlib.Path
+        """
+        qml = tmp_path.joinpath("qml")
+        qml.mkdir()
+        qml.joinpath("Button.qml").write_text("Item {}")
+        qml.joinpath("Main.qml").write_text("Item { Button {} }")
+        qml.joinpath("Other.qml").write_text("Item {}")
+        output = tmp_path.joinpath("codequality.json")
+        log = fake_qmllint.with_suffix(".log")
+
+        watcher = watch.LintWatcher([qml], output, executable=str(fake_qmllint))
+        watcher.run(iterations=2, interval=0)
+
+        assert len(json.loads(output.read_bytes())) == 3
+        assert len(log.read_text().splitlines()) == 1
+
+        qml.joinpath("Button.qml").write_text("Item { id: button }")
+        qml.joinpath("New.qml").write_text("Item {}")
+
+        assert watcher.poll()
+        assert sorted(pathlib.Path(path).name for path in json.loads(log.read_text().splitlines()[-1])) == [
+            "Button.qml",
+            "Main.qml",
+            "New.qml",
+        ]
+
+        qml.joinpath("Other.qml").unlink()
+
+        assert watcher.poll()
+        assert watcher.write() == 3
+        assert len(log.read_text().splitlines()) == 2
+
+    def test_lint_failure(self, tmp_path: pathlib.Path, fake_qmllint: pathlib.Path) -> None:
+        """Check that the files changed while qmllint fails are linted again once it succeeds.
+
+        :param tmp_path: A temporary directory.
+        :type tmp_path: pathlib.Path
+        :param fake_qmllint: The fake qmllint executable.
+        :type fake_qmllint: pathlib.Path
+        """
+        qml = tmp_path.joinpath("qml")
+        qml.mkdir()
+        qml.joinpath("Main.qml").write_text("Item {}")
+        qml.joinpath("Other.qml").write_text("Item {}")
+        log = fake_qmllint.with_suffix(".log")
+
+        watcher = watch.LintWatcher([qml], tmp_path.joinpath("codequality.json"), executable=str(fake_qmllint))
+        assert watcher.poll()
+
+        qml.joinpath("Other.qml").write_text("Item { id: other }")
+        watcher.executable = str(tmp_path.joinpath("missing"))
+        assert not watcher.poll()
+
+        watcher.executable = str(fake_qmllint)
+        assert watcher.poll()
+        assert [pathlib.Path(path).name for path in json.loads(log.read_text().splitlines()[-1])] == ["Other.qml"]